@@ -1,21 +1,44 @@
+from quart_di.cache import Cached
+from quart_di.cache import SingleFlight
+from quart_di.dataloader import BatchLoader
+from quart_di.dataloader import DataLoader
+from quart_di.encoding import CBOR
+from quart_di.encoding import MSGPACK
 from quart_di.extension import inject
 from quart_di.extension import QuartDI
+from quart_di.extractors import BinaryBody
+from quart_di.extractors import BinaryParam
 from quart_di.extractors import CookieParam
+from quart_di.extractors import FileParam
+from quart_di.extractors import FormParam
 from quart_di.extractors import HeaderParam
 from quart_di.extractors import JsonBody
 from quart_di.extractors import JsonParam
 from quart_di.extractors import PathParam
 from quart_di.extractors import QueryParam
 from quart_di.extractors import RequestBody
+from quart_di.greenlets import await_
+from quart_di.lazy import LazyDependency
 from quart_di.markers import Body
+from quart_di.markers import Cbor
+from quart_di.markers import File
+from quart_di.markers import FromCbor
 from quart_di.markers import FromCookie
+from quart_di.markers import FromForm
 from quart_di.markers import FromHeader
 from quart_di.markers import FromJson
+from quart_di.markers import FromMsgPack
 from quart_di.markers import FromPath
 from quart_di.markers import FromQuery
 from quart_di.markers import Json
+from quart_di.markers import Lazy
+from quart_di.markers import MsgPack
+from quart_di.markers import Pooled
 from quart_di.markers import T
+from quart_di.pool import Pool
 from quart_di.security import AlternativeSecuritySchemes
 from quart_di.security import APIKeyHeader
 from quart_di.security import OAuth2AuthorizationCodeBearer
 from quart_di.security import RequiredSecuritySchemes
+from quart_di.websocket import Message
+from quart_di.websocket import Messages
@@ -0,0 +1,213 @@
+import asyncio
+import inspect
+import logging
+import time
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+
+from di.dependant import Marker
+from di.typing import get_parameters
+from quart import current_app
+from quart import has_app_context
+
+from quart_di.datastructures import LRUCache
+from quart_di.util import make_cache_key
+from quart_di.util import maybe_await
+from quart_di.util import wrap_provider
+
+
+__all__ = ("Cached", "CacheEntry", "SingleFlight", "SingleFlightGroup")
+
+logger = logging.getLogger(__name__)
+
+
+class CacheEntry(NamedTuple):
+    value: Any
+    created_at: float
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task):
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlightGroup:
+    """Run at most one call per key at a time, concurrent callers await the in-flight result.
+
+    The call runs in its own task so that cancelling one caller doesn't cancel it for the others,
+    it's only cancelled once every caller waiting on it has been.  Exceptions and cancellation
+    of the call itself propagate to every caller.
+    """
+
+    def __init__(self):
+        self._flights: Dict[Hashable, _Flight] = {}
+
+    def __len__(self) -> int:
+        return len(self._flights)
+
+    async def do(self, key: Hashable, call: Callable[[], Awaitable[Any]]) -> Any:
+        flight = self._flights.get(key)
+        if flight is None:
+            flight = _Flight(asyncio.get_running_loop().create_task(call()))
+            self._flights[key] = flight
+
+            def landed(task: asyncio.Task) -> None:
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+            flight.task.add_done_callback(landed)
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                # land it now so callers arriving before the task is done start a new flight
+                if self._flights.get(key) is flight:
+                    del self._flights[key]
+
+
+class SingleFlight(Marker):
+    """Coalesce concurrent executions of a provider across requests.
+
+    Calls with the same resolved inputs that overlap in time share one execution on this worker.
+
+    ```python
+    CatalogPage = Annotated[Page, SingleFlight(fetch_catalog_page)]
+    ```
+    """
+
+    def __init__(
+        self,
+        call: Callable[..., Any],
+        *,
+        key: Callable[[Mapping[str, Any]], Hashable] = make_cache_key,
+        scope: str = "request",
+    ):
+        if inspect.isasyncgenfunction(call) or inspect.isgeneratorfunction(call):
+            raise TypeError(f"{call!r} has teardown and can't be shared across requests")
+
+        self.provider = call
+        self.key = key
+        self.flights = SingleFlightGroup()
+        signature = inspect.Signature(list(get_parameters(call).values()))
+
+        async def get_shared(*args: Any, **kwargs: Any) -> Any:
+            arguments = signature.bind(*args, **kwargs)
+            return await self.flights.do(
+                self.key(arguments.arguments),
+                lambda: maybe_await(self.provider(*args, **kwargs)),
+            )
+
+        super().__init__(call=wrap_provider(call, get_shared), scope=scope, use_cache=True)
+
+
+class Cached(Marker):
+    """Cache a provider's result across requests.
+
+    Results are keyed by the provider's resolved inputs, kept for `ttl` seconds and evicted least
+    recently used first once `maxsize` keys are cached.  With `stale_while_revalidate` set, an
+    expired result is still served for that many extra seconds while it's refreshed in the
+    background, refreshes still running when the app stops serving are cancelled.  With
+    `single_flight` set, concurrent misses for a key share one execution.
+
+    ```python
+    FeatureFlags = Annotated[Flags, Cached(load_flags, ttl=30, stale_while_revalidate=300)]
+    ```
+    """
+
+    ttl: float
+    stale_while_revalidate: Optional[float]
+    cache: LRUCache
+
+    def __init__(
+        self,
+        call: Callable[..., Any],
+        *,
+        ttl: float,
+        maxsize: int = 128,
+        stale_while_revalidate: Optional[float] = None,
+        single_flight: bool = False,
+        key: Callable[[Mapping[str, Any]], Hashable] = make_cache_key,
+        scope: str = "request",
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if inspect.isasyncgenfunction(call) or inspect.isgeneratorfunction(call):
+            raise TypeError(f"{call!r} has teardown and can't be cached across requests")
+
+        self.provider = call
+        self.ttl = ttl
+        self.stale_while_revalidate = stale_while_revalidate
+        self.key = key
+        self.timer = timer
+        self.cache = LRUCache(maxsize)
+        self._signature = inspect.Signature(list(get_parameters(call).values()))
+        self._revalidating: Dict[Hashable, asyncio.Task] = {}
+        self._flights = SingleFlightGroup() if single_flight else None
+
+        async def get_cached(*args: Any, **kwargs: Any) -> Any:
+            return await self._get(*args, **kwargs)
+
+        super().__init__(call=wrap_provider(call, get_cached), scope=scope, use_cache=True)
+
+    async def _get(self, *args: Any, **kwargs: Any) -> Any:
+        arguments = self._signature.bind(*args, **kwargs)
+        key = self.key(arguments.arguments)
+        entry = self.cache.get(key)
+
+        if entry is not None:
+            age = self.timer() - entry.created_at
+            if age < self.ttl:
+                return entry.value
+            if self.stale_while_revalidate is not None and age < (
+                self.ttl + self.stale_while_revalidate
+            ):
+                self._revalidate(key, arguments)
+                return entry.value
+
+        return await self._refresh(key, arguments)
+
+    async def _refresh(self, key: Hashable, arguments: inspect.BoundArguments) -> Any:
+        if self._flights is not None:
+            return await self._flights.do(key, lambda: self._call(key, arguments))
+        return await self._call(key, arguments)
+
+    async def _call(self, key: Hashable, arguments: inspect.BoundArguments) -> Any:
+        value = await maybe_await(self.provider(*arguments.args, **arguments.kwargs))
+        self.cache.set(key, CacheEntry(value, self.timer()))
+        return value
+
+    def _revalidate(self, key: Hashable, arguments: inspect.BoundArguments) -> None:
+        if key in self._revalidating:
+            return
+
+        task = asyncio.get_running_loop().create_task(self._refresh(key, arguments))
+        self._revalidating[key] = task
+        if has_app_context():
+            from quart_di.extension import QuartDI
+
+            extension = current_app.extensions.get(QuartDI.EXTENSION_KEY)
+            if extension is not None:
+                extension.add_background_task(task)
+
+        def revalidated(task: asyncio.Task) -> None:
+            self._revalidating.pop(key, None)
+            if not task.cancelled() and task.exception() is not None:
+                logger.error(
+                    "! Exception caught while revalidating cached dependency, serving stale value",
+                    exc_info=task.exception(),
+                    extra=dict(provider=self.provider),
+                )
+
+        task.add_done_callback(revalidated)
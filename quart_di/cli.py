@@ -0,0 +1,41 @@
+import click
+from quart.cli import AppGroup
+from quart.cli import pass_script_info
+from quart.cli import ScriptInfo
+
+from quart_di.graph import build_graphs
+from quart_di.graph import FORMATTERS
+
+
+__all__ = ("di_cli",)
+
+di_cli = AppGroup("di", help="Inspect the dependency injection graph.")
+
+
+@di_cli.command("graph")
+@click.option(
+    "--format", "format_", type=click.Choice(sorted(FORMATTERS)), default="text", show_default=True
+)
+@click.option("--endpoint", default=None, help="Only show this endpoint's graph.")
+@click.option(
+    "--timings",
+    "timings_path",
+    type=click.Path(exists=True, dir_okay=False),
+    default=None,
+    help="Annotate with timings dumped by `DependencyTimings.dump()`.",
+)
+@click.option("--output", "-o", type=click.File("w"), default="-", help="Write to a file.")
+@pass_script_info
+def graph_command(info: ScriptInfo, format_, endpoint, timings_path, output):
+    """Show the dependency graph of each injected route with its measured costs."""
+    from quart_di.extension import QuartDI
+
+    app = info.load_app()
+    extension = app.extensions[QuartDI.EXTENSION_KEY]
+
+    if timings_path is not None:
+        # samples recorded by this process, if any, take precedence
+        extension.timings.load(timings_path)
+
+    graphs = build_graphs(app, extension.container, extension.timings, endpoint)
+    click.echo(FORMATTERS[format_](graphs), file=output)
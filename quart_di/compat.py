@@ -1,4 +1,5 @@
 import inspect
+import sys
 import typing
 
 try:
@@ -27,8 +28,34 @@ try:
 except ImportError:
     from typing_extensions import Protocol
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+try:
+    import cbor2
+except ImportError:
+    cbor2 = None
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import sqlalchemy
+except ImportError:
+    sqlalchemy = None
+
 from di.typing import Annotated
 
+# 3.9+ keeps `Annotated` metadata with include_extras
+if sys.version_info >= (3, 9):
+    from typing import get_type_hints
+else:
+    from typing_extensions import get_type_hints
+
 
 # Python 3.10+ has PEP 612
 if hasattr(typing, "ParamSpecArgs"):
@@ -108,6 +135,10 @@ __all__ = (
     "get_type",
     "get_args",
     "Protocol",
+    "msgpack",
+    "cbor2",
+    "brotli",
+    "sqlalchemy",
 )
 
 
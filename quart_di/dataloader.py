@@ -0,0 +1,174 @@
+import asyncio
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import Mapping
+from typing import Optional
+from typing import Set
+from typing import Tuple
+
+from di.dependant import Marker
+from di.typing import get_parameters
+
+
+__all__ = ("BatchLoader", "DataLoader")
+
+
+class DataLoader:
+    """Coalesce `load(key)` calls made in the same event loop tick into one `batch_load(keys)`.
+
+    `batch_load` returns values in the same order as `keys` (or a mapping of key to value), and
+    may return an exception instance in place of a value to fail just that key.  Results are
+    memoized per key for the lifetime of the loader, which is one request when injected with
+    `BatchLoader`.
+    """
+
+    def __init__(
+        self,
+        batch_load: Callable[[List[Hashable]], Any],
+        *,
+        max_batch_size: Optional[int] = None,
+        cache: bool = True,
+    ):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+
+        self._futures: Dict[Hashable, asyncio.Future] = {}
+        self._queue: List[Tuple[Hashable, asyncio.Future]] = []
+        self._tasks: Set[asyncio.Task] = set()
+        self._dispatch_scheduled = False
+
+    def __repr__(self):
+        return f"{type(self).__name__}(batch_load={self.batch_load!r})"
+
+    def load(self, key: Hashable) -> "asyncio.Future[Any]":
+        if self.cache and key in self._futures:
+            return self._futures[key]
+
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        if self.cache:
+            self._futures[key] = future
+        self._queue.append((key, future))
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+        return future
+
+    async def load_many(self, keys: Iterable[Hashable]) -> List[Any]:
+        return list(await asyncio.gather(*(self.load(key) for key in keys)))
+
+    def prime(self, key: Hashable, value: Any) -> None:
+        if key not in self._futures:
+            future = asyncio.get_running_loop().create_future()
+            future.set_result(value)
+            self._futures[key] = future
+
+    def clear(self, key: Optional[Hashable] = None) -> None:
+        if key is None:
+            self._futures.clear()
+        else:
+            self._futures.pop(key, None)
+
+    def close(self) -> None:
+        for task in self._tasks:
+            task.cancel()
+        for _, future in self._queue:
+            future.cancel()
+        self._queue.clear()
+        self.clear()
+
+    def _dispatch(self) -> None:
+        self._dispatch_scheduled = False
+        queue, self._queue = self._queue, []
+        batch_size = self.max_batch_size or len(queue)
+
+        loop = asyncio.get_running_loop()
+        for start in range(0, len(queue), batch_size):
+            task = loop.create_task(self._load_batch(queue[start : start + batch_size]))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _load_batch(self, batch: List[Tuple[Hashable, asyncio.Future]]) -> None:
+        keys = [key for key, _ in batch]
+        try:
+            values = self.batch_load(keys)
+            if inspect.isawaitable(values):
+                values = await values
+            if isinstance(values, Mapping):
+                values = [values.get(key) for key in keys]
+            else:
+                values = list(values)
+            if len(values) != len(keys):
+                raise ValueError(
+                    f"{self.batch_load!r} returned {len(values)} values for {len(keys)} keys"
+                )
+        except Exception as err:
+            for key, future in batch:
+                self._reject(key, future, err)
+            return
+
+        for (key, future), value in zip(batch, values):
+            if isinstance(value, Exception):
+                self._reject(key, future, value)
+            elif not future.done():
+                future.set_result(value)
+
+    def _reject(self, key: Hashable, future: asyncio.Future, err: Exception) -> None:
+        # failures aren't memoized so a later load can retry
+        if self._futures.get(key) is future:
+            del self._futures[key]
+        if not future.done():
+            future.set_exception(err)
+
+
+class BatchLoader(Marker):
+    """Inject a request scoped `DataLoader` for `batch_load`.
+
+    The first parameter of `batch_load` receives the keys, any others are injected like a
+    regular dependency.
+
+    ```python
+    async def load_users(ids: List[int], db: Database) -> List[User]:
+        ...
+
+    UserLoader = Annotated[DataLoader, BatchLoader(load_users)]
+    ```
+    """
+
+    def __init__(self, batch_load: Callable[..., Any], *, max_batch_size=None, cache=True):
+        self.batch_load = batch_load
+        self.max_batch_size = max_batch_size
+        self.cache = cache
+
+        params = list(get_parameters(batch_load).values())[1:]
+        signature = inspect.Signature(params)
+
+        def get_data_loader(*args, **kwargs):
+            arguments = signature.bind(*args, **kwargs).arguments
+
+            def batch_load_with_deps(keys):
+                return self.batch_load(keys, **arguments)
+
+            loader = DataLoader(
+                batch_load_with_deps,
+                max_batch_size=self.max_batch_size,
+                cache=self.cache,
+            )
+            try:
+                yield loader
+            finally:
+                loader.close()
+
+        get_data_loader.__signature__ = signature
+        get_data_loader.__annotations__ = {
+            param.name: param.annotation for param in params if param.annotation is not param.empty
+        }
+
+        super().__init__(call=get_data_loader, scope="request", use_cache=True)
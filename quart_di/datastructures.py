@@ -1,12 +1,15 @@
 import threading
+from collections import OrderedDict
 from typing import Any
+from typing import Hashable
 from typing import Iterator
+from typing import Optional
 from typing import Tuple
 
 from werkzeug.local import LocalProxy
 
 
-__all__ = ("ThreadLocal", "ThreadLocalStack")
+__all__ = ("LRUCache", "ThreadLocal", "ThreadLocalStack")
 
 
 class ThreadLocal:
@@ -60,6 +63,14 @@ class ThreadLocalStack:
 
         return LocalProxy(_lookup)
 
+    def __len__(self) -> int:
+        """The depth of this thread's stack."""
+        return len(getattr(self._local, "stack", ()))
+
+    def __iter__(self) -> Iterator[Any]:
+        """This thread's items, from the bottom of the stack to its top."""
+        return iter(list(getattr(self._local, "stack", ())))
+
     def push(self, obj: Any) -> None:
         """Pushes a new item to the stack."""
         self._local.stack.append(obj)
@@ -83,3 +94,38 @@ class ThreadLocalStack:
             return self._local.stack[-1]
         except (AttributeError, IndexError):
             return None
+
+
+class LRUCache:
+    """A mapping bounded to `maxsize` items that evicts the least recently used item."""
+
+    def __init__(self, maxsize: int = 128):
+        if maxsize < 1:
+            raise ValueError("maxsize must be at least 1")
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def get(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def set(self, key: Hashable, value: Any) -> None:
+        self._data[key] = value
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def pop(self, key: Hashable, default: Optional[Any] = None) -> Any:
+        return self._data.pop(key, default)
+
+    def clear(self) -> None:
+        self._data.clear()
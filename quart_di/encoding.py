@@ -0,0 +1,181 @@
+import zlib
+from typing import Any
+from typing import Callable
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+
+from werkzeug.datastructures import MIMEAccept
+
+from quart_di.compat import brotli
+from quart_di.compat import cbor2
+from quart_di.compat import msgpack
+
+
+__all__ = (
+    "BinaryCodec",
+    "CBOR",
+    "Decompressor",
+    "MSGPACK",
+    "get_decompressor",
+    "negotiate_codec",
+)
+
+JSON_MIMETYPE = "application/json"
+DECOMPRESS_CHUNK_SIZE = 64 * 1024
+
+
+class BinaryCodec(NamedTuple):
+    mimetype: str
+    loads: Callable[[bytes], Any]
+    dumps: Callable[[Any], bytes]
+
+
+def _require(module: Any, name: str) -> Any:
+    if module is None:
+        raise ImportError(f"{name} is not installed, install it with `pip install quart-di[{name}]`")
+    return module
+
+
+def msgpack_loads(data: bytes) -> Any:
+    return _require(msgpack, "msgpack").unpackb(data, raw=False)
+
+
+def msgpack_dumps(obj: Any) -> bytes:
+    return _require(msgpack, "msgpack").packb(obj, use_bin_type=True)
+
+
+def cbor_loads(data: bytes) -> Any:
+    return _require(cbor2, "cbor2").loads(data)
+
+
+def cbor_dumps(obj: Any) -> bytes:
+    return _require(cbor2, "cbor2").dumps(obj)
+
+
+MSGPACK = BinaryCodec("application/msgpack", msgpack_loads, msgpack_dumps)
+CBOR = BinaryCodec("application/cbor", cbor_loads, cbor_dumps)
+
+
+def negotiate_codec(
+    accept_mimetypes: MIMEAccept, codecs: Sequence[BinaryCodec]
+) -> Optional[BinaryCodec]:
+    """Pick the binary codec the client prefers, or None when JSON is as good or better."""
+    best_match = accept_mimetypes.best_match([JSON_MIMETYPE, *(codec.mimetype for codec in codecs)])
+    return next((codec for codec in codecs if codec.mimetype == best_match), None)
+
+
+class Decompressor:
+    """Incrementally decode a body sent with one or more `Content-Encoding`s.
+
+    Output is produced in chunks of at most `chunk_size` bytes so the caller can stop as soon as
+    the decoded size is over its limit, instead of inflating a zip bomb in one go.
+    """
+
+    def __init__(self, encodings: List[str], chunk_size: int = DECOMPRESS_CHUNK_SIZE):
+        self.encodings = encodings
+        self.chunk_size = chunk_size
+        # encodings are listed in the order they were applied, undo them in reverse
+        self._decoders = [_create_decoder(encoding) for encoding in reversed(encodings)]
+
+    def __repr__(self):
+        return f"{type(self).__name__}(encodings={self.encodings!r})"
+
+    def decompress(self, data: bytes) -> Iterator[bytes]:
+        return self._decompress(data, 0)
+
+    def flush(self) -> Iterator[bytes]:
+        return self._flush(0)
+
+    def _decompress(self, data: bytes, index: int) -> Iterator[bytes]:
+        if index == len(self._decoders):
+            if data:
+                yield data
+            return
+
+        decoder = self._decoders[index]
+        while data or decoder.has_output:
+            chunk, data = decoder.decompress(data, self.chunk_size)
+            yield from self._decompress(chunk, index + 1)
+
+    def _flush(self, index: int) -> Iterator[bytes]:
+        if index == len(self._decoders):
+            return
+
+        yield from self._decompress(self._decoders[index].flush(), index + 1)
+        yield from self._flush(index + 1)
+
+
+class _ZlibDecoder:
+    # input that would produce more than `max_length` is kept in the unconsumed tail instead
+    has_output = False
+
+    def __init__(self, wbits: int):
+        self._obj = zlib.decompressobj(wbits)
+
+    def decompress(self, data: bytes, max_length: int):
+        try:
+            chunk = self._obj.decompress(data, max_length)
+        except zlib.error as err:
+            raise ValueError(str(err)) from None
+        return chunk, self._obj.unconsumed_tail
+
+    def flush(self) -> bytes:
+        if not self._obj.eof:
+            raise ValueError("compressed body is truncated")
+        return self._obj.flush()
+
+
+class _BrotliDecoder:
+    def __init__(self):
+        self._obj = _require(brotli, "brotli").Decompressor()
+        # output held back by `max_length` may be pending as long as output is produced
+        self.has_output = False
+
+    def decompress(self, data: bytes, max_length: int):
+        try:
+            if data and self._obj.can_accept_more_data():
+                chunk, data = self._obj.process(data, output_buffer_limit=max_length), b""
+            else:
+                chunk = self._obj.process(b"", output_buffer_limit=max_length)
+        except brotli.error as err:
+            raise ValueError(str(err)) from None
+        self.has_output = bool(chunk) and not self._obj.is_finished()
+        return chunk, data
+
+    def flush(self) -> bytes:
+        if not self._obj.is_finished():
+            raise ValueError("compressed body is truncated")
+        return b""
+
+
+_decoder_factories = {
+    "gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    "x-gzip": lambda: _ZlibDecoder(16 + zlib.MAX_WBITS),
+    "deflate": lambda: _ZlibDecoder(zlib.MAX_WBITS),
+    "br": _BrotliDecoder,
+}
+
+
+def _create_decoder(encoding: str):
+    try:
+        return _decoder_factories[encoding]()
+    except KeyError:
+        raise LookupError(f"Unsupported content encoding {encoding!r}") from None
+
+
+def get_decompressor(content_encoding: Optional[str]) -> Optional[Decompressor]:
+    """Get a decompressor for a `Content-Encoding` header, or None when the body isn't encoded.
+
+    Raises `LookupError` for encodings that aren't supported.
+    """
+    encodings = [
+        encoding.strip().lower()
+        for encoding in (content_encoding or "").split(",")
+        if encoding.strip() and encoding.strip().lower() != "identity"
+    ]
+    if not encodings:
+        return None
+    return Decompressor(encodings)
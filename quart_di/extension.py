@@ -1,12 +1,18 @@
+import asyncio
 import inspect
 import logging
+import tracemalloc
 from functools import partial
 from functools import wraps
+from types import SimpleNamespace
 from typing import Any
 from typing import Callable
 from typing import Dict
+from typing import Hashable
+from typing import List
 from typing import Optional
 from typing import Sequence
+from typing import Set
 from typing import Tuple
 from typing import Type
 from typing import Union
@@ -18,52 +24,181 @@ from di.container import ContainerState
 from di.dependant import Dependant
 from di.executors import AsyncExecutor
 from quart import current_app
+from quart import has_websocket_context
+from quart import jsonify
 from quart import Quart
 from quart import request
 from quart import signals
+from quart import websocket
 from quart.wrappers import Request
-
+from quart.wrappers import Response
+
+from quart_di.cli import di_cli
+from quart_di.compat import Annotated
+from quart_di.compat import get_origin
+from quart_di.compat import get_type_hints
+from quart_di.encoding import BinaryCodec
+from quart_di.encoding import negotiate_codec
+from quart_di.fusion import FUSED_PARAMS_ATTRIBUTE
+from quart_di.fusion import fuse_params
+from quart_di.greenlets import execute_task_in_greenlet
+from quart_di.greenlets import GreenletExecutor
+from quart_di.greenlets import greenlet_spawn
+from quart_di.memory import MemoryMonitor
+from quart_di.memory import MemoryStats
+from quart_di.metrics import Metrics
 from quart_di.override import DependencyOverrideManager
+from quart_di.pool import Pool
+from quart_di.profiling import DEFAULT_MAX_PROFILE_BYTES
+from quart_di.profiling import Profiler
+from quart_di.shutdown import ConcurrentExitStack
+from quart_di.shutdown import FinalizerTiming
 from quart_di.state_context import app_states
 from quart_di.state_context import create_and_push_app_context
 from quart_di.state_context import create_and_push_req_context
+from quart_di.state_context import DeferredTeardown
 from quart_di.state_context import req_states
+from quart_di.timing import DependencyTimings
+from quart_di.timing import TimingExecutor
 from quart_di.util import jsonable_encoder
+from quart_di.util import maybe_await
+from quart_di.validation import VALIDATE_ATTRIBUTE
+from quart_di.validation import Validation
+from quart_di.warmup import find_app_dependants
+from quart_di.warmup import ProviderTiming
+from quart_di.warmup import warm_up
+from quart_di.websocket import get_messages
+from quart_di.websocket import handling_messages
+from quart_di.websocket import Messages
+from quart_di.websocket import WEBSOCKET_SCOPES
 
 
 __all__ = ("inject", "QuartDI")
 
 INJECTED_MARKER_ATTRIBUTE = "__quart_di_solved__"
+FAST_PATH_ATTRIBUTE = "__quart_di_fast_path__"
 
 BindByTypeType = Tuple[Type, DependantBase[Any]]
 BindCallableType = Callable[
     [Optional[inspect.Parameter], DependantBase[Any]], Optional[DependantBase[Any]]
 ]
 DependencyType = Union[BindByTypeType, BindCallableType]
+PoolType = Tuple[Type, Pool]
 
 logger = logging.getLogger(__name__)
 
 
-def inject(view: Callable) -> Callable:
+def inject(view: Optional[Callable] = None, *, validate: bool = True) -> Callable:
+    """Inject a view's dependencies.
+
+    With `validate=False` the view is trusted, its extractors skip validation.
+    """
+    if view is None:
+        return partial(inject, validate=validate)
+
+    fused_views = []
+
     @wraps(view)
     async def wrapper(*args, **kwargs):
         extension = current_app.extensions[QuartDI.EXTENSION_KEY]
 
-        result = await current_app.ensure_async(extension._inject)(
-            Dependant(partial(view, *args, **kwargs), scope="request"),
-        )
+        # fused on first call so annotations referring to names defined after the view resolve
+        if not fused_views:
+            fused_views.append(fuse_params(view))
+        fused_view = fused_views[0]
 
-        if extension.encode_view_result:
-            result = extension.view_result_encoder(
-                result,
-                **extension.view_result_encoder_options,
-            )
-        return result
+        # fused path params are read from the request by their source's node
+        fused_names = getattr(fused_view, FUSED_PARAMS_ATTRIBUTE, ())
+        kwargs = {name: value for name, value in kwargs.items() if name not in fused_names}
+        dependant = Dependant(partial(fused_view, *args, **kwargs), scope="request")
+
+        if has_websocket_context():
+            return await extension._inject_websocket(dependant)
+
+        if extension.profiler is None:
+            return await _call_view(extension, dependant)
+        async with extension.profiler.profile(
+            request._get_current_object(), dependant, extension.container
+        ):
+            return await _call_view(extension, dependant)
+
+    setattr(wrapper, INJECTED_MARKER_ATTRIBUTE, True)
+    setattr(wrapper, VALIDATE_ATTRIBUTE, validate)
+    return wrapper
+
+
+async def _call_view(extension: "QuartDI", dependant: DependantBase) -> Any:
+    result = await current_app.ensure_async(extension._inject)(dependant)
+    return extension.encode_result(result)
+
+
+def inject_nothing(view: Callable) -> Callable:
+    """Wrap a view with nothing to inject, its result is encoded like an injected view's."""
+
+    @wraps(view)
+    async def wrapper(*args, **kwargs):
+        extension = current_app.extensions[QuartDI.EXTENSION_KEY]
+
+        # sync views run on the loop like di executes them, in a greenlet if they may await_()
+        if extension.greenlet_sync and not inspect.iscoroutinefunction(view):
+            result = await greenlet_spawn(view, *args, **kwargs)
+        else:
+            result = await maybe_await(view(*args, **kwargs))
+
+        if has_websocket_context():
+            return result
+        return extension.encode_result(result)
 
     setattr(wrapper, INJECTED_MARKER_ATTRIBUTE, True)
+    setattr(wrapper, FAST_PATH_ATTRIBUTE, True)
     return wrapper
 
 
+def has_nothing_to_inject(view: Callable, arguments: Set[str]) -> bool:
+    """Whether every parameter of `view` is a route argument or a plain default.
+
+    Route arguments annotated with markers and views whose annotations can't be resolved at
+    decoration time might need converting or injecting, so they go through di.
+    """
+    try:
+        params = inspect.signature(view).parameters.values()
+        hints = _get_parameter_hints(view)
+    except Exception:
+        return False
+
+    for param in params:
+        if param.kind not in (param.POSITIONAL_OR_KEYWORD, param.KEYWORD_ONLY):
+            return False
+
+        annotation = hints.get(param.name, param.annotation)
+        if isinstance(annotation, str) or get_origin(annotation) is Annotated:
+            return False
+        if param.name not in arguments and (
+            param.default is param.empty or param.annotation is not param.empty
+        ):
+            return False
+    return True
+
+
+def _get_parameter_hints(view: Callable) -> Dict[str, Any]:
+    # resolved like di resolves them, leaving out the return annotation, which views like
+    # Quart's static view refer to with names only imported for type checking
+    func = inspect.unwrap(getattr(view, "__func__", view))
+    annotations = getattr(func, "__annotations__", None) or {}
+    params = SimpleNamespace(
+        __annotations__={name: value for name, value in annotations.items() if name != "return"},
+        __globals__=getattr(func, "__globals__", {}),
+    )
+    return get_type_hints(params, include_extras=True)
+
+
+def get_current_request() -> Request:
+    """The current request, or websocket in a websocket context, they share the same interface."""
+    if has_websocket_context():
+        return websocket._get_current_object()
+    return request._get_current_object()
+
+
 class QuartDI:
     EXTENSION_KEY = "QuartDI"
 
@@ -72,10 +207,39 @@ class QuartDI:
     app: Optional[Quart]
     container: Container
     dependency_overrides: DependencyOverrideManager
+    metrics: Metrics
+    pools: Dict[Type, Pool]
+    trusted_blueprints: Set[str]
+    defer_teardown: bool
+    teardown_concurrency: int
+    teardown_timeout: Optional[float]
+    warm_up: bool
+    warm_up_timeout: Optional[float]
+    warm_up_timings: List[ProviderTiming]
+    shutdown_timeout: Optional[float]
+    finalizer_timeout: Optional[float]
+    shutdown_timings: List[FinalizerTiming]
+    collect_timings: bool
+    greenlet_sync: bool
+    timings: DependencyTimings
+    profile_dir: Optional[str]
+    profile_sample_rate: float
+    profile_header: Optional[str]
+    profile_token: Optional[str]
+    profile_min_interval: float
+    profile_max_files: int
+    profile_max_bytes: int
+    profiler: Optional[Profiler]
+    monitor_memory: bool
+    trace_allocations: bool
+    memory_warn_threshold: int
+    memory_monitor: Optional[MemoryMonitor]
     decorate_views: bool
+    fast_path_views: Set[str]
     encode_view_result: bool
     view_result_encoder: Callable[[Any], Any]
     view_result_encoder_options: Dict[str, Any]
+    response_codecs: Sequence[BinaryCodec]
     _binds: Sequence[DependencyType]
     _container_state: ContainerState
     _executor: AsyncExecutor
@@ -85,10 +249,32 @@ class QuartDI:
         container = None
         container_state = None
         binds = None
+        pools = None
+        trusted_blueprints = None
+        defer_teardown = False
+        teardown_concurrency = 100
+        teardown_timeout = 30.0
+        warm_up = False
+        warm_up_timeout = 30.0
+        shutdown_timeout = 30.0
+        finalizer_timeout = 10.0
+        collect_timings = False
+        greenlet_sync = False
+        profile_dir = None
+        profile_sample_rate = 0.0
+        profile_header = None
+        profile_token = None
+        profile_min_interval = 1.0
+        profile_max_files = 100
+        profile_max_bytes = DEFAULT_MAX_PROFILE_BYTES
+        monitor_memory = False
+        trace_allocations = False
+        memory_warn_threshold = 1000
         decorate_views = False
         encode_view_result = True
         view_result_encoder = jsonable_encoder
         view_result_encoder_options = None
+        response_codecs = None
 
     def __init__(
         self,
@@ -96,18 +282,76 @@ class QuartDI:
         container=DefaultConfig.container,
         container_state=DefaultConfig.container_state,
         binds=DefaultConfig.binds,
+        pools=DefaultConfig.pools,
+        trusted_blueprints=DefaultConfig.trusted_blueprints,
+        defer_teardown=DefaultConfig.defer_teardown,
+        teardown_concurrency=DefaultConfig.teardown_concurrency,
+        teardown_timeout=DefaultConfig.teardown_timeout,
+        warm_up=DefaultConfig.warm_up,
+        warm_up_timeout=DefaultConfig.warm_up_timeout,
+        shutdown_timeout=DefaultConfig.shutdown_timeout,
+        finalizer_timeout=DefaultConfig.finalizer_timeout,
+        collect_timings=DefaultConfig.collect_timings,
+        greenlet_sync=DefaultConfig.greenlet_sync,
+        profile_dir=DefaultConfig.profile_dir,
+        profile_sample_rate=DefaultConfig.profile_sample_rate,
+        profile_header=DefaultConfig.profile_header,
+        profile_token=DefaultConfig.profile_token,
+        profile_min_interval=DefaultConfig.profile_min_interval,
+        profile_max_files=DefaultConfig.profile_max_files,
+        profile_max_bytes=DefaultConfig.profile_max_bytes,
+        monitor_memory=DefaultConfig.monitor_memory,
+        trace_allocations=DefaultConfig.trace_allocations,
+        memory_warn_threshold=DefaultConfig.memory_warn_threshold,
         decorate_views=DefaultConfig.decorate_views,
         encode_view_result=DefaultConfig.encode_view_result,
         view_result_encoder=DefaultConfig.view_result_encoder,
         view_result_encoder_options=DefaultConfig.view_result_encoder_options,
+        response_codecs=DefaultConfig.response_codecs,
     ):
         self.container = container or Container()
         self._binds = list(binds or ())
+        self.pools = dict(pools or ())
+        self.trusted_blueprints = set(trusted_blueprints or ())
+        self.metrics = Metrics()
+        self.defer_teardown = defer_teardown
+        self.teardown_concurrency = teardown_concurrency
+        self.teardown_timeout = teardown_timeout
+        self.warm_up = warm_up
+        self.warm_up_timeout = warm_up_timeout
+        self.warm_up_timings = []
+        self.shutdown_timeout = shutdown_timeout
+        self.finalizer_timeout = finalizer_timeout
+        self.shutdown_timings = []
+        self.collect_timings = collect_timings
+        self.greenlet_sync = greenlet_sync
+        self.timings = DependencyTimings()
+        # extractors shared by parameters extracting the same value, see `share_extractor()`
+        self.extractors: Dict[Hashable, Callable] = {}
+        self.profile_dir = profile_dir
+        self.profile_sample_rate = profile_sample_rate
+        self.profile_header = profile_header
+        self.profile_token = profile_token
+        self.profile_min_interval = profile_min_interval
+        self.profile_max_files = profile_max_files
+        self.profile_max_bytes = profile_max_bytes
+        self.profiler = None
+        self.monitor_memory = monitor_memory
+        self.trace_allocations = trace_allocations
+        self.memory_warn_threshold = memory_warn_threshold
+        self.memory_monitor = None
+        self._connections = 0
+        # tasks outliving their request, like revalidations of `Cached`, cancelled on shutdown
+        self._background_tasks: Set[asyncio.Task] = set()
+        self._serving_ctx = None
+        self._app_stack = None
         self._container_state = container_state or ContainerState()
         self.decorate_views = decorate_views
+        self.fast_path_views = set()
         self.encode_view_result = encode_view_result
         self.view_result_encoder = view_result_encoder
         self.view_result_encoder_options = view_result_encoder_options or {}
+        self.response_codecs = list(response_codecs or ())
 
         self._executor = AsyncExecutor()
         self.dependency_overrides = DependencyOverrideManager(self.container)
@@ -120,6 +364,7 @@ class QuartDI:
         self.app = app
         app.extensions[self.EXTENSION_KEY] = self
         self._init_app_config(app)
+        app.cli.add_command(di_cli)
 
         if self.decorate_views:
             self._decorate_views()
@@ -127,16 +372,62 @@ class QuartDI:
         for scope in self.default_scopes:
             self._register_dependencies(scope)
 
+        @app.before_serving
+        async def handle_serving_started():
+            self._serving_ctx = await app_states.create_context(
+                current_state=self._container_state,
+                container=self.container,
+                app=app,
+            )
+            # app scoped finalizers are run by after_serving, concurrently where independent
+            self._app_stack = ConcurrentExitStack()
+            self._serving_ctx.state.stacks["app"] = self._app_stack
+            for pool in self.pools.values():
+                await pool.open()
+            if self.memory_monitor is not None:
+                self.memory_monitor.start()
+            if self.warm_up:
+                await self._warm_up()
+
+        @app.after_serving
+        async def handle_serving_ended():
+            await self._deferred_teardown.drain(self.teardown_timeout)
+            await self._cancel_background_tasks()
+            for pool in self.pools.values():
+                await pool.close()
+
+            serving_ctx, self._serving_ctx = self._serving_ctx, None
+            if serving_ctx is not None:
+                await self._shutdown(serving_ctx)
+            if self.memory_monitor is not None:
+                self.memory_monitor.stop()
+
         @app.before_request
         async def handle_request_started():
             await create_and_push_req_context(
                 app,
                 self.container,
             )
+            if self.memory_monitor is not None:
+                started = self.memory_monitor.request_started()
+                req_states.get_context().meta["traced_memory"] = started
 
         @app.teardown_request
         async def handle_request_ended(*args):
-            await req_states.pop_context()
+            req_ctx = req_states.get_context()
+            deferred = self.defer_teardown and req_ctx is not None
+            if deferred and self._deferred_teardown.defer(req_ctx):
+                # the teardown task starts once this handler yields, so the response is sent
+                # concurrently with the finalizers instead of after them
+                req_states.detach_context()
+            else:
+                await req_states.pop_context()
+
+            if self.memory_monitor is not None and req_ctx is not None:
+                self.memory_monitor.request_finished(
+                    request.endpoint, req_ctx.meta.get("traced_memory")
+                )
+                self.memory_monitor.check(self.get_memory_stats())
 
         @signals.appcontext_pushed.connect_via(app)
         async def handle_appcontext_pushed(app):
@@ -144,6 +435,7 @@ class QuartDI:
                 app,
                 self.container,
                 self._container_state,
+                self._serving_ctx,
             )
 
         @signals.appcontext_popped.connect_via(app)
@@ -161,43 +453,258 @@ class QuartDI:
         self.view_result_encoder_options = app.config.get(
             "QUART_DI_VIEW_RESULT_ENCODER_OPTIONS", self.view_result_encoder_options
         )
+        self.response_codecs = app.config.get("QUART_DI_RESPONSE_CODECS", self.response_codecs)
 
         for bind in app.config.get("QUART_DI_BINDS", []):
             self._binds.append(bind)
 
+        self.pools.update(app.config.get("QUART_DI_POOLS", ()))
+        self.trusted_blueprints.update(app.config.get("QUART_DI_TRUSTED_BLUEPRINTS", ()))
+        self.defer_teardown = app.config.get("QUART_DI_DEFER_TEARDOWN", self.defer_teardown)
+        self.teardown_concurrency = app.config.get(
+            "QUART_DI_TEARDOWN_CONCURRENCY", self.teardown_concurrency
+        )
+        self.teardown_timeout = app.config.get("QUART_DI_TEARDOWN_TIMEOUT", self.teardown_timeout)
+        self.warm_up = app.config.get("QUART_DI_WARM_UP", self.warm_up)
+        self.warm_up_timeout = app.config.get("QUART_DI_WARM_UP_TIMEOUT", self.warm_up_timeout)
+        self.shutdown_timeout = app.config.get("QUART_DI_SHUTDOWN_TIMEOUT", self.shutdown_timeout)
+        self.finalizer_timeout = app.config.get(
+            "QUART_DI_FINALIZER_TIMEOUT", self.finalizer_timeout
+        )
+        self._deferred_teardown = DeferredTeardown(self.teardown_concurrency, self.metrics)
+        self.collect_timings = app.config.get("QUART_DI_COLLECT_TIMINGS", self.collect_timings)
+        self.greenlet_sync = app.config.get("QUART_DI_GREENLET_SYNC", self.greenlet_sync)
+        if self.collect_timings and self.greenlet_sync:
+            self._executor = TimingExecutor(self.timings, execute_task_in_greenlet)
+        elif self.collect_timings:
+            self._executor = TimingExecutor(self.timings)
+        elif self.greenlet_sync:
+            self._executor = GreenletExecutor()
+
+        self.profile_dir = app.config.get("QUART_DI_PROFILE_DIR", self.profile_dir)
+        self.profile_sample_rate = app.config.get(
+            "QUART_DI_PROFILE_SAMPLE_RATE", self.profile_sample_rate
+        )
+        self.profile_header = app.config.get("QUART_DI_PROFILE_HEADER", self.profile_header)
+        self.profile_token = app.config.get("QUART_DI_PROFILE_TOKEN", self.profile_token)
+        self.profile_min_interval = app.config.get(
+            "QUART_DI_PROFILE_MIN_INTERVAL", self.profile_min_interval
+        )
+        self.profile_max_files = app.config.get(
+            "QUART_DI_PROFILE_MAX_FILES", self.profile_max_files
+        )
+        self.profile_max_bytes = app.config.get(
+            "QUART_DI_PROFILE_MAX_BYTES", self.profile_max_bytes
+        )
+        if self.profile_dir is not None:
+            self.profiler = Profiler(
+                self.profile_dir,
+                sample_rate=self.profile_sample_rate,
+                header=self.profile_header,
+                token=self.profile_token,
+                min_interval=self.profile_min_interval,
+                max_files=self.profile_max_files,
+                max_bytes=self.profile_max_bytes,
+                metrics=self.metrics,
+            )
+
+        self.monitor_memory = app.config.get("QUART_DI_MONITOR_MEMORY", self.monitor_memory)
+        self.trace_allocations = app.config.get(
+            "QUART_DI_TRACE_ALLOCATIONS", self.trace_allocations
+        )
+        self.memory_warn_threshold = app.config.get(
+            "QUART_DI_MEMORY_WARN_THRESHOLD", self.memory_warn_threshold
+        )
+        if self.monitor_memory:
+            self.memory_monitor = MemoryMonitor(
+                self.memory_warn_threshold,
+                trace_allocations=self.trace_allocations,
+                metrics=self.metrics,
+            )
+
     def _decorate_views(self):
         if self.app is None:
             raise RuntimeError("app is not initialized")
 
+        # a view is given the arguments of whichever of its rules matched
+        arguments: Dict[str, Set[str]] = {}
         for rule in self.app.url_map.iter_rules():
             if rule.endpoint is not None:
-                view = self.app.view_functions[rule.endpoint]
+                names = set(rule.arguments) | set(rule.defaults or ())
+                arguments[rule.endpoint] = arguments.get(rule.endpoint, names) & names
+
+        for endpoint, names in arguments.items():
+            view = self.app.view_functions[endpoint]
+            if getattr(view, INJECTED_MARKER_ATTRIBUTE, False) is not False:
+                continue
+
+            if has_nothing_to_inject(view, names):
+                self.app.view_functions[endpoint] = inject_nothing(view)
+                self.fast_path_views.add(endpoint)
+            else:
+                self.app.view_functions[endpoint] = inject(view)
+
+        if self.fast_path_views:
+            logger.info(
+                f"views with nothing to inject skip di: {', '.join(sorted(self.fast_path_views))}"
+            )
+
+    async def _inject_websocket(self, dependant: DependantBase):
+        """Inject a websocket handler, its graph is solved and executed once per connection.
+
+        The connection's state is held for the lifetime of the handler rather than pushed on the
+        request state stack, which is shared by the requests handled while the socket is open.
+        """
+        app_ctx = app_states.get_context()
+        if app_ctx is None:
+            raise RuntimeError("app context is not initialized")
+
+        self._connections += 1
+        try:
+            async with app_ctx.state.enter_scope("connection") as connection_state:
+                async with connection_state.enter_scope("request") as state:
+                    messages = Messages(self, websocket._get_current_object(), state)
+                    with handling_messages(messages):
+                        return await self._inject(
+                            dependant,
+                            state=state,
+                            scopes=WEBSOCKET_SCOPES,
+                            values={get_messages: messages},
+                        )
+        finally:
+            self._connections -= 1
+
+    def add_background_task(self, task: asyncio.Task) -> None:
+        """Track a task started by a request that may outlive it, it's cancelled on shutdown."""
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def _cancel_background_tasks(self) -> None:
+        # cancelled before pools and app scoped dependencies they might use are closed
+        tasks = set(self._background_tasks)
+        for task in tasks:
+            task.cancel()
+        if tasks:
+            await asyncio.wait(tasks)
+            logger.info(f"cancelled {len(tasks)} background tasks")
+
+    def get_memory_stats(self) -> MemoryStats:
+        """The sizes of the dependency injection state, see `MemoryMonitor`."""
+        app_values = 0
+        if self._serving_ctx is not None:
+            app_values = len(self._serving_ctx.state.cached_values.get("app", ()))
+        traced_current = traced_peak = None
+        if self.memory_monitor is not None and self.memory_monitor.tracing:
+            traced_current, traced_peak = tracemalloc.get_traced_memory()
+
+        return MemoryStats(
+            request_contexts=len(req_states),
+            deferred_teardowns=len(self._deferred_teardown),
+            connections=self._connections,
+            app_values=app_values,
+            app_finalizers=len(self._app_stack) if self._app_stack is not None else 0,
+            request_values=sum(
+                len(ctx.state.cached_values.get("request", ())) for ctx in req_states
+            ),
+            traced_current=traced_current,
+            traced_peak=traced_peak,
+        )
+
+    def get_app_dependants(self) -> Dict[DependantBase, Set[Hashable]]:
+        """Find the app scoped dependants of the injected views and binds."""
+        dependants = []
+        for view in self.app.view_functions.values():
+            if getattr(view, INJECTED_MARKER_ATTRIBUTE, False):
+                view = fuse_params(getattr(view, "__wrapped__", view))
+                dependants.append(Dependant(view, scope="request"))
+
+        for bind in self._binds:
+            if isinstance(bind, (list, tuple)) and bind[1].scope == "app":
+                dependants.append(bind[1])
+
+        return find_app_dependants(self.container, dependants, self.default_scopes)
+
+    async def _warm_up(self) -> None:
+        self.warm_up_timings = await warm_up(
+            self.container,
+            self._serving_ctx.state,
+            self._executor,
+            self.get_app_dependants(),
+            timeout=self.warm_up_timeout,
+        )
 
-                if getattr(view, INJECTED_MARKER_ATTRIBUTE, False) is False:
-                    decorated_view = inject(view)
-                    self.app.view_functions[rule.endpoint] = decorated_view
+    def get_app_requirements(self) -> Dict[Callable, Set[Callable]]:
+        """Map each app scoped provider to the app scoped providers it depends on."""
+        graph = self.get_app_dependants()
+        calls = {dep.cache_key: dep.call for dep in graph}
+        return {dep.call: {calls[key] for key in requires} for dep, requires in graph.items()}
+
+    async def _shutdown(self, serving_ctx) -> None:
+        def report(name: str, err: BaseException) -> None:
+            self.metrics.increment("teardown_errors", "app", name)
+
+        app_stack, self._app_stack = self._app_stack, None
+        self.shutdown_timings = await app_stack.aclose(
+            requires=self.get_app_requirements(),
+            timeout=self.shutdown_timeout,
+            finalizer_timeout=self.finalizer_timeout,
+            on_error=report,
+        )
+        try:
+            await serving_ctx.scope_cm.__aexit__(None, None, None)
+        except Exception:
+            logger.exception("error raised while tearing down app context")
+
+    def encode_result(self, result: Any) -> Any:
+        if not self.encode_view_result:
+            return result
+
+        result = self.view_result_encoder(result, **self.view_result_encoder_options)
+        if self.response_codecs and isinstance(result, (dict, list)):
+            result = self.make_negotiated_response(result)
+        return result
+
+    def make_negotiated_response(self, result: Any) -> Response:
+        codec = negotiate_codec(request.accept_mimetypes, self.response_codecs)
+        if codec is None:
+            response = jsonify(result)
+        else:
+            response = current_app.response_class(codec.dumps(result), mimetype=codec.mimetype)
+
+        response.vary.add("Accept")
+        return response
+
+    def get_validation(self) -> Validation:
+        current_request = get_current_request()
+        view = current_app.view_functions.get(current_request.endpoint)
+        enabled = getattr(view, VALIDATE_ATTRIBUTE, True) and self.trusted_blueprints.isdisjoint(
+            current_request.blueprints
+        )
+        return Validation(enabled, self.metrics, current_request.endpoint)
 
     def get_di_execute_values(self):
         return {
-            Request: request._get_current_object(),
+            Request: get_current_request(),
             Quart: current_app._get_current_object(),
         }
 
+    def get_container(self) -> Container:
+        return self.container
+
+    def get_app(self) -> Quart:
+        return current_app._get_current_object()
+
     def _register_dependencies(self, scope: str):
+        # named providers so they're told apart in `quart di graph`
         if scope == "app":
+            self.container.bind(bind_by_type(Dependant(self.get_container, scope="app"), Container))
+            self.container.bind(bind_by_type(Dependant(self.get_app, scope="app"), Quart))
+        elif scope == "request":
             self.container.bind(
-                bind_by_type(Dependant(lambda: self.container, scope="app"), Container)
+                bind_by_type(Dependant(get_current_request, scope="request"), Request)
             )
             self.container.bind(
-                bind_by_type(
-                    Dependant(lambda: current_app._get_current_object(), scope="app"), Quart
-                )
-            )
-        elif scope == "request":
-            self.container.bind(
-                bind_by_type(
-                    Dependant(lambda: request._get_current_object(), scope="request"), Request
-                )
+                bind_by_type(Dependant(self.get_validation, scope="request"), Validation)
             )
 
         if self._binds:
@@ -207,26 +714,32 @@ class QuartDI:
                 elif callable(bind):
                     self.container.bind(bind)
 
-    async def _inject(self, dependant: DependantBase):
+    async def _inject(
+        self,
+        dependant: DependantBase,
+        state: Optional[ContainerState] = None,
+        scopes: Optional[Sequence[str]] = None,
+        values: Optional[Dict[Any, Any]] = None,
+    ):
         logger.info(f"injecting {dependant!r}")
 
-        req_ctx = req_states.get_context()
-        if req_ctx is None:
-            raise RuntimeError("request context is not initialized")
-
-        req_state = req_ctx.state
+        if state is None:
+            req_ctx = req_states.get_context()
+            if req_ctx is None:
+                raise RuntimeError("request context is not initialized")
+            state = req_ctx.state
 
         solved = self.container.solve(
             dependant,
-            scopes=self.default_scopes,
+            scopes=scopes or self.default_scopes,
         )
 
         try:
             result = await self.container.execute_async(
                 solved,
                 executor=self._executor,
-                state=req_state,
-                values=self.get_di_execute_values(),
+                state=state,
+                values={**self.get_di_execute_values(), **(values or {})},
             )
         except Exception as err:
             logger.exception(
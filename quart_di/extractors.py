@@ -1,16 +1,29 @@
 import inspect
 import json
-from typing import Any, Optional, Callable
+from contextlib import contextmanager
+from contextvars import ContextVar
+from tempfile import SpooledTemporaryFile
+from typing import Any, Optional, Callable, Iterator, NamedTuple, Dict, Hashable, Tuple
 
-from di.dependant import Dependant, Marker
+from di.dependant import Dependant, Injectable, Marker
 from pydantic import BaseModel, ValidationError
+from quart import Quart, current_app, has_app_context
+from quart.datastructures import FileStorage
+from quart.formparser import MultiPartParser
 from quart.wrappers import Request
+from werkzeug.datastructures import MultiDict
+from werkzeug.exceptions import BadRequest, RequestEntityTooLarge, UnsupportedMediaType
+from werkzeug.http import parse_options_header
 
-from quart_di.compat import Annotated
+from quart_di.compat import Annotated, get_origin
+from quart_di.encoding import BinaryCodec, Decompressor, MSGPACK, get_decompressor
 from quart_di.util import resolve_name, inspect_annotation, model_field_from_param
+from quart_di.util import PROVIDER_SOURCE_ATTRIBUTE
+from quart_di.validation import Validation
 
 
 __all__ = (
+    "BodyReader",
     "HeaderParam",
     "RequestBody",
     "JsonBody",
@@ -18,8 +31,172 @@ __all__ = (
     "PathParam",
     "CookieParam",
     "JsonParam",
+    "FormData",
+    "FormParam",
+    "FileParam",
+    "BinaryBody",
+    "BinaryParam",
 )
 
+DEFAULT_SPOOL_MAX_SIZE = 1024 * 1024
+DEFAULT_MAX_DECOMPRESSED_SIZE = 64 * 1024 * 1024
+
+
+def _min_limit(*limits: Optional[int]) -> Optional[int]:
+    limits = [limit for limit in limits if limit is not None]
+    return min(limits) if limits else None
+
+
+class BodyReader(Injectable, scope="request"):
+    """Reads the request body once per request for all the body extractors.
+
+    Size limits, the smaller of a marker's `max_bytes` and the `QUART_DI_MAX_BODY_SIZE` config
+    value, are checked against `Content-Length` before reading and enforced while the body
+    streams in, so oversized bodies are rejected with a 413 without buffering them.
+
+    Bodies sent with a `Content-Encoding` are decompressed as they stream in.  The decompressed
+    size is limited by the smaller of `max_bytes` and the `QUART_DI_MAX_DECOMPRESSED_SIZE` config
+    value, which guards against zip bombs.
+    """
+
+    def __init__(self, request: Request, app: Quart):
+        self.request = request
+        self.max_bytes = app.config.get("QUART_DI_MAX_BODY_SIZE")
+        self.max_decompressed_bytes = app.config.get(
+            "QUART_DI_MAX_DECOMPRESSED_SIZE", DEFAULT_MAX_DECOMPRESSED_SIZE
+        )
+        self._data: Optional[bytes] = None
+        self._decompressed = False
+
+    def get_limit(self, max_bytes: Optional[int] = None) -> Optional[int]:
+        return _min_limit(max_bytes, self.max_bytes)
+
+    async def read(self, max_bytes: Optional[int] = None) -> bytes:
+        limit = self.get_limit(max_bytes)
+        decompressed_limit = _min_limit(max_bytes, self.max_decompressed_bytes)
+
+        if self._data is None:
+            content_length = self.request.content_length
+            if limit is not None and content_length is not None and content_length > limit:
+                raise RequestEntityTooLarge()
+            self._data = await self._stream(limit, decompressed_limit)
+
+        data_limit = decompressed_limit if self._decompressed else limit
+        if data_limit is not None and len(self._data) > data_limit:
+            raise RequestEntityTooLarge()
+        return self._data
+
+    def _get_decompressor(self) -> Optional[Decompressor]:
+        try:
+            return get_decompressor(self.request.headers.get("Content-Encoding"))
+        except (LookupError, ImportError) as err:
+            raise UnsupportedMediaType(str(err)) from None
+
+    async def _stream(self, limit: Optional[int], decompressed_limit: Optional[int]) -> bytes:
+        decompressor = self._get_decompressor()
+        if decompressor is None and limit is None:
+            return await self.request.get_data()
+
+        chunks = []
+        size = 0
+        decompressed = _DecompressedBody(decompressed_limit)
+        async for chunk in self.request.body:
+            size += len(chunk)
+            if limit is not None and size > limit:
+                raise RequestEntityTooLarge()
+            chunks.append(chunk)
+            if decompressor is not None:
+                decompressed.extend(decompressor.decompress, chunk)
+
+        data = b"".join(chunks)
+        # iterating drains the body, put it back for anything reading it outside of DI
+        self.request.body.set_result(data)
+
+        if decompressor is None:
+            return data
+
+        decompressed.extend(decompressor.flush)
+        self._decompressed = True
+        return decompressed.getvalue()
+
+
+class _DecompressedBody:
+    def __init__(self, limit: Optional[int]):
+        self.limit = limit
+        self.size = 0
+        self.chunks = []
+
+    def extend(self, decompress: Callable[..., Iterator[bytes]], *args: Any) -> None:
+        try:
+            for chunk in decompress(*args):
+                self.size += len(chunk)
+                if self.limit is not None and self.size > self.limit:
+                    raise RequestEntityTooLarge()
+                self.chunks.append(chunk)
+        except ValueError as err:
+            raise BadRequest(f"Invalid compressed body: {err}") from None
+
+    def getvalue(self) -> bytes:
+        return b"".join(self.chunks)
+
+
+_registered_extractors: ContextVar[Optional[Dict[Hashable, Callable]]] = ContextVar(
+    "quart_di_extractors", default=None
+)
+
+
+@contextmanager
+def registering_extractors(extractors: Dict[Hashable, Callable]) -> Iterator[None]:
+    """Share extractors through `extractors` without an app context, like when solving offline."""
+    token = _registered_extractors.set(extractors)
+    try:
+        yield
+    finally:
+        _registered_extractors.reset(token)
+
+
+def _get_extractors() -> Optional[Dict[Hashable, Callable]]:
+    extractors = _registered_extractors.get()
+    if extractors is not None:
+        return extractors
+    if not has_app_context():
+        return None
+
+    from quart_di.extension import QuartDI
+
+    extension = current_app.extensions.get(QuartDI.EXTENSION_KEY)
+    return extension.extractors if extension is not None else None
+
+
+def share_extractor(
+    key: Tuple[Any, ...], extractor: Callable, source: Optional[str] = None
+) -> Callable:
+    """Get the extractor registered for `key`, registering `extractor` if there's none yet.
+
+    Parameters extracting the same value, the same name from the same source into the same type
+    with the same default, get the same provider, so di extracts and validates it once per
+    request however many dependencies ask for it.  Extractors are registered with the current
+    app's extension, parameters solved outside of an app context get a provider of their own.
+    `source` is the name of the value it extracts, which tells extractors apart in timings and
+    graphs.
+    """
+    if source is not None:
+        setattr(extractor, PROVIDER_SOURCE_ATTRIBUTE, source)
+    extractors = _get_extractors()
+    if extractors is None:
+        return extractor
+    try:
+        return extractors.setdefault(key, extractor)
+    except TypeError:
+        # an unhashable annotation or default, it's extracted for this parameter alone
+        return extractor
+
+
+def _extraction_key(
+    marker: Marker, param: inspect.Parameter, info: Any, *options: Any
+) -> Tuple[Any, ...]:
+    return (type(marker), *options, info.origin, param.default)
+
 
 class HeaderParam(Marker):
     alias: Optional[str] = None
@@ -33,83 +210,104 @@ class HeaderParam(Marker):
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         name = resolve_name(param.name, self.alias, self.convert_underscores)
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param, alias=self.alias)
+        field = model_field_from_param(param, alias=name.lower())
 
-        def get_header(request: Annotated[Request, Marker()]) -> Any:
+        def get_header(
+            request: Annotated[Request, Marker()], validation: Annotated[Validation, Marker()]
+        ) -> Any:
             headers = {key.lower(): val for key, val in request.headers.items()}
 
             if info.is_pydantic:
-                return field.type_.parse_obj(headers)
+                return validation.parse_obj(field.type_, headers, type(self).__name__)
             elif name.lower() in headers and info.is_parameterized:
-                return field.validate(headers[name.lower()], {}, loc="en_US")[0]
+                return validation.validate(field, headers[name.lower()], type(self).__name__)
             else:
                 return headers
 
-        return Dependant(get_header, scope="request")
+        key = _extraction_key(self, param, info, name.lower())
+        return Dependant(share_extractor(key, get_header, name.lower()), scope="request")
 
 
 class RequestBody(Marker):
     encoding: str
     decode: bool
+    max_bytes: Optional[int]
 
-    def __init__(self, encoding="utf-8", decode=True):
+    binary_types = (bytes, bytearray, memoryview)
+
+    def __init__(self, encoding="utf-8", decode=True, max_bytes=None):
         self.encoding = encoding
         self.decode = decode
+        self.max_bytes = max_bytes
         super().__init__(call=None, scope="request", use_cache=False)
 
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param)
+        target = info.origin if info.is_parameterized and inspect.isclass(info.origin) else None
+
+        if target is not None and issubclass(target, self.binary_types):
+            # the raw buffer is handed over as is, wrapping it in a memoryview doesn't copy it
+            async def get_body(reader: BodyReader) -> Any:
+                body = await reader.read(self.max_bytes)
+                if issubclass(target, bytes):
+                    return body
+                return target(body)
 
-        async def get_body(request: Annotated[Request, Marker()]) -> Any:
-            body = await request.get_data()
-            if self.decode:
+            key = _extraction_key(self, param, info, self.max_bytes)
+            return Dependant(share_extractor(key, get_body), scope="request")
+
+        field = model_field_from_param(param, alias="body")
+
+        async def get_body(reader: BodyReader, validation: Annotated[Validation, Marker()]) -> Any:
+            body = await reader.read(self.max_bytes)
+            if self.decode or (target is not None and issubclass(target, str)):
                 body = body.decode(self.encoding)
 
-            if info.origin and info.is_parameterized:
-                if isinstance(body, str) and issubclass(info.origin, bytes):
-                    body = body.encode(self.encoding)
-                elif isinstance(body, bytes) and issubclass(info.origin, str):
-                    body = body.decode(self.encoding)
-                else:
-                    body = field.validate(body, {}, loc="en_US")[0]
+            if info.origin and info.is_parameterized and not isinstance(body, target or ()):
+                body = validation.validate(field, body, type(self).__name__)
 
             return body
 
-        return Dependant(get_body, scope="request")
+        key = _extraction_key(self, param, info, self.encoding, self.decode, self.max_bytes)
+        return Dependant(share_extractor(key, get_body), scope="request")
 
 
 class JsonBody(Marker):
     decoder: Callable
+    max_bytes: Optional[int]
 
-    def __init__(self, decoder=json.loads):
+    def __init__(self, decoder=json.loads, max_bytes=None):
         self.decoder = decoder
+        self.max_bytes = max_bytes
         super().__init__(call=None, scope="request", use_cache=False)
 
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param)
+        field = model_field_from_param(param, alias="body")
 
-        async def get_json(request: Annotated[Request, Marker()]) -> Any:
-            data = await request.get_data()
+        async def get_json(reader: BodyReader, validation: Annotated[Validation, Marker()]) -> Any:
+            data = await reader.read(self.max_bytes)
             if self.decoder:
                 data = self.decoder(data)
 
             if info.is_pydantic:
-                return field.type_.parse_obj(data)
+                return validation.parse_obj(field.type_, data, type(self).__name__)
             else:
                 return data
 
-        return Dependant(get_json, scope="request")
+        key = _extraction_key(self, param, info, self.decoder, self.max_bytes)
+        return Dependant(share_extractor(key, get_json), scope="request")
 
 
 class JsonParam(Marker):
     decoder: Callable
     alias: Optional[str]
     convert_underscores: bool
+    max_bytes: Optional[int]
 
-    def __init__(self, decoder=json.loads, alias=None, convert_underscores=False):
+    def __init__(self, decoder=json.loads, alias=None, convert_underscores=False, max_bytes=None):
         self.decoder = decoder
+        self.max_bytes = max_bytes
         self.alias = alias
         self.convert_underscores = convert_underscores
         super().__init__(call=None, scope="request", use_cache=False)
@@ -117,19 +315,99 @@ class JsonParam(Marker):
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         name = resolve_name(param.name, self.alias, self.convert_underscores)
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param, alias=self.alias)
+        field = model_field_from_param(param, alias=name)
 
-        async def get_json(request: Annotated[Request, Marker()]) -> Any:
-            data = await request.get_data()
+        async def get_json(reader: BodyReader, validation: Annotated[Validation, Marker()]) -> Any:
+            data = await reader.read(self.max_bytes)
             if self.decoder:
                 data = self.decoder(data)
 
             if info.is_pydantic:
-                return field.type_.parse_obj(data)
+                return validation.parse_obj(field.type_, data, type(self).__name__)
+
+            return validation.validate(field, data[name], type(self).__name__)
+
+        key = _extraction_key(self, param, info, self.decoder, self.max_bytes, name)
+        return Dependant(share_extractor(key, get_json, name), scope="request")
+
+
+_binary_body_decoders: Dict[Tuple[BinaryCodec, Optional[int]], Callable] = {}
+
+
+def get_binary_body_decoder(codec: BinaryCodec, max_bytes: Optional[int] = None) -> Callable:
+    """Get the request scoped dependency decoding the body with `codec`.
 
-            return field.validate(data[name], {}, loc="en_US")[0]
+    It's shared by every `BinaryBody` and `BinaryParam` using `codec` with the same size limit, so
+    the body is decoded once per request.
+    """
+    key = (codec, max_bytes)
+    if key not in _binary_body_decoders:
 
-        return Dependant(get_json, scope="request")
+        async def decode_body(reader: BodyReader) -> Any:
+            return codec.loads(await reader.read(max_bytes))
+
+        _binary_body_decoders[key] = decode_body
+
+    return _binary_body_decoders[key]
+
+
+class BinaryBody(Marker):
+    codec: BinaryCodec
+    max_bytes: Optional[int]
+
+    def __init__(self, codec=MSGPACK, max_bytes=None):
+        self.codec = codec
+        self.max_bytes = max_bytes
+        super().__init__(call=None, scope="request", use_cache=False)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        info = inspect_annotation(param.annotation)
+        field = model_field_from_param(param, alias="body")
+        decode_body = get_binary_body_decoder(self.codec, self.max_bytes)
+
+        def get_body(
+            data: Annotated[Any, Marker(decode_body, scope="request")],
+            validation: Annotated[Validation, Marker()],
+        ) -> Any:
+            if info.is_pydantic:
+                return validation.parse_obj(field.type_, data, type(self).__name__)
+            else:
+                return data
+
+        key = _extraction_key(self, param, info, self.codec, self.max_bytes)
+        return Dependant(share_extractor(key, get_body), scope="request")
+
+
+class BinaryParam(Marker):
+    codec: BinaryCodec
+    alias: Optional[str]
+    convert_underscores: bool
+    max_bytes: Optional[int]
+
+    def __init__(self, codec=MSGPACK, alias=None, convert_underscores=False, max_bytes=None):
+        self.codec = codec
+        self.max_bytes = max_bytes
+        self.alias = alias
+        self.convert_underscores = convert_underscores
+        super().__init__(call=None, scope="request", use_cache=False)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        name = resolve_name(param.name, self.alias, self.convert_underscores)
+        info = inspect_annotation(param.annotation)
+        field = model_field_from_param(param, alias=name)
+        decode_body = get_binary_body_decoder(self.codec, self.max_bytes)
+
+        def get_param(
+            data: Annotated[Any, Marker(decode_body, scope="request")],
+            validation: Annotated[Validation, Marker()],
+        ) -> Any:
+            if info.is_pydantic:
+                return validation.parse_obj(field.type_, data, type(self).__name__)
+
+            return validation.validate(field, data[name], type(self).__name__)
+
+        key = _extraction_key(self, param, info, self.codec, self.max_bytes, name)
+        return Dependant(share_extractor(key, get_param, name), scope="request")
 
 
 class QueryParam(Marker):
@@ -144,19 +422,22 @@ class QueryParam(Marker):
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         name = resolve_name(param.name, self.alias, self.convert_underscores)
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param, alias=self.alias)
+        field = model_field_from_param(param, alias=name)
 
-        def get_query_args(request: Annotated[Request, Marker()]) -> Any:
+        def get_query_args(
+            request: Annotated[Request, Marker()], validation: Annotated[Validation, Marker()]
+        ) -> Any:
             args = request.args
 
             if info.is_pydantic:
-                return field.type_.parse_obj(args)
+                return validation.parse_obj(field.type_, args, type(self).__name__)
             elif name in args and info.is_parameterized:
-                return field.validate(args[name], {}, loc="en_US")[0]
+                return validation.validate(field, args[name], type(self).__name__)
             else:
                 return args
 
-        return Dependant(get_query_args, scope="request")
+        key = _extraction_key(self, param, info, name)
+        return Dependant(share_extractor(key, get_query_args, name), scope="request")
 
 
 class PathParam(Marker):
@@ -167,22 +448,25 @@ class PathParam(Marker):
         info = inspect_annotation(param.annotation)
         field = model_field_from_param(param)
 
-        def get_path_args(request: Annotated[Request, Marker()]) -> Any:
+        def get_path_args(
+            request: Annotated[Request, Marker()], validation: Annotated[Validation, Marker()]
+        ) -> Any:
             args = request.view_args
 
             if args is None and field.required:
-                _, error = field.validate(None, {}, loc="en_US")
+                _, error = field.validate(None, {}, loc=field.name)
                 if isinstance(error.exc, Exception):
-                    raise ValidationError([error], model=BaseModel())
+                    raise ValidationError([error], model=BaseModel)
 
             if info.is_pydantic:
-                return field.type_.parse_obj(args)
+                return validation.parse_obj(field.type_, args, type(self).__name__)
             elif param.name in args and info.is_parameterized:
-                return field.validate(args[param.name], {}, loc="en_US")[0]
+                return validation.validate(field, args[param.name], type(self).__name__)
             else:
                 return args
 
-        return Dependant(get_path_args, scope="request")
+        key = _extraction_key(self, param, info, param.name)
+        return Dependant(share_extractor(key, get_path_args, param.name), scope="request")
 
 
 class CookieParam(Marker):
@@ -197,16 +481,122 @@ class CookieParam(Marker):
     def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
         name = resolve_name(param.name, self.alias, self.convert_underscores)
         info = inspect_annotation(param.annotation)
-        field = model_field_from_param(param, alias=self.alias)
+        field = model_field_from_param(param, alias=name)
 
-        def get_cookies(request: Annotated[Request, Marker()]) -> Any:
+        def get_cookies(
+            request: Annotated[Request, Marker()], validation: Annotated[Validation, Marker()]
+        ) -> Any:
             cookies = request.cookies
 
             if info.is_pydantic:
-                return field.type_.parse_obj(cookies)
+                return validation.parse_obj(field.type_, cookies, type(self).__name__)
             elif name in cookies and info.is_parameterized:
-                return field.validate(cookies[param.name], {}, loc="en_US")[0]
+                return validation.validate(field, cookies[name], type(self).__name__)
             else:
                 return cookies
 
-        return Dependant(get_cookies, scope="request")
+        key = _extraction_key(self, param, info, name)
+        return Dependant(share_extractor(key, get_cookies, name), scope="request")
+
+
+class FormData(NamedTuple):
+    fields: MultiDict
+    files: MultiDict
+
+
+async def get_form_data(request: Request, app: Quart):
+    """Parse the request's form body once, streaming file parts into spooled temporary files.
+
+    Files up to `QUART_DI_SPOOL_MAX_SIZE` bytes are kept in memory, larger ones roll over to
+    disk.  All file handles are closed when the request scope is torn down.
+    """
+    mimetype, options = parse_options_header(request.content_type or "")
+
+    if mimetype == "multipart/form-data":
+        spool_max_size = app.config.get("QUART_DI_SPOOL_MAX_SIZE", DEFAULT_SPOOL_MAX_SIZE)
+
+        def stream_factory(*args):
+            return SpooledTemporaryFile(max_size=spool_max_size)
+
+        parser = MultiPartParser(
+            stream_factory,
+            max_form_memory_size=app.config.get("QUART_DI_MAX_FORM_MEMORY_SIZE"),
+            file_storage_cls=FileStorage,
+        )
+        fields, files = await parser.parse(
+            request.body, options.get("boundary", "").encode("ascii"), request.content_length
+        )
+    else:
+        fields, files = await request.form, MultiDict()
+
+    try:
+        yield FormData(fields, files)
+    finally:
+        # every file of every field, `values()` only has the first file of each
+        for _, file in files.items(multi=True):
+            file.close()
+
+
+class FormParam(Marker):
+    alias: Optional[str]
+    convert_underscores: bool
+
+    def __init__(self, alias=None, convert_underscores=False):
+        self.alias = alias
+        self.convert_underscores = convert_underscores
+        super().__init__(call=None, scope="request", use_cache=False)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        name = resolve_name(param.name, self.alias, self.convert_underscores)
+        info = inspect_annotation(param.annotation)
+        field = model_field_from_param(param, alias=name)
+
+        def get_form(
+            form: Annotated[FormData, Marker(get_form_data, scope="request")],
+            validation: Annotated[Validation, Marker()],
+        ) -> Any:
+            fields = form.fields
+
+            if info.is_pydantic:
+                return validation.parse_obj(field.type_, fields, type(self).__name__)
+            elif name in fields and info.is_parameterized:
+                return validation.validate(field, fields[name], type(self).__name__)
+            else:
+                return fields
+
+        key = _extraction_key(self, param, info, name)
+        return Dependant(share_extractor(key, get_form, name), scope="request")
+
+
+class FileParam(Marker):
+    alias: Optional[str]
+    convert_underscores: bool
+
+    def __init__(self, alias=None, convert_underscores=False):
+        self.alias = alias
+        self.convert_underscores = convert_underscores
+        super().__init__(call=None, scope="request", use_cache=False)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        name = resolve_name(param.name, self.alias, self.convert_underscores)
+        info = inspect_annotation(param.annotation)
+        field = model_field_from_param(param, alias=name, arbitrary_types_allowed=True)
+        is_list = get_origin(info.origin) is list
+
+        def get_files(form: Annotated[FormData, Marker(get_form_data, scope="request")]) -> Any:
+            files = form.files
+
+            if not info.is_parameterized:
+                return files
+            elif is_list:
+                return files.getlist(name)
+            elif name in files:
+                return files[name]
+            elif field.required:
+                _, error = field.validate(None, {}, loc=field.name)
+                raise ValidationError([error], model=BaseModel)
+            else:
+                return field.default
+
+        key = _extraction_key(self, param, info, name)
+        return Dependant(share_extractor(key, get_files, name), scope="request")
@@ -0,0 +1,177 @@
+import inspect
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Tuple
+from typing import Type
+
+from di.dependant import Marker
+from di.typing import get_parameters
+from pydantic import BaseModel, BaseConfig, Field, create_model
+from quart.wrappers import Request
+
+from quart_di.compat import Annotated, get_origin, get_type
+from quart_di.extractors import CookieParam, HeaderParam, PathParam, QueryParam
+from quart_di.util import inspect_annotation, maybe_await, resolve_name
+from quart_di.validation import Validation
+
+
+__all__ = ("FUSED_PARAMS_ATTRIBUTE", "fuse_params")
+
+FUSED_PARAMS_ATTRIBUTE = "__quart_di_fused_params__"
+
+
+def _get_query_args(request: Request) -> Mapping[str, Any]:
+    return request.args.to_dict()
+
+
+def _get_headers(request: Request) -> Mapping[str, Any]:
+    return {key.lower(): val for key, val in request.headers.items()}
+
+
+def _get_cookies(request: Request) -> Mapping[str, Any]:
+    return dict(request.cookies)
+
+
+def _get_path_args(request: Request) -> Mapping[str, Any]:
+    return request.view_args or {}
+
+
+class Source(NamedTuple):
+    name: str
+    get_values: Callable[[Request], Mapping[str, Any]]
+    lowercase: bool = False
+
+
+_sources: Dict[Type[Marker], Source] = {
+    QueryParam: Source("query", _get_query_args),
+    HeaderParam: Source("headers", _get_headers, lowercase=True),
+    CookieParam: Source("cookies", _get_cookies),
+    PathParam: Source("path", _get_path_args),
+}
+
+
+class FusedParamsConfig(BaseConfig):
+    arbitrary_types_allowed = True
+
+
+def _get_fusable_marker(param: inspect.Parameter):
+    if param.kind is not param.POSITIONAL_OR_KEYWORD and param.kind is not param.KEYWORD_ONLY:
+        return None
+    if get_origin(param.annotation) is not Annotated:
+        return None
+
+    info = inspect_annotation(param.annotation)
+    if len(info.markers) != 1 or type(info.markers[0]) not in _sources:
+        return None
+    # mappings and models of a whole source keep their own extractor
+    if not info.is_parameterized or info.is_model:
+        return None
+    return info.markers[0]
+
+
+def _resolve_key(param: inspect.Parameter, marker: Marker, source: Source) -> str:
+    key = resolve_name(
+        param.name,
+        getattr(marker, "alias", None),
+        getattr(marker, "convert_underscores", False),
+    )
+    return key.lower() if source.lowercase else key
+
+
+def _compile_source(
+    view: Callable, source: Source, params: List[Tuple[inspect.Parameter, Marker]]
+) -> Tuple[inspect.Parameter, Dict[str, str]]:
+    # fields get generated names, param names like `json` or `fields` would shadow the model's
+    fields = {}
+    field_names = {}
+    for index, (param, marker) in enumerate(params):
+        default = param.default if param.default is not param.empty else ...
+        field_name = f"field_{index}"
+        fields[field_name] = (
+            get_type(param),
+            Field(default, alias=_resolve_key(param, marker, source)),
+        )
+        field_names[param.name] = field_name
+
+    model = create_model(f"{view.__name__}_{source.name}", __config__=FusedParamsConfig, **fields)
+
+    def get_fused_params(
+        request: Annotated[Request, Marker()], validation: Annotated[Validation, Marker()]
+    ) -> BaseModel:
+        return validation.parse_obj(model, source.get_values(request), "FusedParams")
+
+    get_fused_params.__qualname__ = f"{view.__qualname__}.<{source.name} params>"
+
+    param = inspect.Parameter(
+        f"__quart_di_{source.name}__",
+        inspect.Parameter.KEYWORD_ONLY,
+        annotation=Annotated[model, Marker(get_fused_params, scope="request")],
+    )
+    return param, field_names
+
+
+def fuse_params(view: Callable) -> Callable:
+    """Compile a view's simple query, header, cookie and path parameters into one node per source.
+
+    Each source is validated by a model generated for the view, so a view with many scalar
+    parameters solves and validates a handful of dependencies instead of one per parameter and
+    reports all of a source's errors at once.  Views without such parameters are returned as is.
+    """
+    try:
+        params = get_parameters(view)
+    except Exception:
+        # unresolvable annotations are reported by di when the view is solved
+        return view
+
+    if any(param.kind in (param.VAR_POSITIONAL, param.VAR_KEYWORD) for param in params.values()):
+        return view
+
+    kept: List[inspect.Parameter] = []
+    fusable: Dict[Source, List[Tuple[inspect.Parameter, Marker]]] = {}
+    for param in params.values():
+        marker = _get_fusable_marker(param)
+        if marker is None:
+            if param.kind is param.POSITIONAL_ONLY:
+                return view
+            kept.append(param.replace(kind=inspect.Parameter.KEYWORD_ONLY))
+        else:
+            fusable.setdefault(_sources[type(marker)], []).append((param, marker))
+
+    if not fusable:
+        return view
+
+    compiled = [_compile_source(view, source, params) for source, params in fusable.items()]
+    fused_names = {name for _, field_names in compiled for name in field_names}
+
+    def unfuse(kwargs: Dict[str, Any]) -> Dict[str, Any]:
+        for param, field_names in compiled:
+            values = kwargs.pop(param.name)
+            for name, field_name in field_names.items():
+                kwargs[name] = getattr(values, field_name)
+        return kwargs
+
+    if inspect.iscoroutinefunction(view):
+
+        async def fused_view(**kwargs: Any) -> Any:
+            return await maybe_await(view(**unfuse(kwargs)))
+
+    else:
+        # sync views stay sync so di's executor runs them, in a greenlet with greenlet_sync
+        def fused_view(**kwargs: Any) -> Any:
+            return view(**unfuse(kwargs))
+
+    fused_view.__signature__ = inspect.Signature(kept + [param for param, _ in compiled])
+    fused_view.__annotations__ = {
+        param.name: param.annotation
+        for param in fused_view.__signature__.parameters.values()
+        if param.annotation is not param.empty
+    }
+    fused_view.__name__ = view.__name__
+    fused_view.__qualname__ = view.__qualname__
+    fused_view.__module__ = view.__module__
+    setattr(fused_view, FUSED_PARAMS_ATTRIBUTE, frozenset(fused_names))
+    return fused_view
@@ -0,0 +1,224 @@
+import json
+from collections import Counter
+from functools import partial
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from di.container import Container
+from di.dependant import Dependant
+from quart import Quart
+
+from quart_di.extractors import registering_extractors
+from quart_di.fusion import FUSED_PARAMS_ATTRIBUTE
+from quart_di.fusion import fuse_params
+from quart_di.timing import DependencyTimings
+from quart_di.timing import TimingSummary
+from quart_di.util import get_provider_key
+from quart_di.util import get_provider_label
+from quart_di.util import get_provider_name
+from quart_di.util import is_default_value
+from quart_di.websocket import WEBSOCKET_SCOPES
+
+
+__all__ = ("DependencyNode", "RouteGraph", "build_graphs", "FORMATTERS")
+
+
+class DependencyNode(NamedTuple):
+    # unique within its graph, providers sharing a name are different nodes
+    id: str
+    name: str
+    scope: Any
+    cached: bool
+    timing: Optional[TimingSummary]
+
+
+class DependencyEdge(NamedTuple):
+    # node ids
+    source: str
+    target: str
+    parameter: Optional[str]
+
+
+class RouteGraph(NamedTuple):
+    endpoint: str
+    rule: str
+    nodes: List[DependencyNode]
+    edges: List[DependencyEdge]
+    error: Optional[str] = None
+
+    @property
+    def root(self) -> Optional[DependencyNode]:
+        return self.nodes[0] if self.nodes else None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "endpoint": self.endpoint,
+            "rule": self.rule,
+            "nodes": [
+                {
+                    "id": node.id,
+                    "name": node.name,
+                    "scope": node.scope,
+                    "cached": node.cached,
+                    "timing": node.timing._asdict() if node.timing else None,
+                }
+                for node in self.nodes
+            ],
+            "edges": [edge._asdict() for edge in self.edges],
+            "error": self.error,
+        }
+
+
+def _solve_route(
+    container: Container, endpoint: str, rule: Any, view: Any, timings: DependencyTimings
+) -> RouteGraph:
+    # the view is solved the way `inject` does, with its params fused and route arguments bound
+    view = fuse_params(getattr(view, "__wrapped__", view))
+    fused_names = getattr(view, FUSED_PARAMS_ATTRIBUTE, ())
+    arguments = {name: None for name in rule.arguments if name not in fused_names}
+    root = Dependant(partial(view, **arguments) if arguments else view, scope="request")
+    scopes = WEBSOCKET_SCOPES if rule.websocket else ("app", "request")
+    try:
+        solved = container.solve(root, scopes=scopes)
+    except Exception as err:
+        return RouteGraph(endpoint, rule.rule, [], [], f"{type(err).__name__}: {err}")
+
+    # nodes are keyed by dependant, so closures sharing a qualname stay apart
+    dependants: Dict[Hashable, Any] = {}
+    incoming: Dict[Hashable, str] = {}
+    links: List[Tuple[Hashable, Hashable, Optional[str]]] = []
+    for dependant, params in solved.dag.items():
+        if is_default_value(get_provider_name(dependant)):
+            continue
+        dependants.setdefault(dependant.cache_key, dependant)
+        for param in params:
+            if is_default_value(get_provider_name(param.dependency)):
+                continue
+            parameter = param.parameter.name if param.parameter is not None else None
+            links.append((dependant.cache_key, param.dependency.cache_key, parameter))
+            if parameter is not None:
+                incoming.setdefault(param.dependency.cache_key, parameter)
+
+    labels = {key: get_provider_label(dependant) for key, dependant in dependants.items()}
+    names = dict(labels)
+    counts = Counter(labels.values())
+    for key, label in labels.items():
+        if counts[label] > 1 and key in incoming:
+            names[key] = f"{label}[{incoming[key]}]"
+
+    root_key = root.cache_key
+    keys = [root_key] + sorted((key for key in dependants if key != root_key), key=names.get)
+    ids = {key: f"n{position}" for position, key in enumerate(keys)}
+    nodes = [
+        DependencyNode(
+            ids[key],
+            names[key],
+            dependants[key].scope,
+            dependants[key].use_cache,
+            timings.summary(get_provider_key(dependants[key]), labels[key]),
+        )
+        for key in keys
+    ]
+    edges = [
+        DependencyEdge(ids[source], ids[target], parameter) for source, target, parameter in links
+    ]
+    return RouteGraph(endpoint, rule.rule, nodes, edges)
+
+
+def build_graphs(
+    app: Quart,
+    container: Container,
+    timings: Optional[DependencyTimings] = None,
+    endpoint: Optional[str] = None,
+) -> List[RouteGraph]:
+    """Solve the dependency graph of each injected view, annotated with recorded timings."""
+    from quart_di.extension import INJECTED_MARKER_ATTRIBUTE, QuartDI
+
+    timings = timings or DependencyTimings()
+    # solve with the extractors the app's requests use, so their timings are found
+    extension = app.extensions.get(QuartDI.EXTENSION_KEY)
+    extractors = extension.extractors if extension is not None else {}
+    graphs = []
+    with registering_extractors(extractors):
+        for rule in sorted(app.url_map.iter_rules(), key=lambda rule: rule.rule):
+            if endpoint is not None and rule.endpoint != endpoint:
+                continue
+            view = app.view_functions.get(rule.endpoint)
+            if not getattr(view, INJECTED_MARKER_ATTRIBUTE, False):
+                continue
+            graphs.append(_solve_route(container, rule.endpoint, rule, view, timings))
+    return graphs
+
+
+def _format_timing(timing: Optional[TimingSummary]) -> str:
+    if timing is None:
+        return ""
+    return f"p50={timing.p50 * 1000:.2f}ms p99={timing.p99 * 1000:.2f}ms n={timing.count}"
+
+
+def _node_label(node: DependencyNode) -> str:
+    flags = f"scope={node.scope}" + ("" if node.cached else " uncached")
+    timing = _format_timing(node.timing)
+    return f"{node.name} [{flags}]" + (f" {timing}" if timing else "")
+
+
+def format_text(graphs: List[RouteGraph]) -> str:
+    lines = []
+    for graph in graphs:
+        lines.append(f"{graph.rule} ({graph.endpoint})")
+        if graph.error is not None:
+            lines.append(f"  ! {graph.error}")
+            continue
+
+        nodes = {node.id: node for node in graph.nodes}
+        children: Dict[str, List[DependencyEdge]] = {}
+        for edge in graph.edges:
+            children.setdefault(edge.source, []).append(edge)
+
+        def walk(node_id: str, parameter: Optional[str], depth: int, seen: frozenset) -> None:
+            prefix = f"{parameter}: " if parameter else ""
+            lines.append(f"{'  ' * depth}{prefix}{_node_label(nodes[node_id])}")
+            if node_id in seen:
+                return
+            for edge in children.get(node_id, ()):
+                walk(edge.target, edge.parameter, depth + 1, seen | {node_id})
+
+        walk(graph.root.id, None, 1, frozenset())
+    return "\n".join(lines)
+
+
+def format_json(graphs: List[RouteGraph]) -> str:
+    return json.dumps([graph.to_dict() for graph in graphs], indent=2)
+
+
+def _dot_escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"')
+
+
+def format_dot(graphs: List[RouteGraph]) -> str:
+    lines = ["digraph dependencies {", "  node [shape=box];"]
+    for index, graph in enumerate(graphs):
+        lines.append(f"  subgraph cluster_{index} {{")
+        lines.append(f'    label="{_dot_escape(graph.rule)}";')
+        for node in graph.nodes:
+            label = "\\n".join(
+                _dot_escape(part)
+                for part in (node.name, f"scope={node.scope}", _format_timing(node.timing))
+                if part
+            )
+            style = "" if node.cached else ", style=dashed"
+            lines.append(f'    r{index}_{node.id} [label="{label}"{style}];')
+        for edge in graph.edges:
+            label = f' [label="{_dot_escape(edge.parameter)}"]' if edge.parameter else ""
+            lines.append(f"    r{index}_{edge.source} -> r{index}_{edge.target}{label};")
+        lines.append("  }")
+    lines.append("}")
+    return "\n".join(lines)
+
+
+FORMATTERS = {"text": format_text, "json": format_json, "dot": format_dot}
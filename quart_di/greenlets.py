@@ -0,0 +1,87 @@
+import inspect
+import sys
+from typing import Any
+from typing import Awaitable
+from typing import Callable
+from typing import TypeVar
+
+from di.api.executor import StateType
+from di.api.executor import SupportsTaskGraph
+from di.api.executor import Task
+from di.executors import AsyncExecutor
+from greenlet import getcurrent
+from greenlet import greenlet
+
+from quart_di.timing import execute_task
+
+
+__all__ = (
+    "await_",
+    "execute_task_in_greenlet",
+    "greenlet_spawn",
+    "GreenletExecutor",
+    "in_greenlet",
+)
+
+T = TypeVar("T")
+
+
+class _BridgeGreenlet(greenlet):
+    def __init__(self, fn: Callable[..., Any], driver: greenlet):
+        super().__init__(fn, driver)
+        self.driver = driver
+        # share the driver's context so context vars like Quart's request context are visible
+        self.gr_context = driver.gr_context
+
+
+def in_greenlet() -> bool:
+    """Whether the caller is running in `greenlet_spawn()`, so `await_()` can be used."""
+    return isinstance(getcurrent(), _BridgeGreenlet)
+
+
+def await_(awaitable: Awaitable[T]) -> T:
+    """Wait for `awaitable` from sync code running in `greenlet_spawn()`.
+
+    The greenlet switches back to the event loop, which awaits it and switches back with the
+    result, so the sync code doesn't block the loop while it waits.
+    """
+    current = getcurrent()
+    if not isinstance(current, _BridgeGreenlet):
+        if inspect.iscoroutine(awaitable):
+            awaitable.close()
+        raise RuntimeError(
+            "await_() can only be used by sync code executed with greenlet_spawn(), "
+            "like sync dependencies with greenlet execution enabled"
+        )
+    return current.driver.switch(awaitable)
+
+
+async def greenlet_spawn(fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Call the sync function `fn` in a greenlet, awaiting what it passes to `await_()`."""
+    context = _BridgeGreenlet(fn, getcurrent())
+    result = context.switch(*args, **kwargs)
+    while not context.dead:
+        try:
+            value = await result
+        except BaseException:
+            result = context.throw(*sys.exc_info())
+        else:
+            result = context.switch(value)
+    return result
+
+
+async def execute_task_in_greenlet(task: Task[StateType], state: StateType) -> None:
+    """Execute a sync task in a greenlet, async tasks and tasks run in threads as usual."""
+    is_async = inspect.iscoroutinefunction(task.compute)
+    if is_async or getattr(task.dependant, "sync_to_thread", False):
+        await execute_task(task, state)
+    else:
+        await greenlet_spawn(task.compute, state)
+
+
+class GreenletExecutor(AsyncExecutor):
+    """An `AsyncExecutor` executing sync dependencies in greenlets, see `await_()`."""
+
+    async def execute_async(self, tasks: SupportsTaskGraph[StateType], state: StateType) -> None:
+        for task in tasks.static_order():
+            await execute_task_in_greenlet(task, state)
@@ -0,0 +1,112 @@
+import asyncio
+import inspect
+from typing import Any
+from typing import Generic
+from typing import Optional
+from typing import TypeVar
+
+from di.dependant import Dependant
+from di.dependant import Marker
+from quart import current_app
+from quart import has_websocket_context
+
+from quart_di.compat import Annotated
+from quart_di.compat import get_args
+from quart_di.compat import get_origin
+from quart_di.websocket import WEBSOCKET_SCOPES
+from quart_di.websocket import get_current_messages
+from quart_di.websocket import get_messages
+
+
+__all__ = ("LazyDependency", "LazyMarker")
+
+T = TypeVar("T")
+
+
+class LazyDependency(Generic[T]):
+    """A handle to a dependency that's solved and executed the first time it's awaited.
+
+    Execution happens in the current request scope, so the value is shared with any eager
+    consumers of the same dependency and torn down with the request.  In websocket handlers
+    that's the scope of the connection, see `Messages`.
+    """
+
+    __slots__ = ("dependant", "_value", "_resolved", "_lock")
+
+    def __init__(self, dependant: Dependant[T]):
+        self.dependant = dependant
+        self._value: Optional[T] = None
+        self._resolved = False
+        self._lock: Optional[asyncio.Lock] = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(dependant={self.dependant!r}, resolved={self._resolved!r})"
+
+    def __await__(self):
+        return self.get().__await__()
+
+    @property
+    def resolved(self) -> bool:
+        return self._resolved
+
+    async def get(self) -> T:
+        if self._resolved:
+            return self._value
+
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+
+        async with self._lock:
+            if not self._resolved:
+                from quart_di.extension import QuartDI
+
+                extension = current_app.extensions[QuartDI.EXTENSION_KEY]
+                messages = get_current_messages()
+                if has_websocket_context() and messages is not None:
+                    self._value = await extension._inject(
+                        self.dependant,
+                        state=messages.state,
+                        scopes=WEBSOCKET_SCOPES,
+                        values={get_messages: messages},
+                    )
+                else:
+                    self._value = await extension._inject(self.dependant)
+                self._resolved = True
+
+        return self._value
+
+
+def _strip_marker(annotation: Any, marker: Marker) -> Any:
+    if get_origin(annotation) is not Annotated:
+        return annotation
+
+    origin, *metadata = get_args(annotation)
+    metadata = [arg for arg in metadata if arg is not marker]
+    if not metadata:
+        return origin
+    return Annotated[(origin, *metadata)]
+
+
+class LazyMarker(Marker):
+    def __init__(self):
+        super().__init__(call=None, scope="request", use_cache=False)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        # the name is kept, extractors like `FromQuery` read the value named after the parameter
+        inner_param = param.replace(
+            kind=inspect.Parameter.KEYWORD_ONLY,
+            annotation=_strip_marker(param.annotation, self),
+        )
+
+        # solved as a parameter of this function so binds and overrides see the annotation
+        def resolve(**kwargs):
+            return kwargs[param.name]
+
+        resolve.__signature__ = inspect.Signature([inner_param])
+        resolve.__annotations__ = {param.name: inner_param.annotation}
+        dependant = Dependant(resolve, scope="request")
+
+        def get_lazy_dependency() -> LazyDependency:
+            return LazyDependency(dependant)
+
+        return Dependant(get_lazy_dependency, scope="request", use_cache=False)
@@ -1,6 +1,8 @@
 from typing import TypeVar
 
 from quart_di.compat import Annotated
+from quart_di.encoding import CBOR
+from quart_di.encoding import MSGPACK
 from quart_di.extractors import (
     RequestBody,
     JsonBody,
@@ -9,7 +11,13 @@ from quart_di.extractors import (
     PathParam,
     CookieParam,
     JsonParam,
+    FormParam,
+    FileParam,
+    BinaryBody,
+    BinaryParam,
 )
+from quart_di.lazy import LazyMarker
+from quart_di.pool import PoolLease
 
 __all__ = (
     "T",
@@ -20,6 +28,14 @@ __all__ = (
     "FromJson",
     "FromQuery",
     "FromCookie",
+    "FromForm",
+    "File",
+    "MsgPack",
+    "FromMsgPack",
+    "Cbor",
+    "FromCbor",
+    "Lazy",
+    "Pooled",
 )
 
 T = TypeVar("T")
@@ -31,3 +47,11 @@ FromHeader = Annotated[T, HeaderParam(convert_underscores=True)]
 FromJson = Annotated[T, JsonParam(convert_underscores=True)]
 FromQuery = Annotated[T, QueryParam(convert_underscores=True)]
 FromCookie = Annotated[T, CookieParam(convert_underscores=True)]
+FromForm = Annotated[T, FormParam()]
+File = Annotated[T, FileParam()]
+MsgPack = Annotated[T, BinaryBody(MSGPACK)]
+FromMsgPack = Annotated[T, BinaryParam(MSGPACK, convert_underscores=True)]
+Cbor = Annotated[T, BinaryBody(CBOR)]
+FromCbor = Annotated[T, BinaryParam(CBOR, convert_underscores=True)]
+Lazy = Annotated[T, LazyMarker()]
+Pooled = Annotated[T, PoolLease()]
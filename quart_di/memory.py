@@ -0,0 +1,142 @@
+import logging
+import tracemalloc
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from quart_di.metrics import Metrics
+
+
+__all__ = ("AllocationStats", "MemoryMonitor", "MemoryStats")
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryStats(NamedTuple):
+    # request contexts on the state stack, one per request in flight unless some leaked
+    request_contexts: int
+    # request contexts detached for deferred teardown and not yet torn down
+    deferred_teardowns: int
+    connections: int
+    # cached app scoped dependency instances and registered app scoped finalizers
+    app_values: int
+    app_finalizers: int
+    # cached request scoped dependency instances of the request contexts on the stack
+    request_values: int = 0
+    traced_current: Optional[int] = None
+    traced_peak: Optional[int] = None
+
+
+class AllocationStats(NamedTuple):
+    requests: int
+    total: int
+
+    @property
+    def mean(self) -> float:
+        return self.total / self.requests if self.requests else 0.0
+
+
+class MemoryMonitor:
+    """Watch the sizes of the dependency injection state for unbounded growth.
+
+    Each figure of `MemoryStats` passed to `check()` that reaches `warn_threshold` is logged as
+    a warning and counted as `memory_warnings` in `metrics`, then the threshold for that figure
+    is doubled so a steady leak keeps being reported without flooding the logs.
+
+    With `trace_allocations`, `tracemalloc` is started and the traced memory allocated between
+    the start and end of each request is summed by endpoint.  Requests run concurrently on the
+    event loop, so these are approximate and best compared across many requests.
+    `top_growth()` compares the traced memory against a snapshot taken by `start()`.
+    """
+
+    def __init__(
+        self,
+        warn_threshold: int = 1000,
+        trace_allocations: bool = False,
+        trace_frames: int = 1,
+        metrics: Optional[Metrics] = None,
+    ):
+        self.warn_threshold = warn_threshold
+        self.trace_allocations = trace_allocations
+        self.trace_frames = trace_frames
+        self.metrics = metrics or Metrics()
+        self.allocations: Dict[str, AllocationStats] = {}
+        self._levels: Dict[str, int] = {}
+        self._started_tracing = False
+        self._baseline: Optional[tracemalloc.Snapshot] = None
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(warn_threshold={self.warn_threshold!r}, "
+            f"trace_allocations={self.trace_allocations!r})"
+        )
+
+    @property
+    def tracing(self) -> bool:
+        return self.trace_allocations and tracemalloc.is_tracing()
+
+    def start(self) -> None:
+        if not self.trace_allocations:
+            return
+        if not tracemalloc.is_tracing():
+            tracemalloc.start(self.trace_frames)
+            self._started_tracing = True
+        self._baseline = tracemalloc.take_snapshot()
+
+    def stop(self) -> None:
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        self._baseline = None
+
+    def request_started(self) -> Optional[int]:
+        """The traced memory at the start of a request, to pass to `request_finished()`."""
+        if not self.tracing:
+            return None
+        return tracemalloc.get_traced_memory()[0]
+
+    def request_finished(self, endpoint: Optional[str], started: Optional[int]) -> None:
+        if started is None or not self.tracing:
+            return
+        delta = tracemalloc.get_traced_memory()[0] - started
+        stats = self.allocations.get(endpoint, AllocationStats(0, 0))
+        self.allocations[endpoint] = AllocationStats(stats.requests + 1, stats.total + delta)
+
+    def check(self, stats: MemoryStats) -> None:
+        for name in (
+            "request_contexts",
+            "deferred_teardowns",
+            "connections",
+            "app_values",
+            "app_finalizers",
+            "request_values",
+        ):
+            value = getattr(stats, name)
+            level = self._levels.get(name, self.warn_threshold)
+            if value < level:
+                continue
+
+            logger.warning(
+                f"! {name} grew to {value}, this is usually a leak if it keeps growing",
+                extra=dict(memory_stats=stats._asdict()),
+            )
+            self.metrics.increment("memory_warnings", name)
+            while level <= value:
+                level *= 2
+            self._levels[name] = level
+
+    def top_growth(self, limit: int = 10) -> List[tracemalloc.StatisticDiff]:
+        """The source lines whose traced memory grew the most since `start()`."""
+        if self._baseline is None or not self.tracing:
+            return []
+        snapshot = tracemalloc.take_snapshot().filter_traces(
+            (tracemalloc.Filter(False, tracemalloc.__file__),)
+        )
+        return snapshot.compare_to(self._baseline, "lineno")[:limit]
+
+    def reset(self) -> None:
+        self.allocations.clear()
+        self._levels.clear()
+        if self.tracing:
+            self._baseline = tracemalloc.take_snapshot()
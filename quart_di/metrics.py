@@ -0,0 +1,43 @@
+import logging
+from collections import Counter
+from typing import Dict
+from typing import Hashable
+from typing import Tuple
+
+
+__all__ = ("Metrics",)
+
+logger = logging.getLogger(__name__)
+
+MetricKey = Tuple[str, Tuple[Hashable, ...]]
+
+
+class Metrics:
+    """Counters the extension records about dependency injection, keyed by name and labels.
+
+    ```python
+    di.metrics.get("validation_skipped", "internal.sync_users", "JsonBody")
+    ```
+    """
+
+    def __init__(self):
+        self.counters: Counter = Counter()
+
+    def __repr__(self):
+        return f"{type(self).__name__}(counters={dict(self.counters)!r})"
+
+    def increment(self, name: str, *labels: Hashable, amount: int = 1) -> None:
+        self.counters[(name, labels)] += amount
+        logger.debug(f"{name} {labels!r} += {amount}")
+
+    def get(self, name: str, *labels: Hashable) -> int:
+        return self.counters[(name, labels)]
+
+    def total(self, name: str) -> int:
+        return sum(count for (key, _), count in self.counters.items() if key == name)
+
+    def snapshot(self) -> Dict[MetricKey, int]:
+        return dict(self.counters)
+
+    def reset(self) -> None:
+        self.counters.clear()
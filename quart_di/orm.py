@@ -0,0 +1,111 @@
+from typing import Any
+from typing import Callable
+from typing import Collection
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+from quart_di.compat import sqlalchemy
+
+
+if sqlalchemy is not None:
+    from sqlalchemy.engine import Row
+    from sqlalchemy.orm import Mapper
+    from sqlalchemy.orm.attributes import instance_dict
+    from sqlalchemy.orm.instrumentation import manager_of_class
+
+    ROW_TYPES: Tuple[type, ...] = (Row,)
+else:
+    ROW_TYPES = ()
+
+
+__all__ = ("MappedAttributes", "encode_mapped", "encode_row", "get_mapped_attributes")
+
+# values of these types are encoded as is
+SCALAR_TYPES = (str, int, float, bool, type(None))
+
+_mapped_attributes: Dict[type, "MappedAttributes"] = {}
+
+
+class MappedAttributes(NamedTuple):
+    columns: Tuple[str, ...]
+    relationships: Tuple[str, ...]
+    # the aliases of pydantic fields, like SQLModel's, that differ from their attribute keys
+    aliases: Dict[str, str] = {}
+
+
+def get_mapped_attributes(cls: type) -> Optional[MappedAttributes]:
+    """The keys of a SQLAlchemy mapped class's attributes, `None` when the class isn't mapped.
+
+    They are read from the class's mapper once and cached by class.  Unmapped classes aren't
+    cached, they can be mapped later, by `registry.map_imperatively()` for one, and checking
+    them again only reads their class manager.
+    """
+    try:
+        return _mapped_attributes[cls]
+    except KeyError:
+        pass
+
+    if sqlalchemy is None or manager_of_class(cls) is None:
+        return None
+    mapper = sqlalchemy.inspect(cls, raiseerr=False)
+    if not isinstance(mapper, Mapper):
+        return None
+
+    fields = getattr(cls, "__fields__", None) or {}
+    attributes = MappedAttributes(
+        columns=tuple(prop.key for prop in mapper.column_attrs),
+        relationships=tuple(prop.key for prop in mapper.relationships),
+        aliases={name: field.alias for name, field in fields.items() if field.alias != name},
+    )
+    _mapped_attributes[cls] = attributes
+    return attributes
+
+
+def encode_mapped(
+    obj: Any,
+    attributes: MappedAttributes,
+    encode: Callable[[Any], Any],
+    include: Optional[Collection[str]] = None,
+    exclude: Optional[Collection[str]] = None,
+    exclude_none: bool = False,
+    by_alias: bool = True,
+) -> Dict[str, Any]:
+    """Encode the loaded attributes of a mapped instance, encoding non scalar values with `encode`.
+
+    Values are read from the instance's state, attributes that aren't loaded, like deferred or
+    expired columns and relationships that weren't loaded, are left out instead of loading them.
+    `include` and `exclude` name attributes, with `by_alias` they are encoded under their
+    fields' aliases like pydantic's `dict()` does.
+    """
+    state = instance_dict(obj)
+    aliases = attributes.aliases if by_alias else {}
+    encoded = {}
+    for keys in (attributes.columns, attributes.relationships):
+        for key in keys:
+            if key not in state:
+                continue
+            if include is not None and key not in include:
+                continue
+            if exclude is not None and key in exclude:
+                continue
+
+            value = state[key]
+            name = aliases.get(key, key)
+            if value is None:
+                if not exclude_none:
+                    encoded[name] = None
+            elif type(value) in SCALAR_TYPES:
+                encoded[name] = value
+            else:
+                encoded[name] = encode(value)
+    return encoded
+
+
+def encode_row(row: Any, encode: Callable[[Any], Any]) -> Dict[str, Any]:
+    """Encode a result row as a mapping of its column or entity names to their values."""
+    return {
+        key: value if type(value) in SCALAR_TYPES else encode(value)
+        for key, value in zip(row._fields, row)
+    }
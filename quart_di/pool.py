@@ -0,0 +1,266 @@
+import asyncio
+import inspect
+import logging
+import time
+from collections import deque
+from typing import Any
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+
+import anyio
+from di.dependant import Dependant
+from di.dependant import Marker
+from quart import Quart
+from werkzeug.exceptions import ServiceUnavailable
+
+from quart_di.compat import get_type
+from quart_di.util import maybe_await
+
+
+__all__ = ("Pool", "PoolLease", "PoolStats")
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_REAP_INTERVAL = 10.0
+
+
+def close_resource(resource: Any) -> Any:
+    for name in ("aclose", "close"):
+        close = getattr(resource, name, None)
+        if callable(close):
+            return close()
+
+
+class PoolStats(NamedTuple):
+    size: int
+    idle: int
+    in_use: int
+    waiting: int
+    min_size: int
+    max_size: int
+    acquired: int
+    timeouts: int
+
+    @property
+    def utilization(self) -> float:
+        return self.in_use / self.max_size
+
+
+class Pool:
+    """An async pool of resources such as connections, leased to requests with `Pooled[T]`.
+
+    Idle resources are reused most recently released first, health checked before they're handed
+    out and closed once they've been idle for `max_idle` seconds, down to `min_size`.  While the
+    pool is open, a reaper task evicts idle resources and refills the pool up to `min_size` every
+    `reap_interval` seconds, so this also happens when there's no traffic.
+    """
+
+    def __init__(
+        self,
+        factory: Callable[[], Any],
+        *,
+        min_size: int = 0,
+        max_size: int = 10,
+        health_check: Optional[Callable[[Any], Any]] = None,
+        max_idle: Optional[float] = None,
+        acquire_timeout: Optional[float] = None,
+        reap_interval: Optional[float] = DEFAULT_REAP_INTERVAL,
+        close: Callable[[Any], Any] = close_resource,
+        timer: Callable[[], float] = time.monotonic,
+    ):
+        if not 0 <= min_size <= max_size or max_size < 1:
+            raise ValueError("pool sizes must satisfy 0 <= min_size <= max_size and max_size >= 1")
+
+        self.factory = factory
+        self.min_size = min_size
+        self.max_size = max_size
+        self.health_check = health_check
+        self.max_idle = max_idle
+        self.acquire_timeout = acquire_timeout
+        self.reap_interval = reap_interval
+        self.close_resource = close
+        self.timer = timer
+
+        self._idle: Deque[Tuple[Any, float]] = deque()
+        self._in_use = 0
+        self._waiting = 0
+        self._acquired = 0
+        self._timeouts = 0
+        self._closed = False
+        self._semaphore: Optional[asyncio.Semaphore] = None
+        self._reaper: Optional[asyncio.Task] = None
+
+    def __repr__(self):
+        return f"{type(self).__name__}(factory={self.factory!r}, max_size={self.max_size!r})"
+
+    @property
+    def size(self) -> int:
+        return len(self._idle) + self._in_use
+
+    def stats(self) -> PoolStats:
+        return PoolStats(
+            size=self.size,
+            idle=len(self._idle),
+            in_use=self._in_use,
+            waiting=self._waiting,
+            min_size=self.min_size,
+            max_size=self.max_size,
+            acquired=self._acquired,
+            timeouts=self._timeouts,
+        )
+
+    async def open(self) -> None:
+        self._closed = False
+        await self._fill()
+        if self.reap_interval and self._reaper is None:
+            self._reaper = asyncio.get_running_loop().create_task(self._reap_periodically())
+
+    async def close(self) -> None:
+        self._closed = True
+        reaper, self._reaper = self._reaper, None
+        if reaper is not None:
+            reaper.cancel()
+            try:
+                await reaper
+            except asyncio.CancelledError:
+                pass
+        while self._idle:
+            resource, _ = self._idle.pop()
+            await self._discard(resource)
+        self._semaphore = None
+
+    async def acquire(self) -> Any:
+        if self._closed:
+            raise RuntimeError(f"{self!r} is closed")
+
+        semaphore = self._get_semaphore()
+        self._waiting += 1
+        acquired = False
+        try:
+            # unlike wait_for, a permit acquired as the timeout expires isn't lost
+            with anyio.move_on_after(self.acquire_timeout):
+                await semaphore.acquire()
+                acquired = True
+        finally:
+            self._waiting -= 1
+        if not acquired:
+            self._timeouts += 1
+            raise ServiceUnavailable(f"Timed out acquiring a resource from {self!r}")
+
+        try:
+            resource = await self._checkout()
+        except BaseException:
+            semaphore.release()
+            raise
+
+        self._in_use += 1
+        self._acquired += 1
+        return resource
+
+    async def release(self, resource: Any) -> None:
+        self._in_use -= 1
+        try:
+            if self._closed:
+                await self._discard(resource)
+            else:
+                self._idle.append((resource, self.timer()))
+                await self._evict_idle()
+        finally:
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def reap(self) -> None:
+        """Close resources idle for `max_idle` seconds and refill the pool up to `min_size`."""
+        await self._evict_idle()
+        await self._fill()
+
+    async def _reap_periodically(self) -> None:
+        while not self._closed:
+            await asyncio.sleep(self.reap_interval)
+            try:
+                await self.reap()
+            except Exception:
+                logger.exception(f"error raised while reaping {self!r}")
+
+    async def _fill(self) -> None:
+        while not self._closed and self.size < self.min_size:
+            self._idle.append((await self._create(), self.timer()))
+
+    def _get_semaphore(self) -> asyncio.Semaphore:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_size - self._in_use)
+        return self._semaphore
+
+    async def _checkout(self) -> Any:
+        await self._evict_idle()
+        while self._idle:
+            resource, _ = self._idle.pop()
+            if await self._is_healthy(resource):
+                return resource
+            await self._discard(resource)
+        return await self._create()
+
+    async def _evict_idle(self) -> None:
+        if self.max_idle is None:
+            return
+
+        now = self.timer()
+        while self._idle and self.size > self.min_size and now - self._idle[0][1] >= self.max_idle:
+            resource, _ = self._idle.popleft()
+            await self._discard(resource)
+
+    async def _create(self) -> Any:
+        return await maybe_await(self.factory())
+
+    async def _is_healthy(self, resource: Any) -> bool:
+        if self.health_check is None:
+            return True
+
+        try:
+            return bool(await maybe_await(self.health_check(resource)))
+        except Exception:
+            logger.exception("health check raised, discarding pooled resource")
+            return False
+
+    async def _discard(self, resource: Any) -> None:
+        try:
+            await maybe_await(self.close_resource(resource))
+        except Exception:
+            logger.exception("error raised while closing pooled resource")
+
+
+def get_pool(app: Quart, resource_type: type) -> Pool:
+    from quart_di.extension import QuartDI
+
+    try:
+        return app.extensions[QuartDI.EXTENSION_KEY].pools[resource_type]
+    except KeyError:
+        raise LookupError(f"No pool registered for {resource_type!r}") from None
+
+
+class PoolLease(Marker):
+    def __init__(self):
+        self._leases: Dict[type, Callable] = {}
+        super().__init__(call=None, scope="request", use_cache=True)
+
+    def register_parameter(self, param: inspect.Parameter) -> Dependant[Any]:
+        resource_type = get_type(param)
+
+        # share one lease function per type so a request holds a single lease per pool
+        if resource_type not in self._leases:
+
+            async def lease(app: Quart):
+                pool = get_pool(app, resource_type)
+                resource = await pool.acquire()
+                try:
+                    yield resource
+                finally:
+                    await pool.release(resource)
+
+            self._leases[resource_type] = lease
+
+        return Dependant(self._leases[resource_type], scope="request")
@@ -0,0 +1,186 @@
+import cProfile
+import json
+import logging
+import os
+import random
+import re
+import time
+import uuid
+from contextlib import asynccontextmanager
+from typing import Any
+from typing import AsyncIterator
+from typing import Dict
+from typing import Optional
+
+import anyio
+from di.api.dependencies import DependantBase
+from di.container import Container
+from quart.wrappers import Request
+
+from quart_di.metrics import Metrics
+from quart_di.util import get_provider_label
+from quart_di.util import get_provider_name
+from quart_di.util import is_default_value
+
+
+__all__ = ("Profiler",)
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_PROFILE_BYTES = 50 * 1024 * 1024
+
+
+class Profiler:
+    """Profiles a sample of injected views with `cProfile`, from solving to encoding the result.
+
+    A request is profiled when it carries the debug `header`, with a value matching `token` if
+    one is set, or at random for `sample_rate` of requests.  Overhead is bounded by profiling one
+    request at a time and at most one every `min_interval` seconds, requests arriving meanwhile
+    aren't profiled.  Each profile is written to `directory` as a `.prof` file loadable with
+    `pstats`, next to a `.json` file with the route and its dependencies.  The oldest profiles are
+    removed to keep at most `max_files` of them and `max_bytes` in total.
+
+    The event loop runs every request on one thread, so a profile also includes whatever other
+    requests ran while the sampled one was awaiting.
+    """
+
+    def __init__(
+        self,
+        directory: str,
+        sample_rate: float = 0.0,
+        header: Optional[str] = None,
+        token: Optional[str] = None,
+        min_interval: float = 1.0,
+        max_files: int = 100,
+        max_bytes: int = DEFAULT_MAX_PROFILE_BYTES,
+        metrics: Optional[Metrics] = None,
+    ):
+        self.directory = directory
+        self.sample_rate = sample_rate
+        self.header = header
+        self.token = token
+        self.min_interval = min_interval
+        self.max_files = max_files
+        self.max_bytes = max_bytes
+        self.metrics = metrics or Metrics()
+        self._active = False
+        self._last_started: Optional[float] = None
+
+    def __repr__(self):
+        return (
+            f"{type(self).__name__}(directory={self.directory!r}, "
+            f"sample_rate={self.sample_rate!r}, header={self.header!r})"
+        )
+
+    def get_trigger(self, request: Request) -> Optional[str]:
+        """Why `request` should be profiled, `None` when it shouldn't."""
+        if self.header is not None and self.header in request.headers:
+            if self.token is None or request.headers[self.header] == self.token:
+                return "header"
+        if self.sample_rate > 0 and random.random() < self.sample_rate:
+            return "sample"
+        return None
+
+    def _acquire(self, trigger: str) -> bool:
+        now = time.monotonic()
+        if self._active:
+            self.metrics.increment("profiles_skipped", "busy", trigger)
+            return False
+        if self._last_started is not None and now - self._last_started < self.min_interval:
+            self.metrics.increment("profiles_skipped", "rate_limited", trigger)
+            return False
+        self._active = True
+        self._last_started = now
+        return True
+
+    @asynccontextmanager
+    async def profile(
+        self, request: Request, dependant: DependantBase, container: Container
+    ) -> AsyncIterator[None]:
+        trigger = self.get_trigger(request)
+        if trigger is None or not self._acquire(trigger):
+            yield
+            return
+
+        profile = cProfile.Profile()
+        try:
+            profile.enable()
+        except ValueError:
+            # another profiler is active on this thread
+            self._active = False
+            self.metrics.increment("profiles_skipped", "busy", trigger)
+            yield
+            return
+
+        started = time.time()
+        error = None
+        try:
+            yield
+        except BaseException as err:
+            error = type(err).__name__
+            raise
+        finally:
+            profile.disable()
+            self._active = False
+            metadata = {
+                "endpoint": request.endpoint,
+                "rule": request.url_rule.rule if request.url_rule is not None else None,
+                "method": request.method,
+                "path": request.path,
+                "trigger": trigger,
+                "started": started,
+                "duration": time.time() - started,
+                "error": error,
+                "dependencies": _get_dependencies(container, dependant),
+            }
+            try:
+                await anyio.to_thread.run_sync(self._write, profile, metadata)
+            except Exception:
+                logger.exception(f"! failed to write profile of {request.endpoint}")
+
+    def _write(self, profile: cProfile.Profile, metadata: Dict[str, Any]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        endpoint = re.sub(r"[^\w.-]", "_", metadata["endpoint"] or "unknown")
+        name = f"{int(metadata['started'] * 1000)}-{endpoint}-{uuid.uuid4().hex[:8]}"
+        path = os.path.join(self.directory, name)
+
+        profile.dump_stats(f"{path}.prof")
+        with open(f"{path}.json", "w") as file:
+            json.dump(metadata, file, indent=2)
+
+        self.metrics.increment("profiles_written", metadata["endpoint"], metadata["trigger"])
+        logger.info(f"wrote profile of {metadata['endpoint']} to {path}.prof")
+        self._prune()
+
+    def _prune(self) -> None:
+        profiles = []
+        for entry in os.scandir(self.directory):
+            if entry.name.endswith(".prof"):
+                base = entry.path[: -len(".prof")]
+                size = entry.stat().st_size
+                if os.path.exists(f"{base}.json"):
+                    size += os.path.getsize(f"{base}.json")
+                profiles.append((entry.stat().st_mtime, base, size))
+
+        profiles.sort()
+        total = sum(size for _, _, size in profiles)
+        while profiles and (len(profiles) > self.max_files or total > self.max_bytes):
+            _, base, size = profiles.pop(0)
+            for path in (f"{base}.prof", f"{base}.json"):
+                try:
+                    os.remove(path)
+                except FileNotFoundError:
+                    pass
+            total -= size
+
+
+def _get_dependencies(container: Container, dependant: DependantBase) -> Dict[str, Any]:
+    try:
+        solved = container.solve(dependant, scopes=("app", "request"))
+    except Exception as err:
+        return {"error": repr(err)}
+    return {
+        get_provider_label(dep): {"scope": dep.scope, "cached": dep.use_cache}
+        for dep in solved.dag
+        if not is_default_value(get_provider_name(dep))
+    }
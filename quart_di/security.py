@@ -8,6 +8,7 @@ from typing import Optional
 from typing import Tuple
 from typing import TypeVar
 
+import anyio
 from di.dependant import Dependant
 from di.dependant import Injectable
 from pydantic import BaseModel
@@ -124,8 +125,22 @@ class RequiredSecuritySchemes(BaseModel, Injectable):
     @classmethod
     async def extract(cls, request: Request) -> Any:
         data = {}
-        for field in cls.__fields__.values():
-            data[field.name] = await field.type_.extract(request)
+        errors = []
+
+        async def extract_field(field, cancel_scope):
+            try:
+                data[field.name] = await field.type_.extract(request)
+            except Exception as e:
+                # every scheme is required, so the first failure decides the outcome
+                errors.append(e)
+                cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for field in cls.__fields__.values():
+                task_group.start_soon(extract_field, field, task_group.cancel_scope)
+
+        if errors:
+            raise errors[0]
         return cls(**data)
 
     class Config:
@@ -133,21 +148,33 @@ class RequiredSecuritySchemes(BaseModel, Injectable):
 
 
 class AlternativeSecuritySchemes(BaseModel, Injectable):
+    first_completed: ClassVar[bool] = False
+
     def __init_subclass__(cls) -> None:
         return super().__init_subclass__(call=cls.extract, scope="request")
 
     @classmethod
     async def extract(cls, request: Request) -> Any:
-        data = {}
-        err = None
-        for field in cls.__fields__.values():
+        data = dict.fromkeys(cls.__fields__)
+        errors = {}
+
+        async def extract_field(field, cancel_scope):
             try:
                 data[field.name] = await field.type_.extract(request)
             except Exception as e:
-                err = e
-                data[field.name] = None
-        if not any(data.values()) and err:
-            raise err
+                errors[field.name] = e
+                return
+
+            if cls.first_completed and data[field.name]:
+                cancel_scope.cancel()
+
+        async with anyio.create_task_group() as task_group:
+            for field in cls.__fields__.values():
+                task_group.start_soon(extract_field, field, task_group.cancel_scope)
+
+        if not any(data.values()) and errors:
+            # raise the error of the last failing scheme in declaration order
+            raise next(errors[name] for name in reversed(cls.__fields__) if name in errors)
         return cls(**data)
 
     class Config:
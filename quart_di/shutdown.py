@@ -0,0 +1,158 @@
+import asyncio
+import logging
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import Mapping
+from typing import NamedTuple
+from typing import Optional
+from typing import Set
+
+
+__all__ = ("ConcurrentExitStack", "FinalizerTiming")
+
+logger = logging.getLogger(__name__)
+
+
+class FinalizerTiming(NamedTuple):
+    name: str
+    duration: Optional[float]
+    error: Optional[BaseException] = None
+
+
+class _Entry:
+    __slots__ = ("cm", "call", "is_async", "done")
+
+    def __init__(self, cm: Any, is_async: bool):
+        self.cm = cm
+        # di wraps generator providers with contextlib, which keeps the provider as `func`
+        self.call = getattr(cm, "func", None)
+        self.is_async = is_async
+        self.done: Optional[asyncio.Event] = None
+
+    @property
+    def name(self) -> str:
+        call = self.call if self.call is not None else self.cm
+        return getattr(call, "__qualname__", None) or repr(call)
+
+    async def close(self) -> None:
+        if self.is_async:
+            await self.cm.__aexit__(None, None, None)
+        else:
+            self.cm.__exit__(None, None, None)
+
+
+class ConcurrentExitStack:
+    """An exit stack for the app scope that runs independent finalizers concurrently.
+
+    It stands in for the scope's `AsyncExitStack`.  A provider's finalizer waits for the
+    finalizers of the providers that depend on it, as described by `requires`, a mapping of each
+    provider to the providers it depends on.  Providers missing from `requires` are closed in
+    reverse order relative to everything around them, like a regular exit stack would.
+    """
+
+    def __init__(self):
+        self._entries: List[_Entry] = []
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def enter_async_context(self, cm: Any) -> Any:
+        # contextlib drops `func` once entered
+        entry = _Entry(cm, is_async=True)
+        value = await cm.__aenter__()
+        self._entries.append(entry)
+        return value
+
+    def enter_context(self, cm: Any) -> Any:
+        entry = _Entry(cm, is_async=False)
+        value = cm.__enter__()
+        self._entries.append(entry)
+        return value
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    async def aclose(
+        self,
+        requires: Optional[Mapping[Callable, Set[Callable]]] = None,
+        timeout: Optional[float] = None,
+        finalizer_timeout: Optional[float] = None,
+        on_error: Optional[Callable[[str, BaseException], None]] = None,
+    ) -> List[FinalizerTiming]:
+        """Run the finalizers, each bounded by `finalizer_timeout` and all by `timeout` seconds.
+
+        Finalizers that raise, time out or are still running at the deadline are logged and
+        passed to `on_error`, then shutdown carries on with the rest.
+        """
+        entries, self._entries = self._entries, []
+        requires = requires or {}
+        for entry in entries:
+            entry.done = asyncio.Event()
+
+        timings: Dict[_Entry, FinalizerTiming] = {}
+
+        def report(entry: _Entry, err: BaseException) -> None:
+            if on_error is not None:
+                on_error(entry.name, err)
+
+        async def close(index: int, entry: _Entry) -> None:
+            try:
+                for blocker in self._blockers(entries, index, requires):
+                    await blocker.done.wait()
+
+                started = time.perf_counter()
+                try:
+                    await asyncio.wait_for(entry.close(), finalizer_timeout)
+                except asyncio.TimeoutError as err:
+                    logger.error(
+                        f"! finalizer {entry.name} hung, gave up after {finalizer_timeout}s"
+                    )
+                    timings[entry] = FinalizerTiming(entry.name, None, err)
+                    report(entry, err)
+                except Exception as err:
+                    logger.exception(f"error raised while finalizing {entry.name}")
+                    timings[entry] = FinalizerTiming(
+                        entry.name, time.perf_counter() - started, err
+                    )
+                    report(entry, err)
+                else:
+                    timings[entry] = FinalizerTiming(entry.name, time.perf_counter() - started)
+            finally:
+                entry.done.set()
+
+        tasks = {
+            asyncio.ensure_future(close(index, entry)): entry
+            for index, entry in enumerate(entries)
+        }
+        if not tasks:
+            return []
+
+        _, pending = await asyncio.wait(tasks, timeout=timeout)
+        if pending:
+            names = ", ".join(tasks[task].name for task in pending)
+            logger.error(f"! shutdown timed out after {timeout}s, abandoning {names}")
+            for task in pending:
+                task.cancel()
+                err = asyncio.TimeoutError()
+                timings[tasks[task]] = FinalizerTiming(tasks[task].name, None, err)
+                report(tasks[task], err)
+            await asyncio.wait(pending)
+
+        return [timings[entry] for entry in entries if entry in timings]
+
+    @staticmethod
+    def _blockers(
+        entries: List[_Entry], index: int, requires: Mapping[Callable, Set[Callable]]
+    ) -> List[_Entry]:
+        entry = entries[index]
+        blockers = []
+        for later in entries[index + 1 :]:
+            if later.call not in requires or entry.call not in requires:
+                # nothing is known about one of them, keep exit stack order
+                blockers.append(later)
+            elif entry.call in requires[later.call]:
+                blockers.append(later)
+        return blockers
@@ -1,9 +1,11 @@
+import asyncio
 import logging
 import threading
 from typing import Any
 from typing import Dict
 from typing import List
 from typing import Optional
+from typing import Set
 
 from di.container import Container
 from di.container import ContainerState
@@ -27,6 +29,7 @@ current_req_state = LocalProxy(lambda: _ctx_lookup([_req_state_stack]))
 __all__ = (
     "ContainerStateContext",
     "ContainerStateController",
+    "DeferredTeardown",
     "app_states",
     "req_states",
     "create_and_push_app_context",
@@ -88,6 +91,12 @@ class ContainerStateController:
             app=app,
         )
 
+    def __len__(self) -> int:
+        return len(self.stack)
+
+    def __iter__(self):
+        return iter(self.stack)
+
     def push_context(self, state_ctx):
         self.stack.push(state_ctx)
 
@@ -100,24 +109,98 @@ class ContainerStateController:
             logger.warning(f"{self.scope} context popped handler nothing to do, stack is empty")
             return
 
+        # contexts sharing a state owned elsewhere, like the serving app state, have no scope_cm
+        if ctx.scope_cm is not None:
+            try:
+                await ctx.scope_cm.__aexit__(None, None, None)
+            except Exception:
+                logger.exception("error raised while tearing down app context")
+
+        self.stack.pop()
+
+    def detach_context(self):
+        """Pop the current context without tearing it down, so it can be closed later."""
+        ctx = self.get_context()
+        if ctx is None:
+            logger.warning(f"{self.scope} context detached handler nothing to do, stack is empty")
+            return None
+
+        self.stack.pop()
+        return ctx
+
+
+class DeferredTeardown:
+    """Tear detached contexts down in background tasks, at most `concurrency` at a time.
+
+    Used to run request scope finalizers concurrently with sending the response instead of
+    before it.  Finalizers run in another task than the one their dependencies were entered in,
+    so dependencies holding an anyio cancel scope or task group across their `yield` can't be
+    torn down this way.  Once `concurrency` teardowns are pending, `defer()` declines and the
+    caller tears the context down itself.  Errors are logged and counted as `teardown_errors` in
+    `metrics`.
+    """
+
+    def __init__(self, concurrency: int = 100, metrics: Optional[Any] = None):
+        self.concurrency = concurrency
+        self.metrics = metrics
+        self._tasks: Set[asyncio.Task] = set()
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def defer(self, ctx: ContainerStateContext) -> Optional[asyncio.Task]:
+        """Tear `ctx` down in the background, `None` when too many teardowns are pending."""
+        if len(self._tasks) >= self.concurrency:
+            if self.metrics is not None:
+                self.metrics.increment("teardowns_not_deferred", ctx.scope)
+            return None
+
+        task = asyncio.get_running_loop().create_task(self._teardown(ctx))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        return task
+
+    async def drain(self, timeout: Optional[float] = None) -> None:
+        """Wait for pending teardowns, cancelling any still running after `timeout` seconds."""
+        if not self._tasks:
+            return
+
+        _, pending = await asyncio.wait(set(self._tasks), timeout=timeout)
+        for task in pending:
+            logger.warning(f"cancelling deferred {task!r} still running after {timeout}s")
+            task.cancel()
+        if pending:
+            await asyncio.wait(pending)
+
+    async def _teardown(self, ctx: ContainerStateContext) -> None:
         try:
             await ctx.scope_cm.__aexit__(None, None, None)
         except Exception:
-            logger.exception("error raised while tearing down app context")
-
-        self.stack.pop()
+            logger.exception(f"error raised while tearing down deferred {ctx.scope} context")
+            if self.metrics is not None:
+                self.metrics.increment("teardown_errors", ctx.scope)
 
 
 app_states = ContainerStateController("app", _app_state_stack)
 req_states = ContainerStateController("request", _req_state_stack)
 
 
-async def create_and_push_app_context(app, container, container_state):
-    app_ctx = await app_states.create_context(
-        current_state=container_state,
-        container=container,
-        app=app,
-    )
+async def create_and_push_app_context(app, container, container_state, serving_ctx=None):
+    if serving_ctx is not None:
+        # while serving every app context shares the serving state so app scoped values live
+        # as long as the app, the serving state is torn down by after_serving
+        app_ctx = ContainerStateContext.with_metadata(
+            container=container,
+            scope=serving_ctx.scope,
+            state=serving_ctx.state,
+            app=app,
+        )
+    else:
+        app_ctx = await app_states.create_context(
+            current_state=container_state,
+            container=container,
+            app=app,
+        )
     app_states.push_context(app_ctx)
 
 
@@ -0,0 +1,142 @@
+import contextvars
+import json
+import math
+import time
+from collections import deque
+from typing import Awaitable
+from typing import Callable
+from typing import Deque
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+import anyio
+from di.api.executor import StateType
+from di.api.executor import SupportsTaskGraph
+from di.api.executor import Task
+from di.executors import AsyncExecutor
+
+from quart_di.util import get_provider_key
+from quart_di.util import get_provider_label
+
+
+__all__ = ("DependencyTimings", "execute_task", "percentile", "TimingExecutor", "TimingSummary")
+
+
+class TimingSummary(NamedTuple):
+    count: int
+    p50: float
+    p99: float
+
+
+def percentile(samples: Iterable[float], percent: float) -> float:
+    """The nearest rank `percent` percentile of `samples`, 0.0 without samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return 0.0
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
+
+
+def _summarize(samples) -> TimingSummary:
+    return TimingSummary(len(samples), percentile(samples, 50), percentile(samples, 99))
+
+
+class DependencyTimings:
+    """Execution times of dependencies by provider, keeping the last `maxlen` of each.
+
+    Samples are recorded by provider key, see `get_provider_key()`, so closures sharing a name,
+    like the extractors of different parameters, aren't merged.  `summaries()` and `dump()` report
+    them by label, see `get_provider_label()`, and summaries loaded from a dump are looked up by
+    label.  Cache hits are recorded too, so a shared dependency's p50 reflects how cheap it is to
+    reuse.
+    """
+
+    def __init__(self, maxlen: int = 1024):
+        self.maxlen = maxlen
+        self._samples: Dict[Hashable, Deque[float]] = {}
+        self._labels: Dict[Hashable, str] = {}
+        self._loaded: Dict[str, TimingSummary] = {}
+
+    def __len__(self) -> int:
+        return len(self.summaries())
+
+    def record(self, key: Hashable, duration: float, label: Optional[str] = None) -> None:
+        samples = self._samples.get(key)
+        if samples is None:
+            samples = self._samples[key] = deque(maxlen=self.maxlen)
+            self._labels[key] = label if label is not None else str(key)
+        samples.append(duration)
+
+    def summary(self, key: Hashable, label: Optional[str] = None) -> Optional[TimingSummary]:
+        samples = self._samples.get(key)
+        if not samples:
+            return self._loaded.get(label if label is not None else str(key))
+        return _summarize(samples)
+
+    def summaries(self) -> Dict[str, TimingSummary]:
+        """Summaries by label, merging the samples of providers sharing a label."""
+        by_label: Dict[str, List[float]] = {}
+        for key, samples in self._samples.items():
+            by_label.setdefault(self._labels[key], []).extend(samples)
+
+        summaries = dict(self._loaded)
+        summaries.update(
+            (label, _summarize(samples)) for label, samples in by_label.items() if samples
+        )
+        return summaries
+
+    def dump(self, path: str) -> None:
+        with open(path, "w") as file:
+            json.dump(
+                {label: summary._asdict() for label, summary in self.summaries().items()}, file
+            )
+
+    def load(self, path: str) -> None:
+        """Load summaries written by `dump()`, live samples take precedence over them."""
+        with open(path) as file:
+            self._loaded.update(
+                (label, TimingSummary(**summary)) for label, summary in json.load(file).items()
+            )
+
+    def reset(self) -> None:
+        self._samples.clear()
+        self._labels.clear()
+        self._loaded.clear()
+
+
+async def execute_task(task: Task[StateType], state: StateType) -> None:
+    """Execute a task the way di's executors do, in a thread if it's `sync_to_thread`."""
+    if getattr(task.dependant, "sync_to_thread", False):
+        await anyio.to_thread.run_sync(contextvars.copy_context().run, task.compute, state)
+    else:
+        maybe_aw = task.compute(state)
+        if maybe_aw is not None:
+            await maybe_aw
+
+
+class TimingExecutor(AsyncExecutor):
+    """An `AsyncExecutor` recording how long each dependency takes to execute.
+
+    Tasks are executed with `execute`, to time another executor's way of executing them.
+    """
+
+    def __init__(
+        self,
+        timings: DependencyTimings,
+        execute: Callable[[Task[StateType], StateType], Awaitable[None]] = execute_task,
+    ):
+        self.timings = timings
+        self.execute = execute
+
+    async def execute_async(self, tasks: SupportsTaskGraph[StateType], state: StateType) -> None:
+        for task in tasks.static_order():
+            started = time.perf_counter()
+            await self.execute(task, state)
+            duration = time.perf_counter() - started
+            dependant = task.dependant
+            self.timings.record(
+                get_provider_key(dependant), duration, get_provider_label(dependant)
+            )
@@ -4,15 +4,19 @@ from collections import defaultdict
 from enum import Enum
 from pathlib import PurePath
 import inspect
+from functools import partial
 from types import GeneratorType
 from typing import Optional, Any, Tuple, Type, NamedTuple, Callable, Dict, List, Set, Union
+from typing import Hashable, Mapping
 
 from di.dependant import Marker
+from di.typing import get_parameters
 from pydantic import BaseModel, BaseConfig
 from pydantic.json import ENCODERS_BY_TYPE
 from pydantic.fields import ModelField
 
 from quart_di.compat import get_args, _AnnotatedAlias
+from quart_di.orm import encode_mapped, encode_row, get_mapped_attributes, ROW_TYPES
 
 SetIntStr = Set[Union[int, str]]
 DictIntStrAny = Dict[Union[int, str], Any]
@@ -23,8 +27,19 @@ __all__ = (
     "inspect_annotation",
     "model_field_from_param",
     "get_task_id",
+    "wrap_provider",
+    "make_cache_key",
+    "maybe_await",
+    "get_provider_name",
+    "get_provider_label",
+    "get_provider_key",
+    "is_default_value",
+    "PROVIDER_SOURCE_ATTRIBUTE",
 )
 
+# set on extractors to the name of the value they extract, to tell them apart in reports
+PROVIDER_SOURCE_ATTRIBUTE = "__quart_di_source__"
+
 
 def resolve_name(param_name, alias=None, convert_underscores=False):
     if alias is not None:
@@ -125,6 +140,29 @@ def jsonable_encoder(
         include = set(include)
     if exclude is not None and not isinstance(exclude, (set, dict)):
         exclude = set(exclude)
+    attributes = get_mapped_attributes(type(obj))
+    if attributes is not None and not exclude_unset and not exclude_defaults:
+        # read the loaded attributes straight from the instance, see `encode_mapped()`
+        encoders = getattr(getattr(obj, "__config__", None), "json_encoders", None)
+        if encoders:
+            custom_encoder = {**encoders, **custom_encoder}
+        encode = partial(
+            jsonable_encoder,
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            custom_encoder=custom_encoder,
+            sqlalchemy_safe=sqlalchemy_safe,
+        )
+        return encode_mapped(obj, attributes, encode, include, exclude, exclude_none, by_alias)
+    if isinstance(obj, ROW_TYPES):
+        encode = partial(
+            jsonable_encoder,
+            by_alias=by_alias,
+            exclude_none=exclude_none,
+            custom_encoder=custom_encoder,
+            sqlalchemy_safe=sqlalchemy_safe,
+        )
+        return encode_row(obj, encode)
     if isinstance(obj, BaseModel):
         encoder = getattr(obj.__config__, "json_encoders", {})
         if custom_encoder:
@@ -232,3 +270,78 @@ def get_task_id():
         return
 
     return id(task)
+
+
+def wrap_provider(call: Callable, wrapper: Callable) -> Callable:
+    """Give ``wrapper`` the wiring of ``call``.
+
+    Unlike ``functools.wraps`` this doesn't set ``__wrapped__``, which di follows when deciding
+    whether a provider is a coroutine, generator or plain function.
+    """
+    params = get_parameters(call)
+    wrapper.__signature__ = inspect.Signature(list(params.values()))
+    wrapper.__annotations__ = {
+        name: param.annotation
+        for name, param in params.items()
+        if param.annotation is not param.empty
+    }
+    wrapper.__name__ = getattr(call, "__name__", type(call).__name__)
+    wrapper.__qualname__ = getattr(call, "__qualname__", wrapper.__name__)
+    wrapper.__module__ = getattr(call, "__module__", None)
+    return wrapper
+
+
+def make_cache_key(arguments: Mapping[str, Any]) -> Hashable:
+    key = []
+    for name, value in sorted(arguments.items()):
+        try:
+            hash(value)
+        except TypeError:
+            value = repr(value)
+        key.append((name, value))
+    return tuple(key)
+
+
+async def maybe_await(value: Any) -> Any:
+    if inspect.isawaitable(value):
+        return await value
+    return value
+
+
+def _get_call(dependant: Any) -> Any:
+    call = getattr(dependant, "call", dependant)
+    while isinstance(call, partial):
+        call = call.func
+    return call
+
+
+def get_provider_name(dependant: Any) -> str:
+    """A readable name for a dependant's provider, or a provider, stable across requests."""
+    call = _get_call(dependant)
+    return getattr(call, "__qualname__", None) or getattr(call, "__name__", None) or repr(call)
+
+
+def get_provider_label(dependant: Any) -> str:
+    """The provider's name, followed by the name of the value it extracts for extractors.
+
+    Closures share their qualname, like every header extractor's, the source name tells them
+    apart: `HeaderParam.register_parameter.<locals>.get_header(x-tenant)`.
+    """
+    name = get_provider_name(dependant)
+    source = getattr(_get_call(dependant), PROVIDER_SOURCE_ATTRIBUTE, None)
+    return f"{name}({source})" if source is not None else name
+
+
+def get_provider_key(dependant: Any) -> Hashable:
+    """Identifies a dependant's provider within this process, unlike its name or label."""
+    call = _get_call(dependant)
+    try:
+        hash(call)
+    except TypeError:
+        return get_provider_label(dependant)
+    return call
+
+
+def is_default_value(name: str) -> bool:
+    """Whether a provider name is di's stand in returning a parameter's default value."""
+    return name.endswith("<locals>.inject_default_value")
@@ -0,0 +1,64 @@
+from typing import Any
+from typing import Mapping
+from typing import Optional
+from typing import Type
+
+from pydantic import BaseModel
+from pydantic.fields import ModelField
+
+from quart_di.metrics import Metrics
+
+
+__all__ = ("VALIDATE_ATTRIBUTE", "Validation")
+
+VALIDATE_ATTRIBUTE = "__quart_di_validate__"
+
+
+class Validation:
+    """How extractors handle the current request's inputs.
+
+    Trusted requests, from views injected with `inject(validate=False)` or blueprints listed in
+    `QUART_DI_TRUSTED_BLUEPRINTS`, build models with `construct()` and pass scalars through
+    without coercion.  Every skipped validation is counted in the extension's metrics.
+    """
+
+    __slots__ = ("enabled", "metrics", "endpoint")
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        metrics: Optional[Metrics] = None,
+        endpoint: Optional[str] = None,
+    ):
+        self.enabled = enabled
+        self.metrics = metrics
+        self.endpoint = endpoint
+
+    def __repr__(self):
+        return f"{type(self).__name__}(enabled={self.enabled!r}, endpoint={self.endpoint!r})"
+
+    def parse_obj(self, model: Type[BaseModel], data: Any, extractor: str) -> BaseModel:
+        if self.enabled or not isinstance(data, Mapping) or self._missing_required(model, data):
+            return model.parse_obj(data)
+
+        self._skipped(extractor)
+        return model.construct(**data)
+
+    def validate(self, field: ModelField, value: Any, extractor: str) -> Any:
+        if self.enabled:
+            return field.validate(value, {}, loc=field.name)[0]
+
+        self._skipped(extractor)
+        return value
+
+    @staticmethod
+    def _missing_required(model: Type[BaseModel], data: Mapping) -> bool:
+        # constructing without a required value would leave the attribute unset
+        return any(
+            field.required and field.alias not in data and name not in data
+            for name, field in model.__fields__.items()
+        )
+
+    def _skipped(self, extractor: str) -> None:
+        if self.metrics is not None:
+            self.metrics.increment("validation_skipped", self.endpoint, extractor)
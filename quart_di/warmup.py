@@ -0,0 +1,140 @@
+import asyncio
+import logging
+import time
+from typing import Any
+from typing import Dict
+from typing import Hashable
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Set
+
+from di.api.dependencies import DependantBase
+from di.container import Container
+from di.container import ContainerState
+
+from quart_di.util import get_provider_name
+
+
+__all__ = ("ProviderTiming", "find_app_dependants", "warm_up")
+
+logger = logging.getLogger(__name__)
+
+
+class ProviderTiming(NamedTuple):
+    dependant: DependantBase
+    duration: Optional[float]
+    error: Optional[BaseException] = None
+
+    @property
+    def name(self) -> str:
+        return get_provider_name(self.dependant)
+
+
+def find_app_dependants(
+    container: Container, dependants: Iterable[DependantBase], scopes: Sequence[str]
+) -> Dict[DependantBase, Set[Hashable]]:
+    """Solve `dependants` and collect the app scoped dependants in their graphs.
+
+    Returns each app scoped dependant, deduplicated by cache key, with the cache keys of the app
+    scoped dependants it depends on.  Dependants that can't be solved ahead of a request, like
+    views taking path arguments without a marker, are skipped.
+    """
+    found: Dict[Hashable, DependantBase] = {}
+    requires: Dict[Hashable, Set[Hashable]] = {}
+
+    for dependant in dependants:
+        try:
+            solved = container.solve(dependant, scopes=scopes)
+        except Exception as err:
+            logger.debug(f"skipping {dependant!r} which can't be solved ahead of time: {err!r}")
+            continue
+
+        for dep, params in solved.dag.items():
+            if dep.scope != "app":
+                continue
+            found.setdefault(dep.cache_key, dep)
+            requires.setdefault(dep.cache_key, set()).update(
+                param.dependency.cache_key
+                for param in params
+                if param.dependency.scope == "app"
+            )
+
+    return {found[key]: requires[key] & found.keys() for key in found}
+
+
+def _layers(graph: Dict[DependantBase, Set[Hashable]]) -> List[List[DependantBase]]:
+    remaining = dict(graph)
+    built: Set[Hashable] = set()
+    layers = []
+    while remaining:
+        layer = [dep for dep, requires in remaining.items() if requires <= built]
+        if not layer:
+            # di rejects cycles when solving, this is only reachable with a broken graph
+            layer = list(remaining)
+        for dep in layer:
+            del remaining[dep]
+        built.update(dep.cache_key for dep in layer)
+        layers.append(layer)
+    return layers
+
+
+async def _build(
+    container: Container, state: ContainerState, executor: Any, dependant: DependantBase
+) -> ProviderTiming:
+    started = time.perf_counter()
+    try:
+        solved = container.solve(dependant, scopes=("app",))
+        await container.execute_async(solved, executor=executor, state=state)
+    except Exception as err:
+        logger.warning(
+            f"! failed to warm up {get_provider_name(dependant)}, it'll be built on first use",
+            exc_info=err,
+        )
+        return ProviderTiming(dependant, time.perf_counter() - started, err)
+
+    return ProviderTiming(dependant, time.perf_counter() - started)
+
+
+async def warm_up(
+    container: Container,
+    state: ContainerState,
+    executor: Any,
+    graph: Dict[DependantBase, Set[Hashable]],
+    timeout: Optional[float] = None,
+) -> List[ProviderTiming]:
+    """Build the app scoped dependants in `graph` into `state`.
+
+    Dependants whose app scoped dependencies are built are started concurrently, layer by
+    layer, so a dependency shared by several of them is built once.  Anything still building
+    after `timeout` seconds is cancelled and left to be built on first use.
+    """
+    timings: Dict[DependantBase, ProviderTiming] = {}
+    deadline = None if timeout is None else time.monotonic() + timeout
+
+    for layer in _layers(graph):
+        tasks = {
+            asyncio.ensure_future(_build(container, state, executor, dep)): dep for dep in layer
+        }
+        remaining = None if deadline is None else max(deadline - time.monotonic(), 0)
+        done, pending = await asyncio.wait(tasks, timeout=remaining)
+
+        for task in done:
+            timings[tasks[task]] = task.result()
+        for task in pending:
+            task.cancel()
+            timings[tasks[task]] = ProviderTiming(tasks[task], None, asyncio.TimeoutError())
+        if pending:
+            await asyncio.wait(pending)
+            logger.warning(
+                f"! warm up timed out after {timeout}s building "
+                f"{', '.join(get_provider_name(tasks[task]) for task in pending)}"
+            )
+            break
+
+    for timing in timings.values():
+        if timing.error is None:
+            logger.info(f"warmed up {timing.name} in {timing.duration * 1000:.1f}ms")
+    return list(timings.values())
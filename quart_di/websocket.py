@@ -0,0 +1,132 @@
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any
+from typing import AsyncIterator
+from typing import Callable
+from typing import Iterator
+from typing import Optional
+from typing import Union
+
+from di.container import ContainerState
+from di.dependant import Dependant
+from di.dependant import Injectable
+from quart.wrappers import Websocket
+
+
+__all__ = (
+    "Message",
+    "Messages",
+    "WEBSOCKET_SCOPES",
+    "get_current_messages",
+    "handling_messages",
+)
+
+# a connection enters both "connection" and "request", so request scoped providers and binds
+# are reused for the lifetime of the socket
+WEBSOCKET_SCOPES = ("app", "connection", "request", "message")
+
+
+def get_message() -> "Message":
+    raise RuntimeError("Message is only available while handling a websocket message")
+
+
+def get_messages() -> "Messages":
+    raise RuntimeError("Messages is only available in websocket handlers")
+
+
+_current_messages: ContextVar[Optional["Messages"]] = ContextVar(
+    "quart_di_messages", default=None
+)
+
+
+def get_current_messages() -> Optional["Messages"]:
+    """The messages of the websocket connection being handled, `None` outside of one."""
+    return _current_messages.get()
+
+
+@contextmanager
+def handling_messages(messages: "Messages") -> Iterator[None]:
+    """Make `messages` the current connection's, for lazy dependencies resolved in its scopes."""
+    token = _current_messages.set(messages)
+    try:
+        yield
+    finally:
+        _current_messages.reset(token)
+
+
+class Message(Injectable, call=get_message, scope="message"):
+    """The websocket message being handled, injectable into message handlers."""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Union[str, bytes]):
+        self.data = data
+
+    def __repr__(self):
+        return f"{type(self).__name__}(data={self.data!r})"
+
+    def json(self) -> Any:
+        return json.loads(self.data)
+
+
+class Messages(Injectable, call=get_messages, scope="connection"):
+    """The current connection's incoming messages.
+
+    Handlers passed to `handle()` or `serve()` are solved once per connection and executed for
+    each message in a fresh "message" scope, so connection and request scoped dependencies are
+    reused across messages while message scoped ones are set up and torn down around each one.
+
+    ```python
+    async def on_message(message: Message, uow: UnitOfWork) -> dict:
+        ...
+
+    @app.websocket("/ws")
+    async def ws(session: Session, messages: Messages):
+        await messages.serve(on_message)
+    ```
+    """
+
+    def __init__(self, extension: Any, websocket: Websocket, state: ContainerState):
+        self.extension = extension
+        self.websocket = websocket
+        self.state = state
+
+    def __repr__(self):
+        return f"{type(self).__name__}(websocket={self.websocket!r})"
+
+    async def receive(self) -> Message:
+        return Message(await self.websocket.receive())
+
+    async def __aiter__(self) -> AsyncIterator[Message]:
+        while True:
+            yield await self.receive()
+
+    async def handle(self, handler: Callable[..., Any]) -> AsyncIterator[Any]:
+        """Execute `handler` for each message and yield its results."""
+        solved = self.extension.container.solve(
+            Dependant(handler, scope="message"), scopes=WEBSOCKET_SCOPES
+        )
+
+        async for message in self:
+            values = self.extension.get_di_execute_values()
+            values.update({get_message: message, get_messages: self})
+
+            async with self.state.enter_scope("message") as state:
+                result = await self.extension.container.execute_async(
+                    solved, executor=self.extension._executor, state=state, values=values
+                )
+            yield result
+
+    async def serve(self, handler: Callable[..., Any]) -> None:
+        """Execute `handler` for each message and send its results back, skipping `None`."""
+        async for result in self.handle(handler):
+            if result is None:
+                continue
+            if not isinstance(result, (str, bytes)):
+                result = json.dumps(
+                    self.extension.view_result_encoder(
+                        result, **self.extension.view_result_encoder_options
+                    )
+                )
+            await self.websocket.send(result)
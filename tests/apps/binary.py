@@ -0,0 +1,54 @@
+import logging
+from typing import List
+
+from pydantic import BaseModel
+from quart import Blueprint
+
+from quart_di import (
+    Body,
+    CBOR,
+    MSGPACK,
+    Cbor,
+    FromMsgPack,
+    MsgPack,
+    QuartDI,
+)
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Measurements(BaseModel):
+    name: str
+    values: List[float]
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/msgpack")
+async def msgpack_body(body: MsgPack[Measurements], name: FromMsgPack[str], raw: MsgPack):
+    return dict(body=body, name=name, raw=raw)
+
+
+@base.post("/cbor")
+async def cbor_body(body: Cbor[Measurements]):
+    return body
+
+
+@base.post("/raw")
+async def raw_body(
+    as_bytes: Body[bytes], as_bytearray: Body[bytearray], as_memoryview: Body[memoryview]
+):
+    return dict(
+        types=[type(body).__name__ for body in (as_bytes, as_bytearray, as_memoryview)],
+        equal=as_bytes == as_bytearray == as_memoryview,
+        hex=as_memoryview.hex(),
+    )
+
+
+di = QuartDI(decorate_views=True, response_codecs=[MSGPACK, CBOR])
+app = create_app(base, di)
@@ -0,0 +1,52 @@
+import asyncio
+import logging
+
+from quart import Blueprint
+
+from quart_di.compat import Annotated
+from quart_di import Cached, FromHeader, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+TTL = 0.1
+calls = []
+
+
+async def load_tenant_config(x_tenant_id: FromHeader[str]):
+    calls.append(x_tenant_id)
+    return dict(tenant=x_tenant_id, version=len(calls))
+
+
+async def load_exchange_rate(x_tenant_id: FromHeader[str]):
+    calls.append(x_tenant_id)
+    # slow enough that a refresh would show up in request latency
+    await asyncio.sleep(TTL)
+    return dict(tenant=x_tenant_id, version=len(calls))
+
+
+TenantConfig = Annotated[dict, Cached(load_tenant_config, ttl=TTL, maxsize=2)]
+ExchangeRate = Annotated[
+    dict, Cached(load_exchange_rate, ttl=TTL, stale_while_revalidate=60)
+]
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/config")
+async def tenant_config(config: TenantConfig):
+    return config
+
+
+@base.post("/rate")
+async def exchange_rate(rate: ExchangeRate):
+    return rate
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
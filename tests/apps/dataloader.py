@@ -0,0 +1,58 @@
+import asyncio
+import logging
+from typing import List
+
+from di.dependant import Marker
+from quart import Blueprint
+
+from quart_di.compat import Annotated
+from quart_di import BatchLoader, DataLoader, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+batches = []
+
+
+class Users:
+    names = {1: "ann", 2: "bob", 3: "cat"}
+
+
+async def load_users(ids: List[int], users: Annotated[Users, Marker(Users, scope="app")]):
+    batches.append(list(ids))
+    return [users.names.get(id_, KeyError(id_)) for id_ in ids]
+
+
+UserLoader = Annotated[DataLoader, BatchLoader(load_users)]
+
+
+async def get_owner(loader: UserLoader):
+    return await loader.load(1)
+
+
+Owner = Annotated[str, Marker(get_owner, scope="request")]
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/users")
+async def users(owner: Owner, loader: UserLoader):
+    names = await asyncio.gather(loader.load(2), loader.load(3), loader.load(1))
+    return dict(owner=owner, names=list(names))
+
+
+@base.post("/users/missing")
+async def missing_user(loader: UserLoader):
+    found, missing = await asyncio.gather(
+        loader.load(1), loader.load(4), return_exceptions=True
+    )
+    return dict(found=found, missing=repr(missing))
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
@@ -0,0 +1,68 @@
+import asyncio
+import logging
+from typing import List
+
+import anyio
+from anyio.abc import TaskGroup
+from di.dependant import Marker
+from quart import Blueprint
+
+from quart_di import QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+events: List[str] = []
+# created by the tests, inside their event loop
+teardown_started: asyncio.Event
+release_teardown: asyncio.Event
+
+
+async def open_session():
+    events.append("session opened")
+    yield "session"
+    teardown_started.set()
+    await release_teardown.wait()
+    events.append("session committed")
+
+
+async def open_failing_session():
+    yield "session"
+    raise RuntimeError("commit failed")
+
+
+async def open_task_group():
+    async with anyio.create_task_group() as task_group:
+        yield task_group
+
+
+Session = Annotated[str, Marker(open_session, scope="request")]
+FailingSession = Annotated[str, Marker(open_failing_session, scope="request")]
+BackgroundTasks = Annotated[TaskGroup, Marker(open_task_group, scope="request")]
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/orders")
+async def create_order(session: Session):
+    events.append("response returned")
+    return dict(session=session)
+
+
+@base.post("/failing")
+async def failing(session: FailingSession):
+    return dict(session=session)
+
+
+@base.post("/background")
+async def background(task_group: BackgroundTasks):
+    task_group.start_soon(asyncio.sleep, 0)
+    return dict(started=True)
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di, config=dict(QUART_DI_DEFER_TEARDOWN=True))
@@ -0,0 +1,55 @@
+import logging
+
+from di.dependant import Dependant
+from pydantic import BaseModel
+from quart import Blueprint
+
+from quart_di import FromPath, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Status(BaseModel):
+    ok: bool
+    version: str = "1.0"
+
+
+class Session:
+    pass
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/health")
+def health():
+    return Status(ok=True)
+
+
+@base.get("/items/<int:item_id>")
+@base.get("/items", defaults=dict(item_id=None))
+async def show_item(item_id, verbose=False):
+    return dict(item_id=item_id, verbose=verbose)
+
+
+@base.get("/users/<user_id>")
+async def show_user(user_id: FromPath[int]):
+    return dict(user_id=user_id)
+
+
+@base.get("/users/<user_id>/profile")
+async def show_profile(user_id: "FromPath[int]"):
+    return dict(user_id=user_id)
+
+
+@base.get("/session")
+async def show_session(session: Session):
+    return dict(session=type(session).__name__)
+
+
+di = QuartDI(decorate_views=True, binds=[(Session, Dependant(Session, scope="request"))])
+app = create_app(base, di)
@@ -0,0 +1,57 @@
+import logging
+from typing import List, Optional
+
+from pydantic import BaseModel
+from quart import Blueprint
+from quart.datastructures import FileStorage
+
+from quart_di import File, FromForm, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+SPOOL_MAX_SIZE = 16
+handles = []
+
+
+class Profile(BaseModel):
+    name: str
+    age: int
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/upload")
+async def upload(
+    profile: FromForm[Profile],
+    age: FromForm[int],
+    avatar: File[FileStorage],
+    attachments: File[List[FileStorage]],
+    missing: File[Optional[FileStorage]] = None,
+):
+    handles.extend([avatar, *attachments])
+    return dict(
+        profile=profile,
+        age=age,
+        avatar=dict(
+            filename=avatar.filename,
+            content=avatar.read().decode(),
+            rolled_to_disk=avatar.stream._rolled,
+        ),
+        attachments=[attachment.filename for attachment in attachments],
+        missing=missing,
+    )
+
+
+@base.post("/fields")
+async def fields(name: FromForm[str], fields: FromForm):
+    return dict(name=name, fields=dict(fields))
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di, config=dict(QUART_DI_SPOOL_MAX_SIZE=SPOOL_MAX_SIZE))
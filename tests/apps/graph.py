@@ -0,0 +1,72 @@
+import asyncio
+import logging
+
+from di.dependant import Dependant
+from quart import Blueprint
+
+from quart_di import FromQuery, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+DELAY = 0.01
+
+
+class Settings:
+    pass
+
+
+class Session:
+    def __init__(self, settings: Settings):
+        self.settings = settings
+
+
+def load_settings() -> Settings:
+    return Settings()
+
+
+async def open_session(settings: Settings) -> Session:
+    await asyncio.sleep(DELAY)
+    return Session(settings)
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/items")
+async def list_items(session: Session, limit: FromQuery[int] = 10):
+    return dict(limit=limit)
+
+
+@base.get("/settings")
+async def show_settings(settings: Settings):
+    return dict(settings=id(settings))
+
+
+class Paging:
+    def __init__(self, page: FromQuery[int] = 1, size: FromQuery[int] = 10):
+        self.page = page
+        self.size = size
+
+
+@base.get("/search")
+async def search(paging: Paging):
+    return dict(page=paging.page, size=paging.size)
+
+
+@base.get("/items/<int:item_id>")
+async def show_item(item_id, session: Session):
+    return dict(item_id=item_id)
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[
+        (Settings, Dependant(load_settings, scope="app")),
+        (Session, Dependant(open_session, scope="request")),
+    ],
+)
+app = create_app(base, di, config=dict(QUART_DI_COLLECT_TIMINGS=True))
@@ -0,0 +1,71 @@
+import asyncio
+import logging
+import threading
+
+from di.dependant import Dependant
+from quart import Blueprint, request
+
+from quart_di import FromQuery, QuartDI, await_
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+DELAY = 0.1
+
+
+class AsyncClient:
+    """Stands in for a client of an async only library."""
+
+    async def fetch(self, key: str) -> str:
+        await asyncio.sleep(DELAY)
+        if key == "missing":
+            raise KeyError(key)
+        return key.upper()
+
+
+class Record:
+    def __init__(self, key: str, value: str, thread_id: int):
+        self.key = key
+        self.value = value
+        self.thread_id = thread_id
+
+
+def get_client() -> AsyncClient:
+    return AsyncClient()
+
+
+# sync code written against the async client, it doesn't block the loop while fetching
+def load_record(client: AsyncClient) -> Record:
+    key = request.args["key"]
+    try:
+        value = await_(client.fetch(key))
+    except KeyError:
+        value = None
+    return Record(key, value, threading.get_ident())
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/record")
+def show_record(record: Record, client: AsyncClient):
+    again = await_(client.fetch(record.key)) if record.value is not None else None
+    return dict(key=record.key, value=record.value, again=again, thread_id=record.thread_id)
+
+
+@base.get("/fetch")
+def fetch(client: AsyncClient, key: FromQuery[str], times: FromQuery[int] = 1):
+    return dict(values=[await_(client.fetch(key)) for _ in range(times)])
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[
+        (AsyncClient, Dependant(get_client, scope="app")),
+        (Record, Dependant(load_record, scope="request")),
+    ],
+)
+app = create_app(base, di, config=dict(QUART_DI_GREENLET_SYNC=True))
@@ -0,0 +1,59 @@
+import logging
+
+from di.dependant import Marker
+from quart import Blueprint
+
+from quart_di.compat import Annotated
+from quart_di import FromHeader, FromQuery, Lazy, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+events = []
+
+
+class Report:
+    def __init__(self):
+        self.closed = False
+
+
+async def build_report():
+    events.append("built")
+    report = Report()
+    yield report
+    report.closed = True
+    events.append("closed")
+
+
+ExpensiveReport = Annotated[Report, Marker(build_report, scope="request")]
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/report")
+async def report(report: Lazy[ExpensiveReport], cached: FromQuery[bool] = False):
+    if cached:
+        return dict(cached=True, resolved=report.resolved)
+
+    first = await report
+    second = await report.get()
+    return dict(cached=False, same=first is second, closed=first.closed)
+
+
+@base.post("/report/shared")
+async def shared_report(eager: ExpensiveReport, lazy: Lazy[ExpensiveReport]):
+    return dict(same=eager is await lazy)
+
+
+@base.get("/page")
+async def page(page: Lazy[FromQuery[int]], x_tenant_id: Lazy[FromHeader[str]]):
+    return dict(page=await page, tenant=await x_tenant_id)
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
@@ -0,0 +1,50 @@
+import logging
+from typing import List
+
+from pydantic import BaseModel
+from quart import Blueprint
+
+from quart_di import Body, FromJson, JsonBody, QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Comment(BaseModel):
+    author: str
+    text: str
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/comments")
+async def create_comment(
+    comment: Annotated[Comment, JsonBody(max_bytes=64)], author: FromJson[str]
+):
+    return dict(comment=comment, author=author)
+
+
+@base.post("/upload")
+async def upload(body: Body[bytes]):
+    return dict(size=len(body))
+
+
+@base.post("/tags")
+async def tags(tags: Annotated[List[str], JsonBody()]):
+    return dict(tags=tags)
+
+
+@base.post("/events")
+async def events(events: Annotated[List[dict], JsonBody()], raw: Body[bytes]):
+    return dict(count=len(events), size=len(raw))
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(
+    base, di, config=dict(QUART_DI_MAX_BODY_SIZE=128, QUART_DI_MAX_DECOMPRESSED_SIZE=1024)
+)
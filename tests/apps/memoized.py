@@ -0,0 +1,107 @@
+import logging
+from typing import List
+
+from di.dependant import Marker
+from pydantic import BaseModel, ValidationError, validator
+from quart import Blueprint, jsonify
+from quart.datastructures import FileStorage
+
+from quart_di import FromHeader, FromQuery, QuartDI
+from quart_di.compat import Annotated
+from quart_di.extractors import FileParam
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+validations: List[str] = []
+
+
+class TenantId(str):
+    @classmethod
+    def __get_validators__(cls):
+        yield cls.validate
+
+    @classmethod
+    def validate(cls, value):
+        validations.append("tenant")
+        return cls(value)
+
+
+class Paging(BaseModel):
+    limit: int = 10
+    offset: int = 0
+
+    @validator("limit")
+    def count_validation(cls, value):
+        validations.append("paging")
+        return value
+
+
+def get_tenant(x_tenant_id: FromHeader[TenantId]) -> str:
+    return x_tenant_id
+
+
+def get_audit(x_tenant_id: FromHeader[TenantId], paging: FromQuery[Paging]) -> dict:
+    return dict(tenant=x_tenant_id, limit=paging.limit)
+
+
+def get_search(
+    audit: Annotated[dict, Marker(get_audit, scope="request")],
+    x_tenant_id: FromHeader[TenantId],
+    paging: FromQuery[Paging],
+    size: FromQuery[int],
+) -> dict:
+    return dict(tenant=x_tenant_id, offset=paging.offset, size=size)
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/search")
+async def search(
+    tenant: Annotated[str, Marker(get_tenant, scope="request")],
+    audit: Annotated[dict, Marker(get_audit, scope="request")],
+    search: Annotated[dict, Marker(get_search, scope="request")],
+    paging: FromQuery[Paging],
+):
+    return dict(tenant=tenant, audit=audit, search=search, limit=paging.limit)
+
+
+def get_page_size(size: FromQuery[str]) -> str:
+    return size
+
+
+@base.get("/sizes")
+async def sizes(
+    page_size: Annotated[int, Marker(get_page_size, scope="request")],
+    search: Annotated[dict, Marker(get_search, scope="request")],
+):
+    return dict(page_size=page_size, search_size=search["size"])
+
+
+def get_id_card(id_card: Annotated[FileStorage, FileParam(convert_underscores=True)]) -> str:
+    return id_card.filename
+
+
+def get_scan(scan: Annotated[FileStorage, FileParam(alias="id-card")]) -> str:
+    return scan.filename
+
+
+@base.post("/cards")
+async def cards(
+    id_card: Annotated[str, Marker(get_id_card, scope="request")],
+    scan: Annotated[str, Marker(get_scan, scope="request")],
+):
+    return dict(id_card=id_card, scan=scan)
+
+
+@base.errorhandler(ValidationError)
+async def handle_validation_error(error):
+    return jsonify(message=str(error).splitlines()[0], errors=error.errors()), 422
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
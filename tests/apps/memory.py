@@ -0,0 +1,93 @@
+import asyncio
+import logging
+from typing import Iterator
+from typing import List
+
+from di.dependant import Dependant
+from quart import Blueprint
+
+from quart_di import FromQuery, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+CHUNK_SIZE = 256 * 1024
+retained: List[bytearray] = []
+gate: List[asyncio.Event] = []
+
+
+class Settings:
+    pass
+
+
+def load_settings() -> Settings:
+    return Settings()
+
+
+class Cache:
+    pass
+
+
+class Queue:
+    pass
+
+
+def open_cache() -> Iterator[Cache]:
+    yield Cache()
+
+
+def open_queue() -> Iterator[Queue]:
+    yield Queue()
+
+
+class Page:
+    def __init__(self, number: FromQuery[int] = 1, size: FromQuery[int] = 10):
+        self.number = number
+        self.size = size
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/settings")
+async def show_settings(settings: Settings):
+    return dict(settings=id(settings))
+
+
+@base.get("/allocate")
+async def allocate(settings: Settings):
+    retained.append(bytearray(CHUNK_SIZE))
+    return dict(retained=len(retained))
+
+
+@base.get("/resources")
+async def show_resources(cache: Cache, queue: Queue):
+    return dict(cache=id(cache), queue=id(queue))
+
+
+@base.get("/wait")
+async def wait(settings: Settings, page: Page):
+    await gate[0].wait()
+    return dict(waited=True, page=page.number)
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[
+        (Settings, Dependant(load_settings, scope="app")),
+        (Cache, Dependant(open_cache, scope="app")),
+        (Queue, Dependant(open_queue, scope="app")),
+    ],
+)
+app = create_app(
+    base,
+    di,
+    config=dict(
+        QUART_DI_MONITOR_MEMORY=True,
+        QUART_DI_TRACE_ALLOCATIONS=True,
+        QUART_DI_MEMORY_WARN_THRESHOLD=2,
+    ),
+)
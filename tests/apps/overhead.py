@@ -0,0 +1,49 @@
+import logging
+from typing import Optional
+
+from quart import Blueprint, request
+
+from quart_di import FromHeader, FromQuery, QuartDI, inject
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Repository:
+    def find(self, limit: int, offset: int):
+        return list(range(offset, offset + limit))
+
+
+def get_repository() -> Repository:
+    return Repository()
+
+
+base = Blueprint("base", __name__)
+
+
+# the same handler with and without injection, to measure what injecting costs
+@base.get("/plain")
+async def plain():
+    repository = get_repository()
+    limit = int(request.args.get("limit", 10))
+    offset = int(request.args.get("offset", 0))
+    tenant = request.headers.get("x-tenant")
+    return dict(tenant=tenant, items=repository.find(limit, offset))
+
+
+@base.get("/injected")
+@inject
+async def injected(
+    repository: Repository,
+    limit: FromQuery[int] = 10,
+    offset: FromQuery[int] = 0,
+    x_tenant: FromHeader[Optional[str]] = None,
+):
+    return dict(tenant=x_tenant, items=repository.find(limit, offset))
+
+
+di = QuartDI()
+app = create_app(base, di)
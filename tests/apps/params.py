@@ -0,0 +1,46 @@
+import logging
+from typing import Optional
+
+from pydantic import ValidationError
+from quart import Blueprint, jsonify
+
+from quart_di import FromCookie, FromHeader, FromPath, FromQuery, QueryParam, QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/orders/<int:order_id>/items")
+async def order_items(
+    order_id: FromPath[int],
+    page: FromQuery[int] = 1,
+    per_page: FromQuery[int] = 20,
+    fields: Annotated[Optional[str], QueryParam(alias="only")] = None,
+    x_request_id: FromHeader[str] = "",
+    session: FromCookie[Optional[str]] = None,
+    query: FromQuery = None,
+):
+    return dict(
+        order_id=order_id,
+        page=page,
+        per_page=per_page,
+        fields=fields,
+        x_request_id=x_request_id,
+        session=session,
+        query=dict(query),
+    )
+
+
+@base.errorhandler(ValidationError)
+def handle_validation_error(error):
+    return jsonify(errors=error.errors()), 422
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
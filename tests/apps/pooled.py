@@ -0,0 +1,54 @@
+import asyncio
+import itertools
+import logging
+
+from quart import Blueprint
+
+from quart_di import Pool, Pooled, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Connection:
+    ids = itertools.count(1)
+
+    def __init__(self):
+        self.id = next(self.ids)
+        self.healthy = True
+        self.closed = False
+
+    async def ping(self) -> bool:
+        return self.healthy
+
+    async def close(self):
+        self.closed = True
+
+
+pool = Pool(
+    Connection,
+    min_size=1,
+    max_size=2,
+    health_check=Connection.ping,
+    acquire_timeout=0.1,
+)
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/connection")
+async def connection(conn: Pooled[Connection], same_conn: Pooled[Connection]):
+    return dict(id=conn.id, same=conn is same_conn, in_use=pool.stats().in_use)
+
+
+@base.post("/slow")
+async def slow(conn: Pooled[Connection]):
+    await asyncio.sleep(0.2)
+    return dict(id=conn.id)
+
+
+di = QuartDI(pools=[(Connection, pool)], decorate_views=True)
+app = create_app(base, di)
@@ -0,0 +1,41 @@
+import logging
+
+from di.dependant import Dependant
+from quart import Blueprint
+
+from quart_di import FromQuery, QuartDI
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class Repository:
+    def find(self, limit: int):
+        return list(range(limit))
+
+
+def get_repository() -> Repository:
+    return Repository()
+
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/items")
+async def list_items(repository: Repository, limit: FromQuery[int] = 3):
+    return dict(items=repository.find(limit))
+
+
+@base.get("/fail")
+async def fail(repository: Repository):
+    raise RuntimeError("boom")
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[(Repository, Dependant(get_repository, scope="request"))],
+)
+app = create_app(base, di)
@@ -0,0 +1,70 @@
+import asyncio
+import logging
+from typing import List
+
+from di.dependant import Dependant, Marker
+from quart import Blueprint
+
+from quart_di import QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+DELAY = 0.1
+events: List[str] = []
+
+
+class Database:
+    pass
+
+
+class Broker:
+    pass
+
+
+async def connect_database():
+    yield Database()
+    await asyncio.sleep(DELAY)
+    events.append("database closed")
+
+
+async def connect_broker():
+    yield Broker()
+    await asyncio.sleep(DELAY)
+    events.append("broker closed")
+
+
+async def start_repository(database: Database):
+    yield ("repository", database)
+    await asyncio.sleep(DELAY)
+    events.append("repository stopped")
+
+
+async def start_watcher():
+    yield "watcher"
+    await asyncio.Event().wait()
+
+
+Repository = Annotated[tuple, Marker(start_repository, scope="app")]
+Watcher = Annotated[str, Marker(start_watcher, scope="app")]
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/")
+async def index(broker: Broker, repository: Repository, watcher: Watcher):
+    return dict(ok=True)
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[
+        (Database, Dependant(connect_database, scope="app")),
+        (Broker, Dependant(connect_broker, scope="app")),
+    ],
+)
+app = create_app(base, di, config=dict(QUART_DI_FINALIZER_TIMEOUT=DELAY * 3))
@@ -0,0 +1,40 @@
+import asyncio
+import logging
+
+from quart import Blueprint
+
+from quart_di.compat import Annotated
+from quart_di import FromQuery, QuartDI, SingleFlight
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+calls = []
+
+
+async def fetch_catalog_page(page: FromQuery[int]):
+    calls.append(page)
+    fetch = len(calls)
+    await asyncio.sleep(0.1)
+    if page < 0:
+        raise ValueError("page must be positive")
+    return dict(page=page, fetch=fetch)
+
+
+CatalogPage = Annotated[dict, SingleFlight(fetch_catalog_page)]
+
+
+base = Blueprint("base", __name__)
+
+
+@base.post("/catalog")
+async def catalog(page: CatalogPage):
+    return page
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
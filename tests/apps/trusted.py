@@ -0,0 +1,47 @@
+import logging
+
+from pydantic import BaseModel
+from quart import Blueprint
+
+from quart_di import FromQuery, Json, QuartDI, inject
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+
+class User(BaseModel):
+    id: int
+    name: str
+
+
+def describe(user: User, limit):
+    return dict(user=user.__dict__, limit=limit, limit_type=type(limit).__name__)
+
+
+internal = Blueprint("internal", __name__, url_prefix="/internal")
+public = Blueprint("public", __name__)
+
+
+@internal.post("/users")
+async def sync_user(user: Json[User], limit: FromQuery[int] = 10):
+    return describe(user, limit)
+
+
+@public.post("/users")
+async def create_user(user: Json[User], limit: FromQuery[int] = 10):
+    return describe(user, limit)
+
+
+@public.post("/users/trusted")
+@inject(validate=False)
+async def create_trusted_user(user: Json[User], limit: FromQuery[int] = 10):
+    return describe(user, limit)
+
+
+public.register_blueprint(internal)
+
+di = QuartDI(decorate_views=True)
+app = create_app(public, di, config=dict(QUART_DI_TRUSTED_BLUEPRINTS=["public.internal"]))
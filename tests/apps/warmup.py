@@ -0,0 +1,69 @@
+import asyncio
+import logging
+from typing import List
+
+from di.dependant import Dependant, Marker
+from quart import Blueprint
+
+from quart_di import QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+DELAY = 0.1
+events: List[str] = []
+
+
+class Cache:
+    pass
+
+
+class Search:
+    pass
+
+
+async def connect_cache() -> Cache:
+    events.append("cache")
+    await asyncio.sleep(DELAY)
+    return Cache()
+
+
+async def connect_search() -> Search:
+    events.append("search")
+    await asyncio.sleep(DELAY)
+    return Search()
+
+
+async def connect_mailer(cache: Cache):
+    events.append("mailer")
+    await asyncio.sleep(DELAY)
+    return ("mailer", cache)
+
+
+Mailer = Annotated[tuple, Marker(connect_mailer, scope="app")]
+
+base = Blueprint("base", __name__)
+
+
+@base.get("/search")
+async def search(search: Search, cache: Cache):
+    return dict(search=id(search), cache=id(cache))
+
+
+@base.get("/mail")
+async def mail(mailer: Mailer):
+    return dict(cache=id(mailer[1]))
+
+
+di = QuartDI(
+    decorate_views=True,
+    binds=[
+        (Cache, Dependant(connect_cache, scope="app")),
+        (Search, Dependant(connect_search, scope="app")),
+    ],
+)
+app = create_app(base, di, config=dict(QUART_DI_WARM_UP=True))
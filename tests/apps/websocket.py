@@ -0,0 +1,67 @@
+import itertools
+import json
+import logging
+from typing import List
+
+from di.dependant import Marker
+from quart import Blueprint
+
+from quart_di import FromQuery, Lazy, Message, Messages, QuartDI
+from quart_di.compat import Annotated
+
+from shared import setup_logging
+from .common import create_app
+
+logger = logging.getLogger(__name__)
+setup_logging("quart_di", "tests")
+
+events: List[str] = []
+connection_ids = itertools.count(1)
+message_ids = itertools.count(1)
+
+
+async def open_session():
+    session_id = next(connection_ids)
+    events.append(f"session {session_id} opened")
+    try:
+        yield session_id
+    finally:
+        events.append(f"session {session_id} closed")
+
+
+async def begin_unit_of_work():
+    unit_id = next(message_ids)
+    events.append(f"unit {unit_id} started")
+    yield unit_id
+    events.append(f"unit {unit_id} finished")
+
+
+Session = Annotated[int, Marker(open_session, scope="connection")]
+UnitOfWork = Annotated[int, Marker(begin_unit_of_work, scope="message")]
+
+
+async def on_message(message: Message, session: Session, unit: UnitOfWork, room: FromQuery[str]):
+    if message.data == "ignore":
+        return None
+    return dict(echo=message.json(), session=session, unit=unit, room=room)
+
+
+base = Blueprint("base", __name__)
+
+
+@base.websocket("/ws")
+async def chat(session: Session, messages: Messages):
+    events.append(f"connected to session {session}")
+    await messages.serve(on_message)
+
+
+@base.websocket("/ws/lazy")
+async def lazy_chat(session: Lazy[Session], room: Lazy[FromQuery[str]], messages: Messages):
+    message = await messages.receive()
+    await messages.websocket.send(
+        json.dumps(dict(echo=message.json(), session=await session, room=await room))
+    )
+
+
+di = QuartDI(decorate_views=True)
+app = create_app(base, di)
@@ -0,0 +1,75 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps.binary import app
+
+from quart_di.compat import cbor2, msgpack
+
+requires_codecs = pytest.mark.skipif(
+    msgpack is None or cbor2 is None, reason="msgpack and cbor2 are optional"
+)
+
+
+class TestBinaryEncoding(IntegrationTestBase):
+    payload = dict(name="temperature", values=[1.5, 2.5, 3.5])
+
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.mark.parametrize(
+        "accept, mimetype, loads",
+        [
+            (None, "application/json", None),
+            ("*/*", "application/json", None),
+            ("application/msgpack", "application/msgpack", "msgpack"),
+            ("application/cbor, application/json;q=0.5", "application/cbor", "cbor2"),
+        ],
+    )
+    @requires_codecs
+    async def test_msgpack_body_with_negotiated_response(self, app, accept, mimetype, loads):
+        headers = {"content-type": "application/msgpack"}
+        if accept is not None:
+            headers["accept"] = accept
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/msgpack", data=msgpack.packb(self.payload), headers=headers
+            )
+            body = await response.get_data()
+
+        assert response.status_code == 200
+        assert response.mimetype == mimetype
+        assert "Accept" in response.headers["Vary"]
+
+        if loads is None:
+            data = await response.get_json()
+        else:
+            data = dict(msgpack=msgpack.unpackb, cbor2=cbor2.loads)[loads](body)
+        assert data == dict(body=self.payload, name=self.payload["name"], raw=self.payload)
+
+    @requires_codecs
+    async def test_cbor_body(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/cbor",
+                data=cbor2.dumps(self.payload),
+                headers={"content-type": "application/cbor"},
+            )
+            data = await response.get_json()
+
+        assert data == self.payload
+
+    async def test_raw_body_is_not_decoded(self, app):
+        payload = b"\xff\xfe\x00binary"
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/raw", data=payload)
+            data = await response.get_json()
+
+        assert response.status_code == 200
+        assert data == dict(
+            types=["bytes", "bytearray", "memoryview"],
+            equal=True,
+            hex=payload.hex(),
+        )
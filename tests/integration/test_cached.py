@@ -0,0 +1,80 @@
+import asyncio
+import time
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import cached
+from tests.apps.cached import app, TTL
+
+
+class TestCached(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        cached.calls.clear()
+        cached.TenantConfig.__metadata__[0].cache.clear()
+        cached.ExchangeRate.__metadata__[0].cache.clear()
+        yield
+
+    async def request(self, test_client, path, tenant):
+        response = await test_client.post(path, headers={"x-tenant-id": tenant})
+        assert response.status_code == 200
+        return await response.get_json()
+
+    async def test_cached_across_requests_by_input(self, app):
+        async with self.test_client(app) as test_client:
+            first = await self.request(test_client, "/config", "acme")
+            second = await self.request(test_client, "/config", "acme")
+            other = await self.request(test_client, "/config", "globex")
+
+        assert first == second == dict(tenant="acme", version=1)
+        assert other == dict(tenant="globex", version=2)
+        assert cached.calls == ["acme", "globex"]
+
+    async def test_expires_after_ttl(self, app):
+        async with self.test_client(app) as test_client:
+            first = await self.request(test_client, "/config", "acme")
+            await asyncio.sleep(TTL)
+            second = await self.request(test_client, "/config", "acme")
+
+        assert first["version"] == 1
+        assert second["version"] == 2
+
+    async def test_evicts_least_recently_used(self, app):
+        async with self.test_client(app) as test_client:
+            for tenant in ("acme", "globex", "acme", "initech", "acme", "globex"):
+                await self.request(test_client, "/config", tenant)
+
+        assert cached.calls == ["acme", "globex", "initech", "globex"]
+
+    async def test_stale_while_revalidate(self, app):
+        async with self.test_client(app) as test_client:
+            first = await self.request(test_client, "/rate", "acme")
+            await asyncio.sleep(TTL)
+
+            started = time.monotonic()
+            stale = await self.request(test_client, "/rate", "acme")
+            elapsed = time.monotonic() - started
+
+            await asyncio.sleep(TTL * 2)
+            fresh = await self.request(test_client, "/rate", "acme")
+
+        assert first["version"] == stale["version"] == 1
+        assert elapsed < TTL
+        assert fresh["version"] == 2
+
+    async def test_revalidation_is_cancelled_when_serving_ends(self, app):
+        marker = cached.ExchangeRate.__metadata__[0]
+        async with self.test_client(app) as test_client:
+            await self.request(test_client, "/rate", "acme")
+            await asyncio.sleep(TTL)
+            await self.request(test_client, "/rate", "acme")
+            [task] = marker._revalidating.values()
+
+        assert task.cancelled()
+        assert marker._revalidating == {}
+        assert [entry.value["version"] for entry in marker.cache._data.values()] == [1]
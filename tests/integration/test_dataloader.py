@@ -0,0 +1,32 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import dataloader
+from tests.apps.dataloader import app
+
+
+class TestDataLoader(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_batches(self):
+        dataloader.batches.clear()
+        yield
+
+    async def test_loads_are_batched_and_memoized_per_request(self, app):
+        async with self.test_client(app) as test_client:
+            first = await (await test_client.post("/users")).get_json()
+            second = await (await test_client.post("/users")).get_json()
+
+        assert first == second == dict(owner="ann", names=["bob", "cat", "ann"])
+        # the nested dependant's load(1) is memoized, the view's loads share one batch
+        assert dataloader.batches == [[1], [2, 3], [1], [2, 3]]
+
+    async def test_exception_values_fail_only_their_key(self, app):
+        async with self.test_client(app) as test_client:
+            data = await (await test_client.post("/users/missing")).get_json()
+
+        assert data == dict(found="ann", missing="KeyError(4)")
+        assert dataloader.batches == [[1, 4]]
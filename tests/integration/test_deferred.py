@@ -0,0 +1,74 @@
+import asyncio
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import deferred
+from tests.apps.deferred import app, di
+
+
+class TestDeferredTeardown(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    async def reset(self):
+        deferred.events.clear()
+        deferred.teardown_started = asyncio.Event()
+        deferred.release_teardown = asyncio.Event()
+        di.metrics.reset()
+        yield
+
+    async def test_teardown_runs_in_background(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/orders")
+            assert response.status_code == 200
+
+            await asyncio.wait_for(deferred.teardown_started.wait(), 1)
+            assert deferred.events == ["session opened", "response returned"]
+            assert len(di._deferred_teardown) == 1
+
+            deferred.release_teardown.set()
+            await di._deferred_teardown.drain()
+
+        assert deferred.events[-1] == "session committed"
+        assert len(di._deferred_teardown) == 0
+
+    async def test_teardown_errors_are_reported(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/failing")
+            await di._deferred_teardown.drain()
+
+        assert response.status_code == 200
+        assert di.metrics.get("teardown_errors", "request") == 1
+
+    async def test_task_group_dependencies_cant_be_deferred(self, app):
+        # the task group is exited in another task than the one that entered it
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/background")
+            await di._deferred_teardown.drain()
+
+        assert response.status_code == 200
+        assert di.metrics.get("teardown_errors", "request") == 1
+
+    async def test_pending_teardowns_are_bounded(self, app, monkeypatch):
+        monkeypatch.setattr(di._deferred_teardown, "concurrency", 1)
+
+        async with self.test_client(app) as test_client:
+            await test_client.post("/orders")
+            await asyncio.wait_for(deferred.teardown_started.wait(), 1)
+
+            # the first teardown is pending, the second request tears down before responding
+            deferred.teardown_started.clear()
+            second = asyncio.ensure_future(test_client.post("/orders"))
+            await asyncio.wait_for(deferred.teardown_started.wait(), 1)
+            assert not second.done()
+            assert len(di._deferred_teardown) == 1
+
+            deferred.release_teardown.set()
+            assert (await second).status_code == 200
+            await di._deferred_teardown.drain()
+
+        assert di.metrics.get("teardowns_not_deferred", "request") == 1
+        assert deferred.events.count("session committed") == 2
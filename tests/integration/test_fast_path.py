@@ -0,0 +1,51 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps.fast_path import app, di
+
+
+class TestFastPath(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture
+    def injected(self, monkeypatch):
+        injected = []
+        _inject = di._inject
+
+        async def spy(dependant, *args, **kwargs):
+            injected.append(dependant)
+            return await _inject(dependant, *args, **kwargs)
+
+        monkeypatch.setattr(di, "_inject", spy)
+        yield injected
+
+    async def test_views_with_nothing_to_inject_skip_di(self, app, injected):
+        assert di.fast_path_views == {"base.health", "base.show_item", "static"}
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/health")
+            assert await response.get_json() == dict(ok=True, version="1.0")
+
+            response = await test_client.get("/items/3")
+            assert await response.get_json() == dict(item_id=3, verbose=False)
+
+            response = await test_client.get("/items")
+            assert await response.get_json() == dict(item_id=None, verbose=False)
+
+        assert injected == []
+
+    async def test_views_with_something_to_inject_are_injected(self, app, injected):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/users/7")
+            assert await response.get_json() == dict(user_id=7)
+
+            # string annotations are resolved to find markers
+            response = await test_client.get("/users/7/profile")
+            assert await response.get_json() == dict(user_id=7)
+
+            response = await test_client.get("/session")
+            assert await response.get_json() == dict(session="Session")
+
+        assert len(injected) == 3
@@ -0,0 +1,96 @@
+from io import BytesIO
+
+import pytest
+from quart.datastructures import FileStorage
+from werkzeug.datastructures import Headers
+from werkzeug.sansio.multipart import Data
+from werkzeug.sansio.multipart import Epilogue
+from werkzeug.sansio.multipart import Field
+from werkzeug.sansio.multipart import File
+from werkzeug.sansio.multipart import MultipartEncoder
+from werkzeug.sansio.multipart import Preamble
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import forms
+from tests.apps.forms import app, SPOOL_MAX_SIZE
+
+
+class TestForms(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_handles(self):
+        forms.handles.clear()
+        yield
+
+    def file(self, name, content):
+        return FileStorage(BytesIO(content), filename=name, content_type="text/plain")
+
+    def multipart(self, fields, files):
+        """Encode a multipart body, unlike the test client's `files` a name can have many files."""
+        boundary = "----QuartDIBoundary"
+        encoder = MultipartEncoder(boundary.encode())
+        body = encoder.send_event(Preamble(data=b""))
+        for name, filename, content in files:
+            headers = Headers({"Content-Type": "text/plain"})
+            body += encoder.send_event(File(name=name, filename=filename, headers=headers))
+            body += encoder.send_event(Data(data=content, more_data=False))
+        for name, value in fields.items():
+            body += encoder.send_event(Field(name=name, headers=Headers()))
+            body += encoder.send_event(Data(data=value.encode(), more_data=False))
+        body += encoder.send_event(Epilogue(data=b""))
+        return body, {"Content-Type": f"multipart/form-data; boundary={boundary}"}
+
+    @pytest.mark.parametrize("content, rolled_to_disk", [(b"small", False), (b"x" * 64, True)])
+    async def test_multipart_upload(self, app, content, rolled_to_disk):
+        assert (len(content) > SPOOL_MAX_SIZE) is rolled_to_disk
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/upload",
+                form=dict(name="Joe", age="42"),
+                files=dict(avatar=self.file("avatar.txt", content)),
+            )
+            data = await response.get_json()
+
+        assert response.status_code == 200
+        assert data == dict(
+            profile=dict(name="Joe", age=42),
+            age=42,
+            avatar=dict(
+                filename="avatar.txt",
+                content=content.decode(),
+                rolled_to_disk=rolled_to_disk,
+            ),
+            attachments=[],
+            missing=None,
+        )
+        assert all(handle.stream.closed for handle in forms.handles)
+
+    async def test_every_file_of_a_field_is_closed(self, app):
+        body, headers = self.multipart(
+            dict(name="Joe", age="42"),
+            [
+                ("avatar", "avatar.txt", b"avatar"),
+                ("attachments", "first.txt", b"first"),
+                ("attachments", "second.txt", b"x" * 64),
+                ("attachments", "third.txt", b"third"),
+            ],
+        )
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/upload", data=body, headers=headers)
+            data = await response.get_json()
+
+        assert data["attachments"] == ["first.txt", "second.txt", "third.txt"]
+        assert len(forms.handles) == 4
+        assert all(handle.stream.closed for handle in forms.handles)
+
+    async def test_urlencoded_form(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/fields", form=dict(name="Joe", extra="1"))
+            data = await response.get_json()
+
+        assert data == dict(name="Joe", fields=dict(name="Joe", extra="1"))
@@ -0,0 +1,94 @@
+import json
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import graph
+from tests.apps.graph import app, di
+
+
+class TestGraph(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        di.timings.reset()
+        yield
+        di.timings.reset()
+
+    def run_graph(self, app, *args):
+        result = app.test_cli_runner().invoke(args=["di", "graph", *args])
+        assert result.exception is None, result.output
+        return result.output
+
+    async def test_graph_is_annotated_with_measured_costs(self, app):
+        async with self.test_client(app) as test_client:
+            for _ in range(3):
+                response = await test_client.get("/items?limit=5")
+                assert await response.get_json() == dict(limit=5)
+
+        output = self.run_graph(app, "--format", "json", "--endpoint", "base.list_items")
+        [route] = json.loads(output)
+        assert route["rule"] == "/items"
+        assert route["error"] is None
+
+        nodes = {node["name"]: node for node in route["nodes"]}
+        names = {node["id"]: node["name"] for node in route["nodes"]}
+        assert route["nodes"][0]["name"] == "list_items"
+        assert nodes["load_settings"]["scope"] == "app"
+        assert nodes["open_session"]["timing"]["count"] == 3
+        assert nodes["open_session"]["timing"]["p50"] >= graph.DELAY
+        assert {
+            (names[edge["source"]], names[edge["target"]], edge["parameter"])
+            for edge in route["edges"]
+        } >= {
+            ("list_items", "open_session", "session"),
+            ("open_session", "load_settings", "settings"),
+        }
+
+    async def test_extractors_sharing_a_qualname_are_separate_nodes(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/search?page=2&size=5")
+            assert await response.get_json() == dict(page=2, size=5)
+
+        output = self.run_graph(app, "--format", "json", "--endpoint", "base.search")
+        [route] = json.loads(output)
+        extractors = [node for node in route["nodes"] if "get_query_args" in node["name"]]
+        assert sorted(node["name"].rsplit("(", 1)[1] for node in extractors) == [
+            "page)",
+            "size)",
+        ]
+        assert len({node["id"] for node in extractors}) == 2
+        assert [node["timing"]["count"] for node in extractors] == [1, 1]
+        assert len(di.timings) == len(route["nodes"])
+
+    async def test_text_and_dot_formats(self, app):
+        text = self.run_graph(app, "--endpoint", "base.show_item")
+        assert text.splitlines() == [
+            "/items/<int:item_id> (base.show_item)",
+            "  show_item [scope=request]",
+            "    session: open_session [scope=request]",
+            "      settings: load_settings [scope=app]",
+        ]
+
+        dot = self.run_graph(app, "--format", "dot", "--endpoint", "base.show_settings")
+        assert dot.startswith("digraph dependencies {")
+        assert 'label="/settings";' in dot
+        assert '[label="settings"];' in dot
+
+    async def test_timings_are_loaded_from_a_file(self, app, tmp_path):
+        async with self.test_client(app) as test_client:
+            await test_client.get("/settings")
+        path = tmp_path / "timings.json"
+        di.timings.dump(str(path))
+        di.timings.reset()
+
+        [route] = json.loads(
+            self.run_graph(
+                app, "--format", "json", "--endpoint", "base.show_settings", "--timings", str(path)
+            )
+        )
+        nodes = {node["name"]: node for node in route["nodes"]}
+        assert nodes["load_settings"]["timing"]["count"] >= 1
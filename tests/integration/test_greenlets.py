@@ -0,0 +1,50 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from quart_di import await_
+from tests.shared.base import IntegrationTestBase
+from tests.apps import greenlets
+from tests.apps.greenlets import app
+
+
+class TestGreenlets(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    async def test_sync_dependencies_await_on_the_event_loop(self, app):
+        async with self.test_client(app) as test_client:
+            started = time.perf_counter()
+            responses = await asyncio.gather(
+                *(test_client.get(f"/record?key=key{index}") for index in range(5))
+            )
+            elapsed = time.perf_counter() - started
+
+        payloads = [await response.get_json() for response in responses]
+        assert [payload["value"] for payload in payloads] == [f"KEY{i}" for i in range(5)]
+        assert [payload["again"] for payload in payloads] == [f"KEY{i}" for i in range(5)]
+        # fetched concurrently on the loop's thread, the view and provider each wait once
+        assert all(payload["thread_id"] == threading.get_ident() for payload in payloads)
+        assert elapsed < greenlets.DELAY * 4
+
+    async def test_exceptions_are_raised_in_the_greenlet(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/record?key=missing")
+
+        assert await response.get_json() == dict(
+            key="missing", value=None, again=None, thread_id=threading.get_ident()
+        )
+
+    async def test_sync_views_with_query_params(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/fetch?key=abc&times=2")
+
+        assert response.status_code == 200
+        assert await response.get_json() == dict(values=["ABC", "ABC"])
+
+    async def test_await_outside_of_a_greenlet(self):
+        with pytest.raises(RuntimeError, match="greenlet_spawn"):
+            await_(asyncio.sleep(0))
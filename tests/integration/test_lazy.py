@@ -0,0 +1,47 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import lazy
+from tests.apps.lazy import app
+
+
+class TestLazy(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_events(self):
+        lazy.events.clear()
+        yield
+
+    async def test_not_built_when_unused(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/report", query_string=dict(cached="true"))
+            data = await response.get_json()
+
+        assert data == dict(cached=True, resolved=False)
+        assert lazy.events == []
+
+    async def test_built_once_on_first_use_and_torn_down(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/report")
+            data = await response.get_json()
+
+        assert data == dict(cached=False, same=True, closed=False)
+        assert lazy.events == ["built", "closed"]
+
+    async def test_shares_request_cache_with_eager_consumers(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/report/shared")
+            data = await response.get_json()
+
+        assert data == dict(same=True)
+        assert lazy.events == ["built", "closed"]
+
+    async def test_extracts_values_by_parameter_name(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/page?page=3", headers={"x-tenant-id": "acme"})
+            data = await response.get_json()
+
+        assert data == dict(page=3, tenant="acme")
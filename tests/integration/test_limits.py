@@ -0,0 +1,130 @@
+import gzip
+import json
+import zlib
+
+import pytest
+
+from quart_di.encoding import Decompressor
+from tests.shared.base import IntegrationTestBase
+from tests.apps.limits import app
+
+
+class TestBodyLimits(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    async def test_body_within_limit(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/comments", json=dict(author="joe", text="hi"))
+            data = await response.get_json()
+
+        assert response.status_code == 200
+        assert data == dict(comment=dict(author="joe", text="hi"), author="joe")
+
+    async def test_marker_limit_rejects_large_body(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/comments", json=dict(author="joe", text="x" * 64))
+
+        assert response.status_code == 413
+
+    @pytest.mark.parametrize("size, status_code", [(128, 200), (129, 413)])
+    async def test_global_limit(self, app, size, status_code):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/upload", data=b"x" * size)
+
+        assert response.status_code == status_code
+        if status_code == 200:
+            assert await response.get_json() == dict(size=size)
+
+    async def test_global_limit_applies_to_markers_without_limit(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/tags", json=["tag"] * 32)
+
+        assert response.status_code == 413
+
+
+class TestCompressedBodies(IntegrationTestBase):
+    events = [dict(kind="click", x=index) for index in range(20)]
+
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @staticmethod
+    def compress(data, encoding):
+        if encoding == "gzip":
+            return gzip.compress(data)
+        return zlib.compress(data)
+
+    @pytest.mark.parametrize("encoding", ["gzip", "deflate"])
+    async def test_decompressed_body_is_shared(self, app, encoding):
+        data = json.dumps(self.events).encode()
+        assert len(data) > 128
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/events",
+                data=self.compress(data, encoding),
+                headers={"content-type": "application/json", "content-encoding": encoding},
+            )
+
+        assert response.status_code == 200
+        assert await response.get_json() == dict(count=len(self.events), size=len(data))
+
+    async def test_stacked_encodings(self, app):
+        data = json.dumps(self.events).encode()
+        body = gzip.compress(zlib.compress(data))
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/events", data=body, headers={"content-encoding": "deflate, gzip"}
+            )
+
+        assert response.status_code == 200
+        assert await response.get_json() == dict(count=len(self.events), size=len(data))
+
+    async def test_zip_bomb_is_rejected(self, app):
+        # the first 128 compressed bytes, within the body limit, inflate to well over 1 KiB
+        body = gzip.compress(b"[" + b" " * 1024 * 1024 + b"]")
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/upload", data=body[:128], headers={"content-encoding": "gzip"}
+            )
+
+        assert response.status_code == 413
+
+    async def test_brotli_bomb_is_rejected(self, app):
+        brotli = pytest.importorskip("brotli")
+        # the first 128 compressed bytes, within the body limit, inflate to far over 1 KiB
+        body = brotli.compress(b"[" + b" " * 16 * 1024 * 1024 + b"]")
+
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/upload", data=body[:128], headers={"content-encoding": "br"}
+            )
+
+        assert response.status_code == 413
+
+    def test_brotli_output_is_bounded(self):
+        brotli = pytest.importorskip("brotli")
+        data = b" " * 16 * 1024 * 1024
+        decompressor = Decompressor(["br"], chunk_size=64 * 1024)
+
+        chunks = [*decompressor.decompress(brotli.compress(data)), *decompressor.flush()]
+
+        assert b"".join(chunks) == data
+        assert max(len(chunk) for chunk in chunks) < 1024 * 1024
+
+    @pytest.mark.parametrize(
+        "encoding, body, status_code",
+        [("gzip", b"not gzipped", 400), ("compress", b"", 415)],
+    )
+    async def test_invalid_encodings(self, app, encoding, body, status_code):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(
+                "/upload", data=body, headers={"content-encoding": encoding}
+            )
+
+        assert response.status_code == status_code
@@ -0,0 +1,14 @@
+from tests import load
+
+
+async def test_load_scenarios_run_without_errors():
+    results = await load.run(requests=20, concurrency=4, warmup=2)
+
+    assert [result.name for result in results] == [scenario.name for scenario in load.SCENARIOS]
+    for result in results:
+        assert result.requests == 20
+        assert result.errors == 0, result.name
+        assert 0 < result.p50 <= result.p95 <= result.p99
+
+    report = load.format_results(results)
+    assert "inject overhead (injected vs plain)" in report
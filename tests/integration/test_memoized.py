@@ -0,0 +1,61 @@
+import pytest
+
+from quart_di import QuartDI
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import memoized
+from tests.apps.common import create_app
+from tests.apps.memoized import app
+
+
+class TestMemoizedExtractors(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        memoized.validations.clear()
+        yield
+
+    async def test_identical_extractions_run_once_per_request(self, app):
+        async with self.test_client(app) as test_client:
+            for _ in range(2):
+                response = await test_client.get(
+                    "/search?limit=5&offset=2&size=20", headers={"x-tenant-id": "acme"}
+                )
+                assert await response.get_json() == dict(
+                    tenant="acme",
+                    audit=dict(tenant="acme", limit=5),
+                    search=dict(tenant="acme", offset=2, size=20),
+                    limit=5,
+                )
+
+        assert sorted(memoized.validations) == ["paging", "paging", "tenant", "tenant"]
+
+    async def test_extractions_into_different_types_are_not_shared(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/sizes?size=5", headers={"x-tenant-id": "acme"})
+            assert await response.get_json() == dict(page_size="5", search_size=5)
+
+    async def test_errors_are_located_by_the_extracted_name(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/cards", form=dict(name="acme"))
+            data = await response.get_json()
+
+        assert response.status_code == 422
+        assert data["message"] == "1 validation error for BaseModel"
+        assert [error["loc"] for error in data["errors"]] == [["id-card"]]
+
+    async def test_extractors_are_registered_per_extension(self, app):
+        other_di = QuartDI(decorate_views=True)
+        other_app = create_app(memoized.base, other_di)
+        for current_app in (app, other_app):
+            async with self.test_client(current_app) as test_client:
+                response = await test_client.get("/sizes?size=5", headers={"x-tenant-id": "a"})
+                assert response.status_code == 200
+
+        assert other_di.extractors
+        assert not {id(extractor) for extractor in memoized.di.extractors.values()} & {
+            id(extractor) for extractor in other_di.extractors.values()
+        }
@@ -0,0 +1,82 @@
+import asyncio
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import memory
+from tests.apps.memory import app, di
+
+
+class TestMemory(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    async def reset(self):
+        memory.retained.clear()
+        memory.gate[:] = [asyncio.Event()]
+        di.metrics.reset()
+        di.memory_monitor.reset()
+        yield
+        memory.retained.clear()
+
+    async def test_scope_sizes_are_tracked(self, app):
+        async with self.test_client(app) as test_client:
+            await test_client.get("/settings")
+            await test_client.get("/settings")
+
+            stats = di.get_memory_stats()
+            assert stats.request_contexts == 0
+            assert stats.deferred_teardowns == 0
+            assert stats.app_values >= 1
+            assert stats.traced_current > 0
+
+        assert di.metrics.total("memory_warnings") == 0
+
+    async def test_app_finalizers_are_checked(self, app):
+        async with self.test_client(app) as test_client:
+            await test_client.get("/resources")
+
+            assert di.get_memory_stats().app_finalizers == 2
+
+        assert di.metrics.get("memory_warnings", "app_finalizers") == 1
+
+    async def test_request_values_are_checked(self, app):
+        async with self.test_client(app) as test_client:
+            requests = [asyncio.ensure_future(test_client.get("/wait")) for _ in range(2)]
+            while di.get_memory_stats().request_contexts < 2:
+                await asyncio.sleep(0.01)
+
+            assert di.get_memory_stats().request_values >= 2 * 3
+            memory.gate[0].set()
+            await asyncio.gather(*requests)
+
+            assert di.get_memory_stats().request_values == 0
+
+        assert di.metrics.get("memory_warnings", "request_values") == 1
+
+    async def test_allocations_are_tracked_by_endpoint(self, app):
+        async with self.test_client(app) as test_client:
+            for _ in range(3):
+                await test_client.get("/allocate")
+            await test_client.get("/settings")
+
+            allocations = di.memory_monitor.allocations
+            assert allocations["base.allocate"].requests == 3
+            assert allocations["base.allocate"].mean >= memory.CHUNK_SIZE
+            assert allocations["base.show_settings"].mean < memory.CHUNK_SIZE
+
+            [top, *_] = di.memory_monitor.top_growth()
+            assert top.traceback[0].filename == memory.__file__
+            assert top.size_diff >= 3 * memory.CHUNK_SIZE
+
+    async def test_growing_request_stack_is_reported(self, app):
+        async with self.test_client(app) as test_client:
+            requests = [asyncio.ensure_future(test_client.get("/wait")) for _ in range(3)]
+            while di.get_memory_stats().request_contexts < 3:
+                await asyncio.sleep(0.01)
+            memory.gate[0].set()
+            await asyncio.gather(*requests)
+
+        assert di.metrics.get("memory_warnings", "request_contexts") == 1
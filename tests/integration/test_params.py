@@ -0,0 +1,41 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps.params import app
+
+
+class TestFusedParams(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    async def test_params_are_extracted(self, app):
+        async with self.test_client(app) as test_client:
+            test_client.set_cookie("localhost", "session", "abc")
+            response = await test_client.get(
+                "/orders/7/items",
+                query_string=dict(page="2", only="name"),
+                headers={"X-Request-Id": "req-1"},
+            )
+            data = await response.get_json()
+
+        assert response.status_code == 200
+        assert data == dict(
+            order_id=7,
+            page=2,
+            per_page=20,
+            fields="name",
+            x_request_id="req-1",
+            session="abc",
+            query=dict(page="2", only="name"),
+        )
+
+    async def test_errors_are_reported_per_source(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get(
+                "/orders/7/items", query_string={"page": "one", "per-page": "ten"}
+            )
+            data = await response.get_json()
+
+        assert response.status_code == 422
+        assert [error["loc"] for error in data["errors"]] == [["page"], ["per-page"]]
@@ -0,0 +1,121 @@
+import asyncio
+
+import pytest
+
+from quart_di import Pool
+from tests.shared.base import IntegrationTestBase
+from tests.apps.pooled import app, Connection, pool
+
+
+class TestPooled(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    async def test_lease_is_reused_and_returned(self, app):
+        async with self.test_client(app) as test_client:
+            assert pool.stats().idle == pool.min_size
+
+            first = await (await test_client.post("/connection")).get_json()
+            second = await (await test_client.post("/connection")).get_json()
+            stats = pool.stats()
+
+        assert first["id"] == second["id"]
+        assert first["same"] is True
+        assert first["in_use"] == 1
+        assert stats.in_use == 0
+        assert stats.size == 1
+        assert stats.acquired >= 2
+
+    async def test_unhealthy_resource_is_discarded(self, app):
+        async with self.test_client(app) as test_client:
+            first = await (await test_client.post("/connection")).get_json()
+            unhealthy = pool._idle[-1][0]
+            unhealthy.healthy = False
+
+            second = await (await test_client.post("/connection")).get_json()
+
+        assert first["id"] != second["id"]
+        assert unhealthy.closed is True
+
+    async def test_acquire_timeout_when_exhausted(self, app):
+        async with self.test_client(app) as test_client:
+            responses = await asyncio.gather(*(test_client.post("/slow") for _ in range(3)))
+            stats = pool.stats()
+
+        assert sorted(response.status_code for response in responses) == [200, 200, 503]
+        assert stats.timeouts >= 1
+        assert stats.size <= pool.max_size
+
+    async def test_pool_closed_after_serving(self, app):
+        async with self.test_client(app) as test_client:
+            await test_client.post("/connection")
+            conn = pool._idle[-1][0]
+
+        assert conn.closed is True
+        assert pool.stats().size == 0
+
+
+class TestPoolReaper:
+    async def test_idle_resources_evicted_without_traffic(self):
+        reaped = Pool(Connection, min_size=1, max_size=3, max_idle=0.01, reap_interval=0.01)
+        await reaped.open()
+        try:
+            first, second = await reaped.acquire(), await reaped.acquire()
+            await reaped.release(first)
+            await reaped.release(second)
+            assert reaped.stats().idle == 2
+
+            await asyncio.sleep(0.1)
+
+            assert reaped.stats().idle == 1
+            assert first.closed is True
+        finally:
+            await reaped.close()
+
+    async def test_refills_to_min_size(self):
+        reaped = Pool(
+            Connection, min_size=2, max_size=3, health_check=Connection.ping, reap_interval=0.01
+        )
+        await reaped.open()
+        try:
+            first = await reaped.acquire()
+            first.healthy = False
+            await reaped.release(first)
+            # the unhealthy connection is discarded on checkout, leaving the pool short
+            second = await reaped.acquire()
+            await reaped.release(second)
+            await reaped.acquire()
+            assert reaped.stats().size == 1
+
+            await asyncio.sleep(0.05)
+
+            assert reaped.stats().size == 2
+            assert reaped.stats().idle == 1
+        finally:
+            await reaped.close()
+
+    async def test_reaper_stopped_on_close(self):
+        reaped = Pool(Connection, min_size=1, reap_interval=0.01)
+        await reaped.open()
+        reaper = reaped._reaper
+
+        await reaped.close()
+
+        assert reaper.done()
+        assert reaped._reaper is None
+
+    async def test_cancelled_acquire_keeps_permits(self):
+        limited = Pool(Connection, max_size=1, acquire_timeout=1)
+        await limited.open()
+        conn = await limited.acquire()
+
+        waiter = asyncio.ensure_future(limited.acquire())
+        await asyncio.sleep(0)
+        waiter.cancel()
+        await limited.release(conn)
+        with pytest.raises(asyncio.CancelledError):
+            await waiter
+
+        assert await asyncio.wait_for(limited.acquire(), 0.5) is not None
+        await limited.close()
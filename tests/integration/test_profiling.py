@@ -0,0 +1,83 @@
+import json
+import pstats
+
+import pytest
+
+from quart_di.profiling import Profiler
+from tests.shared.base import IntegrationTestBase
+from tests.apps.profiled import app, di
+
+
+class TestProfiling(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture
+    def profiler(self, tmp_path, monkeypatch):
+        profiler = Profiler(
+            str(tmp_path), header="X-Profile", token="secret", min_interval=0, metrics=di.metrics
+        )
+        monkeypatch.setattr(di, "profiler", profiler)
+        di.metrics.reset()
+        yield profiler
+        di.metrics.reset()
+
+    async def test_requests_with_the_debug_header_are_profiled(self, app, profiler, tmp_path):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/items?limit=2")
+            assert response.status_code == 200
+            assert not list(tmp_path.iterdir())
+
+            response = await test_client.get("/items?limit=2", headers={"X-Profile": "nope"})
+            assert not list(tmp_path.iterdir())
+
+            response = await test_client.get("/items?limit=2", headers={"X-Profile": "secret"})
+            assert await response.get_json() == dict(items=[0, 1])
+
+        [prof] = tmp_path.glob("*.prof")
+        metadata = json.loads(prof.with_suffix(".json").read_text())
+        assert metadata["endpoint"] == "base.list_items"
+        assert metadata["rule"] == "/items"
+        assert metadata["trigger"] == "header"
+        assert metadata["error"] is None
+        assert metadata["dependencies"]["get_repository"] == {"scope": "request", "cached": True}
+
+        functions = {name for _, _, name in pstats.Stats(str(prof)).stats}
+        assert "get_repository" in functions
+        assert "jsonable_encoder" in functions
+        assert di.metrics.get("profiles_written", "base.list_items", "header") == 1
+
+    async def test_failing_views_are_profiled(self, app, profiler, tmp_path):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/fail", headers={"X-Profile": "secret"})
+            assert response.status_code == 500
+
+        [metadata] = tmp_path.glob("*.json")
+        assert json.loads(metadata.read_text())["error"] == "RuntimeError"
+
+    async def test_sampling_is_rate_limited(self, app, profiler, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler, "sample_rate", 1.0)
+        monkeypatch.setattr(profiler, "min_interval", 60)
+
+        async with self.test_client(app) as test_client:
+            for _ in range(3):
+                await test_client.get("/items")
+
+        assert len(list(tmp_path.glob("*.prof"))) == 1
+        assert di.metrics.get("profiles_skipped", "rate_limited", "sample") == 2
+
+    async def test_disk_usage_is_bounded(self, app, profiler, tmp_path, monkeypatch):
+        monkeypatch.setattr(profiler, "max_files", 2)
+
+        async with self.test_client(app) as test_client:
+            for _ in range(4):
+                await test_client.get("/items", headers={"X-Profile": "secret"})
+
+        assert len(list(tmp_path.glob("*.prof"))) == 2
+        assert len(list(tmp_path.glob("*.json"))) == 2
+
+        monkeypatch.setattr(profiler, "max_bytes", 0)
+        async with self.test_client(app) as test_client:
+            await test_client.get("/items", headers={"X-Profile": "secret"})
+        assert not list(tmp_path.iterdir())
@@ -0,0 +1,44 @@
+import time
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import shutdown
+from tests.apps.shutdown import app, di
+
+
+class TestShutdown(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset(self):
+        shutdown.events.clear()
+        di.metrics.reset()
+        yield
+
+    async def test_independent_finalizers_run_concurrently(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.get("/")
+            assert response.status_code == 200
+            started = time.perf_counter()
+
+        elapsed = time.perf_counter() - started
+
+        # the repository is stopped before the database it uses, alongside the broker, while
+        # the hung watcher is given up on after the finalizer timeout
+        assert shutdown.events.index("repository stopped") < shutdown.events.index(
+            "database closed"
+        )
+        assert sorted(shutdown.events) == [
+            "broker closed",
+            "database closed",
+            "repository stopped",
+        ]
+        assert elapsed < shutdown.DELAY * 3.9
+
+        timings = {timing.name: timing for timing in di.shutdown_timings}
+        assert timings["start_watcher"].duration is None
+        assert di.metrics.get("teardown_errors", "app", "start_watcher") == 1
+        assert di.metrics.total("teardown_errors") == 1
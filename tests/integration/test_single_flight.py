@@ -0,0 +1,48 @@
+import asyncio
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import single_flight
+from tests.apps.single_flight import app
+
+
+class TestSingleFlight(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_calls(self):
+        single_flight.calls.clear()
+        yield
+
+    async def test_concurrent_requests_share_one_execution(self, app):
+        async with self.test_client(app) as test_client:
+            responses = await asyncio.gather(
+                *(
+                    test_client.post("/catalog", query_string=dict(page=page))
+                    for page in [1] * 10 + [2]
+                )
+            )
+            payloads = [await response.get_json() for response in responses]
+
+        assert sorted(single_flight.calls) == [1, 2]
+        assert len({payload["fetch"] for payload in payloads[:10]}) == 1
+        assert [payload["page"] for payload in payloads] == [1] * 10 + [2]
+
+    async def test_sequential_requests_execute_again(self, app):
+        async with self.test_client(app) as test_client:
+            await test_client.post("/catalog", query_string=dict(page=1))
+            await test_client.post("/catalog", query_string=dict(page=1))
+
+        assert single_flight.calls == [1, 1]
+
+    async def test_exceptions_propagate_to_every_caller(self, app):
+        async with self.test_client(app) as test_client:
+            responses = await asyncio.gather(
+                *(test_client.post("/catalog", query_string=dict(page=-1)) for _ in range(3))
+            )
+
+        assert [response.status_code for response in responses] == [500] * 3
+        assert single_flight.calls == [-1]
@@ -0,0 +1,41 @@
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps.trusted import app, di
+
+
+class TestTrusted(IntegrationTestBase):
+    user = dict(id="1", name="joe")
+
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_metrics(self):
+        di.metrics.reset()
+        yield
+
+    async def test_untrusted_route_validates(self, app):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post("/users?limit=5", json=self.user)
+            data = await response.get_json()
+
+        assert data == dict(user=dict(id=1, name="joe"), limit=5, limit_type="int")
+        assert di.metrics.total("validation_skipped") == 0
+
+    @pytest.mark.parametrize(
+        "path, endpoint",
+        [
+            ("/internal/users", "public.internal.sync_user"),
+            ("/users/trusted", "public.create_trusted_user"),
+        ],
+    )
+    async def test_trusted_route_skips_validation(self, app, path, endpoint):
+        async with self.test_client(app) as test_client:
+            response = await test_client.post(f"{path}?limit=5", json=self.user)
+            data = await response.get_json()
+
+        assert data == dict(user=dict(id="1", name="joe"), limit="5", limit_type="str")
+        assert di.metrics.get("validation_skipped", endpoint, "JsonBody") == 1
+        assert di.metrics.get("validation_skipped", endpoint, "FusedParams") == 1
@@ -0,0 +1,54 @@
+import asyncio
+import time
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import warmup
+from tests.apps.warmup import app, di
+
+
+class TestWarmUp(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset(self, monkeypatch):
+        warmup.events.clear()
+        yield
+
+    async def test_app_dependants_are_built_concurrently_at_startup(self, app):
+        started = time.perf_counter()
+        async with self.test_client(app) as test_client:
+            elapsed = time.perf_counter() - started
+            assert sorted(warmup.events) == ["cache", "mailer", "search"]
+            # cache and search are built together, mailer once cache is ready
+            assert elapsed < warmup.DELAY * 2.9
+
+            search = await (await test_client.get("/search")).get_json()
+            mail = await (await test_client.get("/mail")).get_json()
+            again = await (await test_client.get("/search")).get_json()
+
+        assert search == again
+        assert mail["cache"] == search["cache"]
+        assert sorted(warmup.events) == ["cache", "mailer", "search"]
+        assert sorted(timing.name for timing in di.warm_up_timings) == [
+            "connect_cache",
+            "connect_mailer",
+            "connect_search",
+        ]
+        assert all(timing.duration >= warmup.DELAY for timing in di.warm_up_timings)
+
+    async def test_warm_up_timeout(self, app, monkeypatch):
+        monkeypatch.setattr(di, "warm_up_timeout", warmup.DELAY / 2)
+
+        async with self.test_client(app) as test_client:
+            assert sorted(warmup.events) == ["cache", "search"]
+            timings = {timing.name: timing for timing in di.warm_up_timings}
+            assert isinstance(timings["connect_cache"].error, asyncio.TimeoutError)
+
+            # whatever timed out is built on first use
+            response = await test_client.get("/mail")
+            assert response.status_code == 200
+            assert sorted(warmup.events) == ["cache", "cache", "mailer", "search"]
@@ -0,0 +1,65 @@
+import asyncio
+import json
+
+import pytest
+
+from tests.shared.base import IntegrationTestBase
+from tests.apps import websocket
+from tests.apps.websocket import app
+
+
+class TestWebsocket(IntegrationTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_events(self):
+        websocket.events.clear()
+        yield
+
+    async def test_connection_and_message_scopes(self, app):
+        async with self.test_client(app) as test_client:
+            async with test_client.websocket("/ws?room=lobby") as ws:
+                await ws.send(json.dumps(dict(text="hi")))
+                first = json.loads(await ws.receive())
+                await ws.send("ignore")
+                await ws.send(json.dumps(dict(text="bye")))
+                second = json.loads(await ws.receive())
+
+            # let the handler's cancellation tear the connection scope down
+            await asyncio.sleep(0.05)
+
+        session = first["session"]
+        assert first["echo"] == dict(text="hi") and first["room"] == "lobby"
+        assert second["echo"] == dict(text="bye") and second["session"] == session
+        assert second["unit"] == first["unit"] + 2
+
+        unit = first["unit"]
+        assert websocket.events[:2] == [
+            f"session {session} opened",
+            f"connected to session {session}",
+        ]
+        assert websocket.events[2:8] == [
+            f"unit {unit} started",
+            f"unit {unit} finished",
+            f"unit {unit + 1} started",
+            f"unit {unit + 1} finished",
+            f"unit {unit + 2} started",
+            f"unit {unit + 2} finished",
+        ]
+        assert websocket.events[-1] == f"session {session} closed"
+
+    async def test_lazy_dependencies_resolve_in_the_connection_scope(self, app):
+        async with self.test_client(app) as test_client:
+            async with test_client.websocket("/ws/lazy?room=lobby") as ws:
+                await ws.send(json.dumps(dict(text="hi")))
+                data = json.loads(await asyncio.wait_for(ws.receive(), 5))
+
+            await asyncio.sleep(0.05)
+
+        assert data == dict(echo=dict(text="hi"), session=data["session"], room="lobby")
+        assert websocket.events == [
+            f"session {data['session']} opened",
+            f"session {data['session']} closed",
+        ]
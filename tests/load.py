@@ -0,0 +1,263 @@
+"""An in-process load generator for the apps in `tests/apps`.
+
+Requests are sent straight to the ASGI app, without sockets or the test client, so the figures
+are the app's own: routing, the request and app scope push/pop, solving and executing the
+dependency graph and encoding the result.
+
+    python -m tests.load --requests 2000 --concurrency 16
+    python -m tests.load --scenario injected --scenario plain
+"""
+import argparse
+import asyncio
+import json
+import logging
+import time
+from typing import Any
+from typing import Callable
+from typing import Dict
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlencode
+
+from quart_di.timing import percentile
+
+from tests.shared import extension as extension_data
+
+
+class Scenario(NamedTuple):
+    name: str
+    # a callable returning the app, so apps are only imported when their scenarios run
+    get_app: Callable[[], Any]
+    method: str
+    path: str
+    headers: Dict[str, str] = {}
+    query_string: Dict[str, Any] = {}
+    json: Optional[Any] = None
+
+
+class LoadResult(NamedTuple):
+    name: str
+    requests: int
+    errors: int
+    elapsed: float
+    p50: float
+    p95: float
+    p99: float
+
+    @property
+    def throughput(self) -> float:
+        return self.requests / self.elapsed if self.elapsed else 0.0
+
+
+def _kitchen_sink_app():
+    from tests.apps.example import app
+
+    return app
+
+
+def _override_app():
+    from tests.apps.override import app
+
+    return app
+
+
+def _secured_app():
+    from tests.apps.secured import app
+
+    return app
+
+
+def _overhead_app():
+    from tests.apps.overhead import app
+
+    return app
+
+
+SCENARIOS = [
+    Scenario(
+        "kitchen-sink",
+        _kitchen_sink_app,
+        "POST",
+        extension_data.kitchen_sink_urls[0].format(user_id=extension_data.user_id),
+        headers=extension_data.kitchen_sink_request["headers"],
+        query_string=extension_data.kitchen_sink_request["query_string"],
+        json=extension_data.kitchen_sink_request["json"],
+    ),
+    Scenario("override-app", _override_app, "POST", "/app"),
+    Scenario("override-request", _override_app, "POST", "/request"),
+    Scenario("secured", _secured_app, "POST", "/secured", headers={"x-public-api-key": "12345"}),
+    Scenario(
+        "plain",
+        _overhead_app,
+        "GET",
+        "/plain",
+        headers={"x-tenant": "acme"},
+        query_string={"limit": 10, "offset": 5},
+    ),
+    Scenario(
+        "injected",
+        _overhead_app,
+        "GET",
+        "/injected",
+        headers={"x-tenant": "acme"},
+        query_string={"limit": 10, "offset": 5},
+    ),
+]
+
+# pairs of scenarios running the same handler without and with `inject`
+COMPARISONS = [("plain", "injected")]
+
+
+def _build_request(scenario: Scenario) -> Tuple[Dict[str, Any], bytes]:
+    body = b""
+    headers = [(name.lower().encode(), value.encode()) for name, value in scenario.headers.items()]
+    if scenario.json is not None:
+        body = json.dumps(scenario.json).encode()
+        headers.append((b"content-type", b"application/json"))
+    headers.append((b"content-length", str(len(body)).encode()))
+    headers.append((b"host", b"localhost"))
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": scenario.method,
+        "scheme": "http",
+        "path": scenario.path,
+        "raw_path": scenario.path.encode(),
+        "query_string": urlencode(scenario.query_string).encode(),
+        "root_path": "",
+        "headers": headers,
+        "client": ("127.0.0.1", 50000),
+        "server": ("localhost", 80),
+        "extensions": {},
+    }
+    return scope, body
+
+
+async def _send_request(app: Any, scope: Dict[str, Any], body: bytes) -> int:
+    sent = False
+    done = asyncio.Event()
+    status = 0
+
+    async def receive() -> Dict[str, Any]:
+        nonlocal sent
+        if not sent:
+            sent = True
+            return {"type": "http.request", "body": body, "more_body": False}
+        # the app waits for a disconnect while it handles the request
+        await done.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Dict[str, Any]) -> None:
+        nonlocal status
+        if message["type"] == "http.response.start":
+            status = message["status"]
+        elif message["type"] == "http.response.body" and not message.get("more_body", False):
+            done.set()
+
+    try:
+        await app(dict(scope), receive, send)
+    finally:
+        done.set()
+    return status
+
+
+async def run_scenario(
+    scenario: Scenario, requests: int = 1000, concurrency: int = 10, warmup: int = 50
+) -> LoadResult:
+    """Send `requests` requests to the scenario's app, at most `concurrency` at a time."""
+    app = scenario.get_app()
+    scope, body = _build_request(scenario)
+    latencies: List[float] = []
+    errors = 0
+
+    async with app.test_app():
+        for _ in range(warmup):
+            await _send_request(app, scope, body)
+
+        remaining = requests
+
+        async def worker() -> None:
+            nonlocal remaining, errors
+            while remaining > 0:
+                remaining -= 1
+                started = time.perf_counter()
+                status = await _send_request(app, scope, body)
+                latencies.append(time.perf_counter() - started)
+                if not 200 <= status < 400:
+                    errors += 1
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    return LoadResult(
+        scenario.name,
+        len(latencies),
+        errors,
+        elapsed,
+        percentile(latencies, 50),
+        percentile(latencies, 95),
+        percentile(latencies, 99),
+    )
+
+
+def format_results(results: List[LoadResult]) -> str:
+    lines = [
+        f"{'scenario':<20} {'requests':>9} {'errors':>7} {'req/s':>10} "
+        f"{'p50 ms':>8} {'p95 ms':>8} {'p99 ms':>8}"
+    ]
+    for result in results:
+        lines.append(
+            f"{result.name:<20} {result.requests:>9} {result.errors:>7} "
+            f"{result.throughput:>10.1f} {result.p50 * 1000:>8.3f} "
+            f"{result.p95 * 1000:>8.3f} {result.p99 * 1000:>8.3f}"
+        )
+
+    by_name = {result.name: result for result in results}
+    for baseline, injected in COMPARISONS:
+        if baseline in by_name and injected in by_name:
+            base, inj = by_name[baseline], by_name[injected]
+            lines.append(
+                f"inject overhead ({injected} vs {baseline}): "
+                f"p50 {(inj.p50 - base.p50) * 1000:+.3f}ms, "
+                f"p99 {(inj.p99 - base.p99) * 1000:+.3f}ms, "
+                f"throughput {(inj.throughput / base.throughput - 1) * 100:+.1f}%"
+            )
+    return "\n".join(lines)
+
+
+async def run(
+    names: Optional[List[str]] = None, requests: int = 1000, concurrency: int = 10, warmup: int = 50
+) -> List[LoadResult]:
+    scenarios = [scenario for scenario in SCENARIOS if not names or scenario.name in names]
+    return [await run_scenario(scenario, requests, concurrency, warmup) for scenario in scenarios]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", "-n", type=int, default=1000)
+    parser.add_argument("--concurrency", "-c", type=int, default=10)
+    parser.add_argument("--warmup", type=int, default=50)
+    parser.add_argument(
+        "--scenario",
+        "-s",
+        action="append",
+        choices=[scenario.name for scenario in SCENARIOS],
+        help="Run this scenario, can be repeated, all of them by default.",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true", help="Keep info logs.")
+    args = parser.parse_args(argv)
+
+    if not args.verbose:
+        # logging every injection would dominate the timings
+        logging.disable(logging.INFO)
+    results = asyncio.run(run(args.scenario, args.requests, args.concurrency, args.warmup))
+    print(format_results(results))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,43 @@
+import inspect
+
+from quart_di import FromHeader, FromPath, FromQuery, Json
+from quart_di.fusion import FUSED_PARAMS_ATTRIBUTE, fuse_params
+
+
+async def view(
+    item_id: FromPath[int],
+    page: FromQuery[int],
+    per_page: FromQuery[int],
+    x_one: FromHeader[str],
+    x_two: FromHeader[str],
+    query: FromQuery,
+    body: Json[dict],
+):
+    return locals()
+
+
+class TestFuseParams:
+    def test_one_param_per_source(self):
+        fused = fuse_params(view)
+        params = inspect.signature(fused).parameters
+
+        assert list(params) == [
+            "query",
+            "body",
+            "__quart_di_path__",
+            "__quart_di_query__",
+            "__quart_di_headers__",
+        ]
+        assert getattr(fused, FUSED_PARAMS_ATTRIBUTE) == {
+            "item_id",
+            "page",
+            "per_page",
+            "x_one",
+            "x_two",
+        }
+
+    def test_views_without_simple_params_are_unchanged(self):
+        async def other(query: FromQuery, body: Json[dict]):
+            ...
+
+        assert fuse_params(other) is other
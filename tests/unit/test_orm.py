@@ -0,0 +1,194 @@
+import datetime
+from typing import List
+from typing import Optional
+
+import pytest
+from sqlalchemy import Column
+from sqlalchemy import create_engine
+from sqlalchemy import DateTime
+from sqlalchemy import event
+from sqlalchemy import ForeignKey
+from sqlalchemy import Integer
+from sqlalchemy import select
+from sqlalchemy import String
+from sqlalchemy import Table
+from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import deferred
+from sqlalchemy.orm import registry
+from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session
+from sqlmodel import Field
+from sqlmodel import SQLModel
+
+from quart_di.orm import get_mapped_attributes
+from quart_di.util import jsonable_encoder
+
+
+Base = declarative_base()
+
+
+class Team(Base):
+    __tablename__ = "orm_team"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    heroes = relationship("Hero", back_populates="team")
+
+
+class Hero(Base):
+    __tablename__ = "orm_hero"
+
+    id = Column(Integer, primary_key=True)
+    name = Column(String)
+    bio = deferred(Column(String))
+    created = Column(DateTime)
+    team_id = Column(ForeignKey("orm_team.id"))
+    team = relationship(Team, back_populates="heroes")
+
+
+class Villain(SQLModel, table=True):
+    __tablename__ = "orm_villain"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    name: str
+    lair: Optional[str] = None
+
+
+class Henchman(SQLModel, table=True):
+    __tablename__ = "orm_henchman"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    full_name: str = Field(alias="fullName")
+
+
+created = datetime.datetime(2022, 5, 1, 12, 30)
+
+
+@pytest.fixture
+def engine():
+    engine = create_engine("sqlite://", future=True)
+    Base.metadata.create_all(engine)
+    Villain.__table__.create(engine)
+    Henchman.__table__.create(engine)
+
+    with Session(engine) as session:
+        team = Team(name="avengers")
+        session.add_all(
+            [
+                Hero(name=f"hero-{index}", bio="...", created=created, team=team)
+                for index in range(3)
+            ]
+        )
+        session.add(Villain(name="thanos"))
+        session.add(Henchman(fullName="ebony maw"))
+        session.commit()
+    return engine
+
+
+@pytest.fixture
+def statements(engine) -> List[str]:
+    statements = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def record(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    return statements
+
+
+class TestMappedAttributes:
+    def test_columns_and_relationships(self):
+        attributes = get_mapped_attributes(Hero)
+
+        assert set(attributes.columns) == {"id", "name", "bio", "created", "team_id"}
+        assert attributes.relationships == ("team",)
+        assert get_mapped_attributes(Hero) is attributes
+
+    def test_unmapped_classes(self):
+        assert get_mapped_attributes(dict) is None
+        assert get_mapped_attributes(SQLModel) is None
+
+    def test_classes_mapped_later(self):
+        class Minion:
+            pass
+
+        assert get_mapped_attributes(Minion) is None
+
+        mapper_registry = registry()
+        table = Table(
+            "orm_minion", mapper_registry.metadata, Column("id", Integer, primary_key=True)
+        )
+        mapper_registry.map_imperatively(Minion, table)
+
+        assert get_mapped_attributes(Minion).columns == ("id",)
+
+
+class TestEncodeMapped:
+    def test_encodes_loaded_columns_without_loading(self, engine, statements):
+        with Session(engine) as session:
+            heroes = session.execute(select(Hero).order_by(Hero.id)).scalars().all()
+            statements.clear()
+
+            data = jsonable_encoder(heroes)
+
+        # bio is deferred and team isn't loaded, neither is loaded to encode them
+        assert statements == []
+        assert data == [
+            dict(id=index + 1, name=f"hero-{index}", created=created.isoformat(), team_id=1)
+            for index in range(3)
+        ]
+
+    def test_encodes_loaded_relationships(self, engine):
+        with Session(engine) as session:
+            hero = session.get(Hero, 1)
+            hero.team
+
+            data = jsonable_encoder(hero, exclude={"created"})
+
+        assert data == dict(id=1, name="hero-0", team_id=1, team=dict(id=1, name="avengers"))
+
+    def test_expired_instances(self, engine, statements):
+        with Session(engine) as session:
+            hero = session.get(Hero, 1)
+            session.expire(hero)
+            statements.clear()
+
+            assert jsonable_encoder(hero) == {}
+            assert statements == []
+
+    def test_sqlmodel(self, engine):
+        with Session(engine) as session:
+            villain = session.get(Villain, 1)
+
+            assert jsonable_encoder(villain) == dict(id=1, name="thanos", lair=None)
+            assert jsonable_encoder(villain, exclude_none=True) == dict(id=1, name="thanos")
+            assert jsonable_encoder(villain, include={"name"}) == dict(name="thanos")
+
+    def test_sqlmodel_aliases(self, engine):
+        with Session(engine) as session:
+            henchman = session.get(Henchman, 1)
+
+            assert jsonable_encoder(henchman) == dict(id=1, fullName="ebony maw")
+            assert jsonable_encoder(henchman, by_alias=False) == dict(id=1, full_name="ebony maw")
+            assert jsonable_encoder(henchman, include={"full_name"}) == dict(fullName="ebony maw")
+
+
+class TestEncodeRow:
+    def test_columns(self, engine):
+        with Session(engine) as session:
+            rows = session.execute(select(Hero.id, Hero.created).order_by(Hero.id)).all()
+
+        assert jsonable_encoder(rows) == [
+            dict(id=index + 1, created=created.isoformat()) for index in range(3)
+        ]
+
+    def test_entities(self, engine):
+        with Session(engine) as session:
+            row = session.execute(
+                select(Hero, Team).join(Hero.team).where(Hero.id == 1)
+            ).one()
+
+            data = jsonable_encoder(row)
+
+        assert data["Team"] == dict(id=1, name="avengers")
+        assert data["Hero"]["name"] == "hero-0"
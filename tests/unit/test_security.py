@@ -0,0 +1,103 @@
+import time
+from typing import Optional
+
+import anyio
+import pytest
+from quart import request
+from werkzeug.exceptions import Unauthorized
+
+from quart_di.security import (
+    APIKeyHeader,
+    AlternativeSecuritySchemes,
+    RequiredSecuritySchemes,
+)
+
+from tests.shared.base import UnitTestBase
+from tests.apps.secured import app
+
+
+DELAY = 0.2
+
+
+class SlowAPIKey(APIKeyHeader):
+    unauthorized_error = None
+    name = "x-slow-api-key"
+    finished = []
+
+    @classmethod
+    async def extract(cls, request):
+        await anyio.sleep(DELAY)
+        cls.finished.append(cls)
+        return await super().extract(request)
+
+
+class FastAPIKey(APIKeyHeader):
+    name = "x-fast-api-key"
+
+
+class SlowAPIKeyTwo(SlowAPIKey):
+    name = "x-slow-api-key-two"
+
+
+class RequiredKeys(RequiredSecuritySchemes):
+    fast: Optional[FastAPIKey]
+    slow: Optional[SlowAPIKey]
+
+
+class ConcurrentKeys(AlternativeSecuritySchemes):
+    slow: Optional[SlowAPIKey]
+    slow_two: Optional[SlowAPIKeyTwo]
+
+
+class FirstCompletedKeys(AlternativeSecuritySchemes):
+    first_completed = True
+
+    slow: Optional[SlowAPIKey]
+    fast: Optional[FastAPIKey]
+
+
+class TestSecuritySchemes(UnitTestBase):
+    @pytest.fixture
+    def _app(self):
+        return app
+
+    @pytest.fixture(autouse=True)
+    def reset_finished(self):
+        SlowAPIKey.finished.clear()
+        yield
+
+    async def test_alternative_schemes_run_concurrently(self, app):
+        headers = {"x-slow-api-key": "one", "x-slow-api-key-two": "two"}
+
+        async with self.test_contexts(app, path="/secured", headers=headers):
+            started = time.monotonic()
+            auth = await ConcurrentKeys.extract(request)
+            elapsed = time.monotonic() - started
+
+        assert auth.slow.api_key == "one"
+        assert auth.slow_two.api_key == "two"
+        assert elapsed < DELAY * 2
+
+    async def test_alternative_schemes_first_completed(self, app):
+        headers = {"x-slow-api-key": "one", "x-fast-api-key": "two"}
+
+        async with self.test_contexts(app, path="/secured", headers=headers):
+            auth = await FirstCompletedKeys.extract(request)
+
+        assert auth.fast.api_key == "two"
+        assert auth.slow is None
+        assert SlowAPIKey.finished == []
+
+    async def test_alternative_schemes_raise_when_none_succeed(self, app):
+        async with self.test_contexts(app, path="/secured"):
+            with pytest.raises(Unauthorized):
+                await FirstCompletedKeys.extract(request)
+
+    async def test_required_schemes_cancel_on_first_failure(self, app):
+        headers = {"x-slow-api-key": "one"}
+
+        async with self.test_contexts(app, path="/secured", headers=headers):
+            with pytest.raises(Unauthorized):
+                await RequiredKeys.extract(request)
+
+        assert SlowAPIKey.finished == []
@@ -0,0 +1,71 @@
+import asyncio
+
+import pytest
+
+from quart_di.cache import SingleFlightGroup
+
+
+class TestSingleFlightGroup:
+    async def test_cancelling_one_caller_keeps_flight_running(self):
+        group = SingleFlightGroup()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        first = asyncio.ensure_future(group.do("key", fetch))
+        second = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        assert await second == "value"
+        assert first.cancelled()
+        assert calls == [1]
+        assert len(group) == 0
+
+    async def test_cancelling_every_caller_cancels_flight(self):
+        group = SingleFlightGroup()
+        finished = []
+
+        async def fetch():
+            await asyncio.sleep(0.05)
+            finished.append(1)
+
+        callers = [asyncio.ensure_future(group.do("key", fetch)) for _ in range(2)]
+        await asyncio.sleep(0)
+        for caller in callers:
+            caller.cancel()
+
+        await asyncio.sleep(0.1)
+        assert finished == []
+        assert len(group) == 0
+
+    async def test_cancelled_flight_propagates_to_callers(self):
+        group = SingleFlightGroup()
+
+        async def fetch():
+            raise asyncio.CancelledError()
+
+        with pytest.raises(asyncio.CancelledError):
+            await group.do("key", fetch)
+
+    async def test_call_after_last_caller_cancelled_starts_new_flight(self):
+        group = SingleFlightGroup()
+        calls = []
+
+        async def fetch():
+            calls.append(1)
+            await asyncio.sleep(0.05)
+            return "value"
+
+        caller = asyncio.ensure_future(group.do("key", fetch))
+        await asyncio.sleep(0)
+        caller.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await caller
+
+        assert await group.do("key", fetch) == "value"
+        assert calls == [1, 1]
+        assert len(group) == 0